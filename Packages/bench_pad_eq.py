@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+from subprocess import run
+from sys import executable
+from textwrap import dedent
+from timeit import repeat
+
+from numpy import allclose
+from numpy.random import default_rng
+
+from padtools import TargetHeliumPad, TargetNeonPad
+from padtools import analytic_helium, solve_helium_eq, solve_neon_eq
+from padtools._generated import helium as generated_helium
+
+
+def per_call(f, number: int = 1000) -> float:
+    """Best time per call in microseconds"""
+    return min(repeat(f, number=number, repeat=5)) / number * 1e6
+
+
+def import_time(*stmts: str) -> list:
+    """Seconds taken by each statement, run one after another in a fresh interpreter"""
+    code = dedent("""\
+        from time import perf_counter
+        for stmt in {!r}:
+            start = perf_counter()
+            exec(stmt)
+            print(perf_counter() - start)
+    """).format(stmts)
+    called = run([executable, '-c', code], capture_output=True, check=True, text=True)
+    return [float(line) for line in called.stdout.split()[-len(stmts):]]
+
+
+# %%
+stmts = (
+    "import padtools",
+    "from padtools import TargetHeliumPad",
+    "from padtools import TargetNeonPad",
+    "import sympy",
+)
+print('Import time (see also "python -X importtime")...')
+for stmt, sec in zip(stmts, import_time(*stmts)):
+    print("{:38s}{:>10.1f} ms".format(stmt + ":", sec * 1e3))
+print()
+
+# %%
+rng = default_rng(0)
+print('Checking the closed-form helium model against SymPy...')
+for _ in range(100):
+    x = rng.normal(size=len(TargetHeliumPad.XKEYS))
+    assert allclose(analytic_helium.ymat(*x), solve_helium_eq.ymat_lambdified(*x), rtol=1e-10, atol=1e-12)
+    assert allclose(analytic_helium.yjacmat(*x), solve_helium_eq.yjacmat_lambdified(*x), rtol=1e-10, atol=1e-12)
+x = rng.normal(size=(len(TargetHeliumPad.XKEYS), 1000))
+assert allclose(analytic_helium.ymat(*x), generated_helium.ymat_vectorized(*x), rtol=1e-10, atol=1e-12)
+assert allclose(analytic_helium.yjacmat(*x), generated_helium.yjacmat_vectorized(*x), rtol=1e-10, atol=1e-12)
+print('ok')
+print()
+
+x = rng.normal(size=len(TargetHeliumPad.XKEYS))
+print('Target TargetHeliumPad, single evaluation...')
+for key, f in (("ymat (generated):", generated_helium.ymat),
+               ("ymat (closed form):", analytic_helium.ymat),
+               ("ymat + yjacmat (generated):", generated_helium.yfused),
+               ("ymat + yjacmat (closed form):", analytic_helium.yfused)):
+    print("{:32s}{:>10.1f} us".format(key, per_call(lambda: f(*x))))
+print()
+
+# %%
+for target, solved in ((TargetHeliumPad, solve_helium_eq), (TargetNeonPad, solve_neon_eq)):
+    print('Target {}...'.format(target.__name__))
+    x = rng.normal(size=len(target.XKEYS))
+
+    separate = per_call(lambda: (solved.ymat_lambdified(*x), solved.yjacmat_lambdified(*x)))
+    fused = per_call(lambda: target.YFUSED(*x))
+    print("{:32s}{:>10.1f} us".format("ymat + yjacmat (lambdify):", separate))
+    print("{:32s}{:>10.1f} us".format("ymat + yjacmat (YFUSED):", fused))
+    print("{:32s}{:>10.1f} x".format("speedup:", separate / fused))
+    print()
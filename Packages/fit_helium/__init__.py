@@ -2,4 +2,4 @@ from .solve import *
 from .optimize import *
 from .fit import *
 
-__all__ = ["ymat_pretty", "fit"]
+__all__ = ["ymat_pretty", "reference_at", "fit", "fit_many"]
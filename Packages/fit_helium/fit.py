@@ -1,27 +1,59 @@
 from math import inf, pi
 from typing import Optional
 from collections import OrderedDict
+from functools import lru_cache
 
 from importlib_resources import path
-from pandas import read_excel
+from pandas import DataFrame
+from scipy.interpolate import PchipInterpolator
 from scipy.optimize import least_squares, OptimizeResult
 from scipy.linalg import svd
-from numpy import sign, array, ndarray, diag, finfo
+from scipy.sparse import csr_matrix
+from numpy import (sign, array, ndarray, diag, finfo, asarray, unwrap, isnan, sqrt, cos, stack, zeros, ones, where,
+                   arange, broadcast_arrays, tile, repeat, triu_indices, full)
 from numpy.linalg import pinv
 
+from padtools.datasets import first, load_excel
+
 from . import res
 from .solve import ymat_lambdified, jmat_lambdified, ymat_pretty
 
 
-__all__ = ["fit"]
+__all__ = ["reference_at", "fit", "fit_many"]
+
+
+XREF_KEYS = ["coeff_s", "coeff_p", "coeff_d", "eta_s", "eta_p", "eta_d"]
+YKEYS = ["beta1m3_amp", "beta1m3_shift", "beta2", "beta3_amp", "beta3_shift", "beta4"]
+XKEYS = ["phi0", "r", "h"]
+
 
+@lru_cache()
+def simulated() -> DataFrame:
+    with path(res, "simulated.xlsx") as pth:
+        return load_excel(pth, rename=first).set_index('photon')
 
-def first(key: str) -> str:
-    return key.split()[0]
 
+@lru_cache()
+def reference_interpolator() -> PchipInterpolator:
+    df = simulated().sort_index()
+    values = df[XREF_KEYS].values
+    values[:, 3:] = unwrap(values[:, 3:], axis=0)  # phases
+    return PchipInterpolator(df.index.values, values, axis=0, extrapolate=False)
 
-with path(res, "simulated.xlsx") as pth:
-    df = read_excel(pth).rename(first, axis='columns').set_index('photon')
+
+def reference_at(photons: ndarray) -> OrderedDict:
+    """
+    Simulated helium partial waves at photon energies, interpolated between the tabulated ones
+    with monotone cubic splines. Tabulated photon energies give the tabulated values
+    :param photons: Photon energies in eV
+    :return: Arrays of coeff_s, coeff_p, coeff_d, eta_s, eta_p and eta_d, each shaped as photons
+    """
+    photons = asarray(photons, dtype=float)
+    interpolated = reference_interpolator()(photons)  # shape: (*photons.shape, 6)
+    if isnan(interpolated).any():
+        fr, to = reference_interpolator().x[[0, -1]]
+        raise ValueError("Photon energies have to be in the simulated range [{}, {}] eV!".format(fr, to))
+    return OrderedDict((k, interpolated[..., i]) for i, k in enumerate(XREF_KEYS))
 
 
 def fit(photon: float, beta1m3_amp: float, beta1m3_shift: float, beta2: float,
@@ -35,7 +67,7 @@ def fit(photon: float, beta1m3_amp: float, beta1m3_shift: float, beta2: float,
         **kwargs) -> OrderedDict:
     """
     Fit helium beta parameters
-    :param photon: Photon energy in eV
+    :param photon: Photon energy in eV; the simulated reference is interpolated to it, see function reference_at
     :param beta1m3_amp:
     :param beta1m3_amp_err:
     :param beta1m3_shift: In radians
@@ -51,7 +83,7 @@ def fit(photon: float, beta1m3_amp: float, beta1m3_shift: float, beta2: float,
     :param kwargs: Keyword arguments which pass to function scipy.optimize.least_squares
     :return:
     """
-    xref = {k: v for k, v in df.loc[photon].items() if k.startswith("coeff_") or k.startswith("eta_")}
+    xref = {k: float(v) for k, v in reference_at(photon).items()}
     yref = ymat_pretty(**xref)
 
     if beta1m3_amp * yref["beta1m3_amp"] < 0:
@@ -139,3 +171,127 @@ def fit(photon: float, beta1m3_amp: float, beta1m3_shift: float, beta2: float,
         ("fx", ymat_pretty(**xref, **xopt)),
         ("report", ret),
     ])
+
+
+def model_vectorized(xref: dict, phi0: ndarray, r: ndarray, h: ndarray) -> (ndarray, ndarray):
+    """
+    Same as solve.ymat_lambdified and the last 3 columns of solve.jmat_lambdified, for arrays
+    :param xref: Arrays of coeff_s, coeff_p, coeff_d, eta_s, eta_p and eta_d; see function reference_at
+    :param phi0: Phase offsets in radians
+    :param r: Intensity scale factors
+    :param h: Beta amplitude scale factors
+    :return: Beta parameters, shape: (..., 6), and their derivatives by phi0, r and h, shape: (..., 6, 3)
+    """
+    cs, cp, cd = xref["coeff_s"], xref["coeff_p"], xref["coeff_d"]
+    es, ep, ed = xref["eta_s"], xref["eta_p"], xref["eta_d"]
+    rcp2 = (r * cp) ** 2
+    s = cs ** 2 + rcp2 + cd ** 2
+    ds = 2 * r * cp ** 2  # dS/dr
+    n2 = 10 * cd ** 2 + 14 * sqrt(5) * cd * cs * cos(ed - es) + 14 * rcp2
+    c1, c3 = 2 * sqrt(3) * cp * cs, 6 * sqrt(15) * cd * cp / 5
+    y = stacked(
+        c1 * r * h / s,
+        es - ep + phi0,
+        n2 / (7 * s),
+        c3 * r * h / s,
+        ed - ep + phi0,
+        18 * cd ** 2 / (7 * s),
+    )
+    zero, one = zeros(y.shape[:-1]), ones(y.shape[:-1])
+    dr = (s - r * ds) / s ** 2
+    jac = stack([
+        stacked(zero, c1 * h * dr, c1 * r / s),
+        stacked(one, zero, zero),
+        stacked(zero, (28 * r * cp ** 2 * s - n2 * ds) / (7 * s ** 2), zero),
+        stacked(zero, c3 * h * dr, c3 * r / s),
+        stacked(one, zero, zero),
+        stacked(zero, -18 * cd ** 2 * ds / (7 * s ** 2), zero),
+    ], axis=-2)
+    return y, jac
+
+
+def stacked(*arrays) -> ndarray:
+    return stack(broadcast_arrays(*(asarray(a, dtype=float) for a in arrays)), axis=-1)
+
+
+def fit_many(table: DataFrame, **kwargs) -> DataFrame:
+    """
+    Fit helium beta parameters at many photon energies at once. Every energy is an independent problem of
+    phi0, r and h, same as function fit, but all of them are solved as one block-diagonal least-squares problem
+    :param table: Columns photon, beta1m3_amp, beta1m3_shift, beta2, beta3_amp, beta3_shift and beta4, and
+        optionally their errors beta1m3_amp_err, ..., beta4_err
+    :param kwargs: Keyword arguments which pass to function scipy.optimize.least_squares
+    :return: Fitted phi0, r and h, their errors and covariances, and the fitted beta parameters, indexed as table.
+        Column cost is of every energy, and so is column success, which is True where the batch stopped by its own
+        tolerances and the energy has converged on its own, by either ftol or gtol. Column nfev is of the batch
+    """
+    n = len(table)
+    xref = reference_at(table["photon"].values)
+    y = table[YKEYS].values.astype(float)  # shape: (n,6)
+    yref, _ = model_vectorized(xref, 0, 1, 1)
+    for amp, shift in (("beta1m3_amp", "beta1m3_shift"), ("beta3_amp", "beta3_shift")):
+        i, j = YKEYS.index(amp), YKEYS.index(shift)
+        flipped = y[:, i] * yref[:, i] < 0
+        if flipped.any():
+            print("Sign of {} does not match with the reference at {} eV. Force to flip the sign"
+                  .format(amp, table["photon"].values[flipped].tolist()))
+        y[:, i] = where(flipped, -y[:, i], y[:, i])
+        y[:, j] = where(flipped, y[:, j] + pi, y[:, j])
+
+    errkeys = ["{}_err".format(k) for k in YKEYS]
+    if all(k in table for k in errkeys) and not table[errkeys].isna().any(axis=None):
+        yerr = table[errkeys].values.astype(float)
+    else:
+        print("Error parameters is not passed. Ignore weights")
+        yerr = ones(y.shape)
+    is_shift = array([k.endswith("_shift") for k in YKEYS])
+
+    # block (i, 6 rows, 3 columns) of the jacobian is at rows 6i..6i+5 and columns 3i..3i+2
+    rows = tile(repeat(arange(6), 3), n) + repeat(arange(n) * 6, 18)
+    cols = tile(tile(arange(3), 6), n) + repeat(arange(n) * 3, 18)
+
+    def res(x) -> ndarray:
+        phi0, r, h = x.reshape(n, 3).T
+        fx, _ = model_vectorized(xref, phi0, r, h)
+        diff = y - fx
+        return (where(is_shift, (diff + pi) % (2 * pi) - pi, diff) / yerr).ravel()
+
+    def jac(x) -> csr_matrix:
+        phi0, r, h = x.reshape(n, 3).T
+        _, jx = model_vectorized(xref, phi0, r, h)
+        return csr_matrix(((-jx / yerr[:, :, None]).ravel(), (rows, cols)), shape=(6 * n, 3 * n))
+
+    ret: OptimizeResult = least_squares(
+        res, tile([0, 1, 1], n), jac=jac,
+        bounds=(tile([-2 * pi, 0, 0], n), tile([2 * pi, inf, inf], n)),
+        **{"tr_solver": "lsmr", **kwargs},
+    )
+    xopt = ret.x.reshape(n, 3)
+    _, jx = model_vectorized(xref, *xopt.T)
+    jw = jx / yerr[:, :, None]
+    xcov = pinv(jw.transpose(0, 2, 1) @ jw)  # shape: (n,3,3)
+
+    # every block is checked on its own, as if it was fitted alone: its gradient vanishes except against an
+    # active bound, or a Gauss-Newton step would hardly reduce its cost
+    eps = res(ret.x).reshape(n, 6)
+    cost = 0.5 * (eps ** 2).sum(1)
+    grad = -(jw * eps[:, :, None]).sum(1)  # shape: (n,3)
+    lower, upper = array([-2 * pi, 0, 0]), array([2 * pi, inf, inf])
+    grad = where(((xopt <= lower) & (grad > 0)) | ((xopt >= upper) & (grad < 0)), 0, grad)
+    step = pinv(jw) @ eps[:, :, None]  # shape: (n,3,1)
+    reduction = cost - 0.5 * ((eps - (jw @ step)[:, :, 0]) ** 2).sum(1)
+    converged = ((reduction <= kwargs.get("ftol", 1e-8) * cost)
+                 | (abs(grad).max(1) <= kwargs.get("gtol", 1e-8)))
+    xerr = xcov.diagonal(axis1=1, axis2=2) ** 0.5
+    fx, _ = model_vectorized(xref, *xopt.T)
+    iu, ju = triu_indices(3, 1)
+    return DataFrame({
+        "photon": table["photon"].values,
+        **{k: xopt[:, i] for i, k in enumerate(XKEYS)},
+        **{"{}_err".format(k): xerr[:, i] for i, k in enumerate(XKEYS)},
+        **{"cov_{}_{}".format(XKEYS[i], XKEYS[j]): xcov[:, i, j] for i, j in zip(iu, ju)},
+        **{"fx_{}".format(k): fx[:, i] for i, k in enumerate(YKEYS)},
+        "cost": cost,
+        "success": (ret.status > 0) & converged,
+        "nfev": full(n, ret.nfev),
+    }, index=table.index)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Fit every dataset of a measured beta YAML file in parallel, and store the results in a Parquet file.
+Datasets whose YAML block is unchanged since the last successful fit are not fitted again.
+Helium datasets are in the schema of function fit_helium.fit, such as Data/beta_helium_gauss3.yaml, and are fitted
+together with function fit_helium.fit_many, but alone where the batch cannot take them; the others are fitted one by
+one with the TargetPad of the target.
+
+Example:
+    python Packages/fit_measured_pads.py neon Data/beta_neon_gauss3.yaml fitted_neon.parquet
+    python Packages/fit_measured_pads.py helium Data/beta_helium_gauss3.yaml fitted_helium.parquet
+"""
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from hashlib import sha1
+from json import dumps
+from os import replace
+from os.path import isfile
+from time import perf_counter
+
+from jinja2 import Template
+from numpy import triu_indices
+from pandas import DataFrame, read_parquet
+from scipy.optimize import least_squares, OptimizeResult
+from yaml import safe_load
+
+from fit_helium import fit as fit_helium_dataset, fit_many as fit_helium_table, reference_at
+from fit_helium.fit import XKEYS as HELIUM_XKEYS, YKEYS as HELIUM_YKEYS
+from padtools import TargetNeonPad
+
+
+TARGETS = {
+    'neon': TargetNeonPad,
+}
+
+
+def block_hash(target: str, m: dict) -> str:
+    return sha1(dumps([target, m], sort_keys=True).encode()).hexdigest()
+
+
+def fit(target: str, m: dict) -> dict:
+    pad = TARGETS[target](
+        w2w_beta1_amp=m['w2w_beta1_amp'],
+        w2w_beta1_amp_err=m.get('w2w_beta1_amp_err'),
+        w2w_beta1_shift=m['w2w_beta1_shift'],
+        w2w_beta1_shift_err=m.get('w2w_beta1_shift_err'),
+        w2w_beta2=m['w2w_beta2'],
+        w2w_beta2_err=m.get('w2w_beta2_err'),
+        w2w_beta3_amp=m['w2w_beta3_amp'],
+        w2w_beta3_amp_err=m.get('w2w_beta3_amp_err'),
+        w2w_beta3_shift=m['w2w_beta3_shift'],
+        w2w_beta3_shift_err=m.get('w2w_beta3_shift_err'),
+        w2w_beta4=m['w2w_beta4'],
+        w2w_beta4_err=m.get('w2w_beta4_err'),
+        wonly_beta2=m['wonly_beta2'],
+        wonly_beta2_err=m.get('wonly_beta2_err'),
+        wonly_beta4=m['wonly_beta4'],
+        wonly_beta4_err=m.get('wonly_beta4_err'),
+        **m.get('weights', {}),
+    )
+    xkeys = [k for k in pad.XKEYS if k not in pad.xfixed]
+    if all(k.name.lower() in m['x0'] for k in xkeys):
+        x0 = [m['x0'][k.name.lower()] for k in xkeys]
+    else:  # older files name the parameters differently, but keep their order
+        x0 = list(m['x0'].values())
+        if len(x0) != len(xkeys):
+            raise ValueError('Expected {} x0 entries, but got {}!'.format(len(xkeys), len(x0)))
+
+    start = perf_counter()
+    opt: OptimizeResult = least_squares(
+        pad.zdiffmat,
+        [d['init'] for d in x0],
+        jac=pad.zdiffjacmat,
+        bounds=[[d['lower'] for d in x0], [d['upper'] for d in x0]],
+        **m.get('opts', {}),
+    )
+    elapsed = perf_counter() - start
+    xfitted = dict(zip(xkeys, opt.x))
+    xerror = dict(zip(pad.XKEYS, pad.xerror(opt.x)))  # of all the keys, including the fixed ones
+    return {
+        **{'x_{}'.format(k.name.lower()): xfitted.get(k, pad.xfixed.get(k)) for k in pad.XKEYS},
+        **{'err_{}'.format(k.name.lower()): xerror[k] for k in xkeys},
+        'success': opt.success,
+        'message': opt.message,
+        'cost': opt.cost,
+        'nfev': opt.nfev,
+        'njev': opt.njev,
+        'elapsed': elapsed,
+    }
+
+
+def fit_helium_one(m: dict) -> dict:
+    """
+    Fit a helium dataset alone
+    :param m: Dataset in the schema of function fit_helium.fit
+    :return: Result with the columns of function fit_helium_many, where batch_size is 1
+    """
+    start = perf_counter()
+    ret = fit_helium_dataset(
+        m['photon'],
+        *[m[k] for k in HELIUM_YKEYS],
+        *[m.get('{}_err'.format(k)) for k in HELIUM_YKEYS],
+    )
+    elapsed = perf_counter() - start
+    report: OptimizeResult = ret['report']
+    return {
+        'photon': m['photon'],
+        **{'x_{}'.format(k): v for k, v in ret['opt'].items()},
+        **{'err_{}'.format(k): v for k, v in ret['err'].items()},
+        **{'cov_{}_{}'.format(HELIUM_XKEYS[i], HELIUM_XKEYS[j]): ret['cov'][i, j]
+           for i, j in zip(*triu_indices(3, 1))},
+        **{'fx_{}'.format(k): float(ret['fx'][k]) for k in HELIUM_YKEYS},
+        'cost': report.cost,
+        'success': report.success,
+        'message': report.message,
+        'nfev': report.nfev,
+        'elapsed': elapsed,
+        'batch_size': 1,
+    }
+
+
+def fit_helium_many(measured: dict) -> dict:
+    """
+    Fit helium datasets at once with function fit_helium.fit_many. A dataset which the batch cannot take, such as
+    one out of the simulated photon energies, or which does not converge in it, is fitted alone with function
+    fit_helium_one instead, so that a bad dataset does not fail the others
+    :param measured: Datasets in the schema of function fit_helium.fit, by name
+    :return: Results by name, with the columns of function fit_helium.fit_many, where phi0, r and h are renamed
+        as x_phi0, ..., and phi0_err, ... as err_phi0, .... Columns cost and success are of every dataset, but nfev
+        and elapsed are of the whole batch of batch_size datasets; a failed dataset has only success and message
+    """
+    batched = {}
+    for k, m in measured.items():
+        try:
+            reference_at(m['photon'])
+        except (KeyError, ValueError) as err:
+            print('Dataset {}: not batched ({!r})'.format(k, err))
+        else:
+            batched[k] = m
+
+    done = {}
+    if batched:
+        start = perf_counter()
+        try:
+            fitted = fit_helium_table(DataFrame.from_dict(batched, orient='index'))
+        except Exception as err:
+            print('Datasets {}: batch failed ({!r})'.format(list(batched), err))
+        else:
+            fitted = fitted.rename(columns={
+                **{k: 'x_{}'.format(k) for k in HELIUM_XKEYS},
+                **{'{}_err'.format(k): 'err_{}'.format(k) for k in HELIUM_XKEYS},
+            })
+            fitted['message'] = ''
+            fitted['elapsed'] = perf_counter() - start
+            fitted['batch_size'] = len(fitted)
+            done = {k: d for k, d in fitted.to_dict('index').items() if d['success']}
+
+    for k, m in measured.items():
+        if k in done:
+            continue
+        try:
+            done[k] = fit_helium_one(m)
+        except Exception as err:
+            print('Dataset {}: failed ({!r})'.format(k, err))
+            done[k] = {'success': False, 'message': repr(err)}
+    return {k: done[k] for k in measured}
+
+
+def run(target: str, measured: dict, previous: DataFrame, workers: int = None) -> DataFrame:
+    hashes = {k: block_hash(target, m) for k, m in measured.items()}
+    if len(previous):  # failed datasets are fitted again
+        kept = previous[(previous['dataset'].map(hashes) == previous['hash']) & previous['success'].astype(bool)]
+    else:
+        kept = previous
+    todo = [k for k in measured if k not in set(kept['dataset'])]
+    print('{} datasets are up to date; fitting {}...'.format(len(measured) - len(todo), len(todo)))
+
+    fitted = []
+    if target == 'helium':
+        done = fit_helium_many({k: measured[k] for k in todo}) if todo else {}
+        for k, d in done.items():
+            if 'cost' in d:
+                print('Dataset {}: cost {:.3f}, nfev {}, {:.2f} s in a batch of {}'
+                      .format(k, d['cost'], d['nfev'], d['elapsed'], d['batch_size']))
+        fitted = [{'dataset': k, 'hash': hashes[k], **done[k]} for k in todo]
+        todo = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fit, target, measured[k]): k for k in todo}
+        for future in as_completed(futures):
+            k = futures[future]
+            try:
+                d = future.result()
+            except Exception as err:
+                print('Dataset {}: failed ({!r})'.format(k, err))
+                d = {'success': False, 'message': repr(err)}
+            else:
+                print('Dataset {}: cost {:.3f}, nfev {}, {:.2f} s'.format(k, d['cost'], d['nfev'], d['elapsed']))
+            fitted.append({'dataset': k, 'hash': hashes[k], **d})
+    ret = DataFrame([*kept.to_dict('records'), *fitted])
+    if ret.empty:
+        return previous.iloc[:0]
+    return ret.set_index('dataset').loc[list(measured)].reset_index()
+
+
+# %%
+if __name__ == '__main__':
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('target', choices=sorted(['helium', *TARGETS]))
+    parser.add_argument('measured', help='YAML file of measured beta parameters')
+    parser.add_argument('output', help='Parquet file to store the results')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help='fit all the datasets again')
+    args = parser.parse_args()
+
+    with open(args.measured, 'r') as f:
+        measured = safe_load(Template(f.read()).render())
+    if isfile(args.output) and not args.force:
+        previous = read_parquet(args.output)
+    else:
+        previous = DataFrame(columns=['dataset', 'hash'])
+
+    stored = run(args.target, measured, previous, workers=args.workers)
+    tmp = '{}.tmp'.format(args.output)
+    stored.to_parquet(tmp, index=False)
+    replace(tmp, args.output)
+    print('Stored {}'.format(args.output))
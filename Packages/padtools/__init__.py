@@ -1,6 +1,4 @@
-from .solve_neon_eq import ymat_pretty as neon_betas
-from .fit_pad import TargetHeliumPad, TargetNeonPad
-from .solve_helium_eq import ymat_pretty as helium_betas
+from importlib import import_module
 
 
 __all__ = [
@@ -9,3 +7,25 @@ __all__ = [
     "TargetHeliumPad",
     "TargetNeonPad",
 ]
+
+
+# Submodules are imported on first access, so that "import padtools" stays cheap
+_lazy = {
+    "helium_betas": ("._generated.helium", "ymat_pretty"),
+    "neon_betas": ("._generated.neon", "ymat_pretty"),
+    "TargetHeliumPad": (".fit_pad", "TargetHeliumPad"),
+    "TargetNeonPad": (".fit_pad", "TargetNeonPad"),
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy:
+        module, attr = _lazy[name]
+        ret = getattr(import_module(module, __name__), attr)
+        globals()[name] = ret
+        return ret
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
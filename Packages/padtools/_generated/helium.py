@@ -0,0 +1,265 @@
+"""
+Solved helium PAD equations.
+Generated by padtools.generate from padtools.solve_helium_eq with SymPy 1.14.0; do not edit
+"""
+from enum import IntEnum
+
+import numpy
+
+
+__all__ = [
+    'XKeys',
+    'YKeys',
+    'AllKeys',
+    'ymat',
+    'allmat',
+    'yjacmat',
+    'yfused',
+    'ymat_vectorized',
+    'yjacmat_vectorized',
+    'ymat_pretty',
+]
+
+
+class XKeys(IntEnum):  # length: 6
+    COEFF_S = 0
+    COEFF_P = 1
+    COEFF_D = 2
+    ETA_S = 3
+    ETA_P = 4
+    ETA_D = 5
+
+
+class YKeys(IntEnum):  # length: 7
+    B0 = 0
+    B1_AMP = 1
+    B1_SHIFT = 2
+    B2 = 3
+    B3_AMP = 4
+    B3_SHIFT = 5
+    B4 = 6
+
+
+class AllKeys(IntEnum):  # length: 9
+    B0 = 0
+    B1_AMP = 1
+    B1_SHIFT = 2
+    B2 = 3
+    B3_AMP = 4
+    B3_SHIFT = 5
+    B4 = 6
+    B1M3_AMP = 7
+    B1M3_SHIFT = 8
+
+
+def ymat(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d):
+    _x0 = coeff_d**2
+    _x1 = numpy.pi**(-1.0)
+    _x2 = (1/4)*_x1
+    _x3 = coeff_p**2
+    _x4 = coeff_s**2
+    _x5 = -eta_s
+    _x6 = numpy.sqrt(5)*coeff_d*coeff_s*numpy.cos(_x5 + eta_d)
+    _x7 = _x1*coeff_p
+    _x8 = eta_d - eta_p
+    _x9 = numpy.cos(_x8)
+    _x10 = numpy.sqrt(15)*coeff_d
+    _x11 = 2*_x10
+    _x12 = _x5 + eta_p
+    _x13 = 5*numpy.sqrt(3)*coeff_s
+    _x14 = numpy.sin(_x8)
+    _x15 = _x0*_x1
+    _x16 = (1/2)*_x1
+    return numpy.array([[_x0*_x2 + _x2*_x3 + _x2*_x4], [(1/10)*_x7*numpy.sqrt(60*_x0 + 75*_x4 + 60*_x6)], [numpy.angle(_x11*_x9 + _x13*numpy.cos(_x12) + 1j*(_x11*_x14 - _x13*numpy.sin(_x12)))], [(5/14)*_x15 + _x16*_x3 + _x16*_x6], [(3/10)*_x10*_x7], [numpy.angle(1j*_x14 + _x9)], [(9/14)*_x15]])
+
+
+def allmat(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d):
+    _x0 = coeff_d**2
+    _x1 = numpy.pi**(-1.0)
+    _x2 = (1/4)*_x1
+    _x3 = coeff_p**2
+    _x4 = coeff_s**2
+    _x5 = -eta_s
+    _x6 = numpy.sqrt(5)*coeff_d*coeff_s*numpy.cos(_x5 + eta_d)
+    _x7 = _x1*coeff_p
+    _x8 = eta_d - eta_p
+    _x9 = numpy.cos(_x8)
+    _x10 = numpy.sqrt(15)*coeff_d
+    _x11 = 2*_x10
+    _x12 = _x5 + eta_p
+    _x13 = numpy.cos(_x12)
+    _x14 = numpy.sqrt(3)*coeff_s
+    _x15 = 5*_x14
+    _x16 = numpy.sin(_x8)
+    _x17 = numpy.sin(_x12)
+    _x18 = _x0*_x1
+    _x19 = (1/2)*_x1
+    return numpy.array([[_x0*_x2 + _x2*_x3 + _x2*_x4], [(1/10)*_x7*numpy.sqrt(60*_x0 + 75*_x4 + 60*_x6)], [numpy.angle(_x11*_x9 + _x13*_x15 + 1j*(_x11*_x16 - _x15*_x17))], [(5/14)*_x18 + _x19*_x3 + _x19*_x6], [(3/10)*_x10*_x7], [numpy.angle(1j*_x16 + _x9)], [(9/14)*_x18], [_x14*_x19*coeff_p], [numpy.angle(_x13 - 1j*_x17)]])
+
+
+def yjacmat(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d):
+    _x0 = numpy.pi**(-1.0)
+    _x1 = (1/2)*_x0
+    _x2 = _x1*coeff_s
+    _x3 = _x0*coeff_p
+    _x4 = _x1*coeff_d
+    _x5 = numpy.sqrt(5)
+    _x6 = -eta_s
+    _x7 = _x6 + eta_d
+    _x8 = _x5*numpy.cos(_x7)
+    _x9 = 30*_x8
+    _x10 = 60*coeff_d
+    _x11 = numpy.sqrt(_x10*_x8*coeff_s + 60*coeff_d**2 + 75*coeff_s**2)
+    _x12 = _x3/_x11
+    _x13 = (1/10)*_x12
+    _x14 = _x5*coeff_d*numpy.sin(_x7)
+    _x15 = 3*_x12*_x14*coeff_s
+    _x16 = eta_d - eta_p
+    _x17 = numpy.sin(_x16)
+    _x18 = numpy.sqrt(15)
+    _x19 = 2*_x18
+    _x20 = _x19*coeff_d
+    _x21 = _x17*_x20
+    _x22 = _x6 + eta_p
+    _x23 = numpy.sin(_x22)
+    _x24 = numpy.sqrt(3)
+    _x25 = 5*_x24
+    _x26 = _x25*coeff_s
+    _x27 = _x23*_x26
+    _x28 = _x21 - _x27
+    _x29 = _x28**2
+    _x30 = numpy.cos(_x16)
+    _x31 = _x20*_x30
+    _x32 = numpy.cos(_x22)
+    _x33 = _x26*_x32 + _x31
+    _x34 = (_x29 + _x33**2)**(-1.0)
+    _x35 = _x0*coeff_d
+    _x36 = _x14*_x2
+    _x37 = (3/10)*_x18
+    _x38 = _x17**2 + _x30**2
+    return numpy.array([[_x2, (1/2)*_x3, _x4, 0, 0, 0], [_x13*(_x9*coeff_d + 75*coeff_s), (1/10)*_x0*_x11, _x13*(_x10 + _x9*coeff_s), _x15, 0, -_x15], [_x34*(-_x23*_x25*_x33 - _x25*_x28*_x32), 0, _x34*(2*_x17*_x18*_x33 - _x19*_x28*_x30), _x34*(5*_x24*_x32*_x33*coeff_s - _x27*_x28), _x34*(-_x29 - _x33**2), _x34*(_x21*_x28 + _x31*_x33)], [_x4*_x8, _x3, _x2*_x8 + (5/7)*_x35, _x36, 0, -_x36], [0, _x35*_x37, _x3*_x37, 0, 0, 0], [0, 0, 0, 0, -1, 1], [0, 0, (9/7)*_x35, 0, 0, 0]])
+
+
+def yfused(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d):
+    _x0 = coeff_d**2
+    _x1 = numpy.pi**(-1.0)
+    _x2 = (1/4)*_x1
+    _x3 = coeff_p**2
+    _x4 = coeff_s**2
+    _x5 = _x1*coeff_p
+    _x6 = 60*coeff_d
+    _x7 = numpy.sqrt(5)
+    _x8 = -eta_s
+    _x9 = _x8 + eta_d
+    _x10 = _x7*numpy.cos(_x9)
+    _x11 = numpy.sqrt(60*_x0 + _x10*_x6*coeff_s + 75*_x4)
+    _x12 = (1/10)*_x11
+    _x13 = eta_d - eta_p
+    _x14 = numpy.sin(_x13)
+    _x15 = numpy.sqrt(15)
+    _x16 = 2*_x15
+    _x17 = _x16*coeff_d
+    _x18 = _x14*_x17
+    _x19 = _x8 + eta_p
+    _x20 = numpy.sin(_x19)
+    _x21 = numpy.sqrt(3)
+    _x22 = 5*_x21
+    _x23 = _x22*coeff_s
+    _x24 = _x20*_x23
+    _x25 = _x18 - _x24
+    _x26 = numpy.cos(_x13)
+    _x27 = _x17*_x26
+    _x28 = numpy.cos(_x19)
+    _x29 = _x23*_x28 + _x27
+    _x30 = _x0*_x1
+    _x31 = (1/2)*_x1
+    _x32 = _x31*coeff_s
+    _x33 = _x10*_x32
+    _x34 = (3/10)*_x15
+    _x35 = _x34*_x5
+    _x36 = _x31*coeff_d
+    _x37 = 30*_x10
+    _x38 = _x5/_x11
+    _x39 = (1/10)*_x38
+    _x40 = _x7*coeff_d*numpy.sin(_x9)
+    _x41 = 3*_x38*_x40*coeff_s
+    _x42 = _x25**2
+    _x43 = (_x29**2 + _x42)**(-1.0)
+    _x44 = _x1*coeff_d
+    _x45 = _x32*_x40
+    _x46 = _x14**2 + _x26**2
+    return (
+        numpy.array([[_x0*_x2 + _x2*_x3 + _x2*_x4], [_x12*_x5], [numpy.angle(1j*_x25 + _x29)], [_x3*_x31 + (5/14)*_x30 + _x33*coeff_d], [_x35*coeff_d], [numpy.angle(1j*_x14 + _x26)], [(9/14)*_x30]]),
+        numpy.array([[_x32, (1/2)*_x5, _x36, 0, 0, 0], [_x39*(_x37*coeff_d + 75*coeff_s), _x1*_x12, _x39*(_x37*coeff_s + _x6), _x41, 0, -_x41], [_x43*(-_x20*_x22*_x29 - _x22*_x25*_x28), 0, _x43*(2*_x14*_x15*_x29 - _x16*_x25*_x26), _x43*(5*_x21*_x28*_x29*coeff_s - _x24*_x25), _x43*(-_x29**2 - _x42), _x43*(_x18*_x25 + _x27*_x29)], [_x10*_x36, _x5, _x33 + (5/7)*_x44, _x45, 0, -_x45], [0, _x34*_x44, _x35, 0, 0, 0], [0, 0, 0, 0, -1, 1], [0, 0, (9/7)*_x44, 0, 0, 0]]),
+    )
+
+
+def ymat_vectorized(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d):
+    _x0 = coeff_d**2
+    _x1 = numpy.pi**(-1.0)
+    _x2 = (1/4)*_x1
+    _x3 = coeff_p**2
+    _x4 = coeff_s**2
+    _x5 = -eta_s
+    _x6 = numpy.sqrt(5)*coeff_d*coeff_s*numpy.cos(_x5 + eta_d)
+    _x7 = _x1*coeff_p
+    _x8 = eta_d - eta_p
+    _x9 = numpy.cos(_x8)
+    _x10 = numpy.sqrt(15)*coeff_d
+    _x11 = 2*_x10
+    _x12 = _x5 + eta_p
+    _x13 = 5*numpy.sqrt(3)*coeff_s
+    _x14 = numpy.sin(_x8)
+    _x15 = _x0*_x1
+    _x16 = (1/2)*_x1
+    _shape = numpy.broadcast(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d).shape
+    return numpy.array([numpy.broadcast_to(_e, _shape) for _e in (_x0*_x2 + _x2*_x3 + _x2*_x4, (1/10)*_x7*numpy.sqrt(60*_x0 + 75*_x4 + 60*_x6), numpy.angle(_x11*_x9 + _x13*numpy.cos(_x12) + 1j*(_x11*_x14 - _x13*numpy.sin(_x12))), (5/14)*_x15 + _x16*_x3 + _x16*_x6, (3/10)*_x10*_x7, numpy.angle(1j*_x14 + _x9), (9/14)*_x15,)], dtype=float).reshape((7, 1) + _shape)
+
+
+def yjacmat_vectorized(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d):
+    _x0 = numpy.pi**(-1.0)
+    _x1 = (1/2)*_x0
+    _x2 = _x1*coeff_s
+    _x3 = _x0*coeff_p
+    _x4 = _x1*coeff_d
+    _x5 = numpy.sqrt(5)
+    _x6 = -eta_s
+    _x7 = _x6 + eta_d
+    _x8 = _x5*numpy.cos(_x7)
+    _x9 = 30*_x8
+    _x10 = 60*coeff_d
+    _x11 = numpy.sqrt(_x10*_x8*coeff_s + 60*coeff_d**2 + 75*coeff_s**2)
+    _x12 = _x3/_x11
+    _x13 = (1/10)*_x12
+    _x14 = _x5*coeff_d*numpy.sin(_x7)
+    _x15 = 3*_x12*_x14*coeff_s
+    _x16 = eta_d - eta_p
+    _x17 = numpy.sin(_x16)
+    _x18 = numpy.sqrt(15)
+    _x19 = 2*_x18
+    _x20 = _x19*coeff_d
+    _x21 = _x17*_x20
+    _x22 = _x6 + eta_p
+    _x23 = numpy.sin(_x22)
+    _x24 = numpy.sqrt(3)
+    _x25 = 5*_x24
+    _x26 = _x25*coeff_s
+    _x27 = _x23*_x26
+    _x28 = _x21 - _x27
+    _x29 = _x28**2
+    _x30 = numpy.cos(_x16)
+    _x31 = _x20*_x30
+    _x32 = numpy.cos(_x22)
+    _x33 = _x26*_x32 + _x31
+    _x34 = (_x29 + _x33**2)**(-1.0)
+    _x35 = _x0*coeff_d
+    _x36 = _x14*_x2
+    _x37 = (3/10)*_x18
+    _x38 = _x17**2 + _x30**2
+    _shape = numpy.broadcast(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d).shape
+    return numpy.array([numpy.broadcast_to(_e, _shape) for _e in (_x2, (1/2)*_x3, _x4, 0, 0, 0, _x13*(_x9*coeff_d + 75*coeff_s), (1/10)*_x0*_x11, _x13*(_x10 + _x9*coeff_s), _x15, 0, -_x15, _x34*(-_x23*_x25*_x33 - _x25*_x28*_x32), 0, _x34*(2*_x17*_x18*_x33 - _x19*_x28*_x30), _x34*(5*_x24*_x32*_x33*coeff_s - _x27*_x28), _x34*(-_x29 - _x33**2), _x34*(_x21*_x28 + _x31*_x33), _x4*_x8, _x3, _x2*_x8 + (5/7)*_x35, _x36, 0, -_x36, 0, _x35*_x37, _x3*_x37, 0, 0, 0, 0, 0, 0, 0, -1, 1, 0, 0, (9/7)*_x35, 0, 0, 0,)], dtype=float).reshape((7, 6) + _shape)
+
+
+def ymat_pretty(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d):
+    ret = allmat(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d)
+    return {k.name.lower(): v for k, v in zip(AllKeys, ret[:, 0])}
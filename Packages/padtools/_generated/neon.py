@@ -0,0 +1,778 @@
+"""
+Solved neon PAD equations.
+Generated by padtools.generate from padtools.solve_neon_eq with SymPy 1.14.0; do not edit
+"""
+from enum import IntEnum
+
+import numpy
+
+
+__all__ = [
+    'XKeys',
+    'YKeys',
+    'AllKeys',
+    'ymat',
+    'allmat',
+    'yjacmat',
+    'yfused',
+    'ymat_vectorized',
+    'yjacmat_vectorized',
+    'ymat_pretty',
+]
+
+
+class XKeys(IntEnum):  # length: 10
+    COEFF_SP = 0
+    COEFF_PSP = 1
+    COEFF_PDP = 2
+    COEFF_DP = 3
+    COEFF_FDP = 4
+    ETA_SP = 5
+    ETA_PSP = 6
+    ETA_PDP = 7
+    ETA_DP = 8
+    ETA_FDP = 9
+
+
+class YKeys(IntEnum):  # length: 7
+    B0 = 0
+    B1_AMP = 1
+    B1_SHIFT = 2
+    B2 = 3
+    B3_AMP = 4
+    B3_SHIFT = 5
+    B4 = 6
+
+
+class AllKeys(IntEnum):  # length: 9
+    B0 = 0
+    B1_AMP = 1
+    B1_SHIFT = 2
+    B2 = 3
+    B3_AMP = 4
+    B3_SHIFT = 5
+    B4 = 6
+    B1M3_AMP = 7
+    B1M3_SHIFT = 8
+
+
+def ymat(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp):
+    _x0 = numpy.pi**(-1.0)
+    _x1 = (1/12)*_x0
+    _x2 = _x1*coeff_dp**2
+    _x3 = coeff_fdp**2
+    _x4 = _x0*_x3
+    _x5 = _x0*coeff_pdp**2
+    _x6 = _x0*coeff_psp**2
+    _x7 = -eta_psp
+    _x8 = _x0*coeff_pdp
+    _x9 = _x8*coeff_psp*numpy.cos(_x7 + eta_pdp)
+    _x10 = -eta_sp
+    _x11 = _x10 + eta_pdp
+    _x12 = 20*coeff_pdp*coeff_sp
+    _x13 = _x10 + eta_psp
+    _x14 = 50*coeff_psp*coeff_sp
+    _x15 = -eta_pdp
+    _x16 = _x15 + eta_dp
+    _x17 = numpy.sin(_x16)
+    _x18 = numpy.sqrt(2)
+    _x19 = _x18*coeff_dp
+    _x20 = _x19*coeff_pdp
+    _x21 = 17*_x20
+    _x22 = _x7 + eta_dp
+    _x23 = numpy.sin(_x22)
+    _x24 = _x19*coeff_psp
+    _x25 = 20*_x24
+    _x26 = eta_dp - eta_fdp
+    _x27 = numpy.sin(_x26)
+    _x28 = numpy.sqrt(3)
+    _x29 = _x28*coeff_dp*coeff_fdp
+    _x30 = 12*_x29
+    _x31 = _x12*numpy.sin(_x11) + _x14*numpy.sin(_x13) + _x17*_x21 + _x23*_x25 - _x27*_x30
+    _x32 = numpy.cos(_x16)
+    _x33 = numpy.cos(_x22)
+    _x34 = numpy.cos(_x26)
+    _x35 = _x12*numpy.cos(_x11) + _x14*numpy.cos(_x13) - _x21*_x32 - _x25*_x33 + _x30*_x34
+    _x36 = (1/300)*_x0
+    _x37 = numpy.sqrt(6)*coeff_fdp
+    _x38 = _x37*_x8*numpy.cos(_x15 + eta_fdp)
+    _x39 = _x0*_x37*coeff_psp*numpy.cos(_x7 + eta_fdp)
+    _x40 = _x10 + eta_fdp
+    _x41 = 10*_x37*coeff_sp
+    _x42 = 3*_x17*_x18*coeff_dp*coeff_pdp + 30*_x18*_x23*coeff_dp*coeff_psp - 8*_x27*_x29 - _x41*numpy.sin(_x40)
+    _x43 = 3*_x20*_x32 + 30*_x24*_x33 - 8*_x28*_x34*coeff_dp*coeff_fdp + _x41*numpy.cos(_x40)
+    return numpy.array([[_x1*coeff_sp**2 + _x2 + (1/150)*_x4 + (17/1800)*_x5 + (1/36)*_x6 + (1/45)*_x9], [_x36*numpy.sqrt(_x31**2 + _x35**2)], [numpy.angle(1j*_x31 + _x35)], [-1/6*_x0*_x19*coeff_sp*numpy.cos(_x10 + eta_dp) + _x2 - 2/175*_x38 - 1/70*_x39 + (4/525)*_x4 + (7/1800)*_x5 + (1/18)*_x6 + (2/45)*_x9], [_x36*numpy.sqrt(_x42**2 + _x43**2)], [numpy.angle(1j*_x42 - _x43)], [(1/175)*_x0*_x3 - 1/525*_x38 - 2/105*_x39]])
+
+
+def allmat(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp):
+    _x0 = numpy.pi**(-1.0)
+    _x1 = (1/12)*_x0
+    _x2 = _x1*coeff_dp**2
+    _x3 = coeff_fdp**2
+    _x4 = _x0*_x3
+    _x5 = _x0*coeff_pdp**2
+    _x6 = _x0*coeff_psp**2
+    _x7 = -eta_psp
+    _x8 = _x0*coeff_pdp
+    _x9 = _x8*coeff_psp*numpy.cos(_x7 + eta_pdp)
+    _x10 = -eta_sp
+    _x11 = _x10 + eta_pdp
+    _x12 = numpy.sin(_x11)
+    _x13 = 20*coeff_sp
+    _x14 = _x13*coeff_pdp
+    _x15 = 50*coeff_sp
+    _x16 = _x10 + eta_psp
+    _x17 = coeff_psp*numpy.sin(_x16)
+    _x18 = -eta_pdp
+    _x19 = _x18 + eta_dp
+    _x20 = numpy.sin(_x19)
+    _x21 = numpy.sqrt(2)
+    _x22 = _x21*coeff_dp
+    _x23 = _x22*coeff_pdp
+    _x24 = 17*_x23
+    _x25 = _x7 + eta_dp
+    _x26 = numpy.sin(_x25)
+    _x27 = _x22*coeff_psp
+    _x28 = 20*_x27
+    _x29 = eta_dp - eta_fdp
+    _x30 = numpy.sin(_x29)
+    _x31 = numpy.sqrt(3)
+    _x32 = _x31*coeff_dp*coeff_fdp
+    _x33 = 12*_x32
+    _x34 = _x12*_x14 + _x15*_x17 + _x20*_x24 + _x26*_x28 - _x30*_x33
+    _x35 = numpy.cos(_x11)
+    _x36 = coeff_psp*numpy.cos(_x16)
+    _x37 = numpy.cos(_x19)
+    _x38 = numpy.cos(_x25)
+    _x39 = numpy.cos(_x29)
+    _x40 = _x14*_x35 + _x15*_x36 - _x24*_x37 - _x28*_x38 + _x33*_x39
+    _x41 = (1/300)*_x0
+    _x42 = numpy.sqrt(6)*coeff_fdp
+    _x43 = _x42*_x8*numpy.cos(_x18 + eta_fdp)
+    _x44 = _x0*_x42*coeff_psp*numpy.cos(_x7 + eta_fdp)
+    _x45 = _x10 + eta_fdp
+    _x46 = numpy.sin(_x45)
+    _x47 = _x42*coeff_sp
+    _x48 = 10*_x47
+    _x49 = 3*_x20*_x21*coeff_dp*coeff_pdp + 30*_x21*_x26*coeff_dp*coeff_psp - 8*_x30*_x32 - _x46*_x48
+    _x50 = numpy.cos(_x45)
+    _x51 = 3*_x23*_x37 + 30*_x27*_x38 - 8*_x31*_x39*coeff_dp*coeff_fdp + _x48*_x50
+    _x52 = 8*coeff_pdp*coeff_sp
+    _x53 = 5*_x23
+    _x54 = 10*_x27
+    _x55 = 6*_x47
+    _x56 = _x12*_x52 + _x13*_x17 + _x20*_x53 - _x26*_x54 + _x46*_x55
+    _x57 = _x13*_x36 + _x35*_x52 - _x37*_x53 + _x38*_x54 + _x50*_x55
+    return numpy.array([[_x1*coeff_sp**2 + _x2 + (1/150)*_x4 + (17/1800)*_x5 + (1/36)*_x6 + (1/45)*_x9], [_x41*numpy.sqrt(_x34**2 + _x40**2)], [numpy.angle(1j*_x34 + _x40)], [-1/6*_x0*_x22*coeff_sp*numpy.cos(_x10 + eta_dp) + _x2 + (4/525)*_x4 - 2/175*_x43 - 1/70*_x44 + (7/1800)*_x5 + (1/18)*_x6 + (2/45)*_x9], [_x41*numpy.sqrt(_x49**2 + _x51**2)], [numpy.angle(1j*_x49 - _x51)], [(1/175)*_x0*_x3 - 1/525*_x43 - 2/105*_x44], [(1/120)*_x0*numpy.sqrt(_x56**2 + _x57**2)], [numpy.angle(1j*_x56 + _x57)]])
+
+
+def yjacmat(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp):
+    _x0 = numpy.pi**(-1.0)
+    _x1 = (1/6)*_x0
+    _x2 = _x1*coeff_sp
+    _x3 = _x0*coeff_psp
+    _x4 = _x0*coeff_pdp
+    _x5 = -eta_psp
+    _x6 = _x5 + eta_pdp
+    _x7 = numpy.cos(_x6)
+    _x8 = (1/45)*_x7
+    _x9 = _x1*coeff_dp
+    _x10 = _x0*coeff_fdp
+    _x11 = _x3*coeff_pdp*numpy.sin(_x6)
+    _x12 = (1/45)*_x11
+    _x13 = -eta_sp
+    _x14 = _x13 + eta_pdp
+    _x15 = numpy.sin(_x14)
+    _x16 = 40*coeff_pdp
+    _x17 = _x15*_x16
+    _x18 = _x13 + eta_psp
+    _x19 = numpy.sin(_x18)
+    _x20 = 100*coeff_psp
+    _x21 = _x19*_x20
+    _x22 = 20*coeff_pdp
+    _x23 = _x15*_x22
+    _x24 = _x23*coeff_sp
+    _x25 = 50*coeff_psp
+    _x26 = _x19*_x25
+    _x27 = _x26*coeff_sp
+    _x28 = _x24 + _x27
+    _x29 = -eta_pdp
+    _x30 = _x29 + eta_dp
+    _x31 = numpy.sin(_x30)
+    _x32 = numpy.sqrt(2)
+    _x33 = _x32*coeff_dp
+    _x34 = 17*_x33
+    _x35 = _x31*_x34
+    _x36 = _x35*coeff_pdp
+    _x37 = _x5 + eta_dp
+    _x38 = numpy.sin(_x37)
+    _x39 = 20*_x33
+    _x40 = _x38*_x39
+    _x41 = _x40*coeff_psp
+    _x42 = eta_dp - eta_fdp
+    _x43 = numpy.sin(_x42)
+    _x44 = numpy.sqrt(3)
+    _x45 = _x44*coeff_fdp
+    _x46 = 12*_x45
+    _x47 = _x43*_x46
+    _x48 = _x47*coeff_dp
+    _x49 = _x36 + _x41 - _x48
+    _x50 = _x28 + _x49
+    _x51 = (1/2)*_x50
+    _x52 = numpy.cos(_x14)
+    _x53 = _x16*_x52
+    _x54 = numpy.cos(_x18)
+    _x55 = _x20*_x54
+    _x56 = numpy.cos(_x37)
+    _x57 = _x39*_x56
+    _x58 = _x57*coeff_psp
+    _x59 = numpy.cos(_x30)
+    _x60 = _x34*_x59
+    _x61 = _x60*coeff_pdp
+    _x62 = numpy.cos(_x42)
+    _x63 = _x46*_x62*coeff_dp
+    _x64 = _x22*_x52
+    _x65 = _x64*coeff_sp
+    _x66 = _x25*_x54
+    _x67 = _x66*coeff_sp
+    _x68 = _x65 + _x67
+    _x69 = -_x58 - _x61 + _x63 + _x68
+    _x70 = (1/2)*_x69
+    _x71 = _x50**2 + _x69**2
+    _x72 = (1/300)*_x0
+    _x73 = _x72/numpy.sqrt(_x71)
+    _x74 = 40*_x33
+    _x75 = _x38*_x74
+    _x76 = _x56*_x74
+    _x77 = 34*_x33
+    _x78 = _x31*_x77
+    _x79 = _x59*_x77
+    _x80 = _x32*coeff_pdp
+    _x81 = 34*_x80
+    _x82 = _x32*coeff_psp
+    _x83 = 40*_x82
+    _x84 = 24*_x45
+    _x85 = _x43*_x84
+    _x86 = _x44*coeff_dp
+    _x87 = 12*_x86
+    _x88 = _x43*_x87
+    _x89 = _x17*coeff_sp
+    _x90 = _x21*coeff_sp
+    _x91 = _x53*coeff_sp
+    _x92 = _x55*coeff_sp
+    _x93 = _x75*coeff_psp
+    _x94 = _x76*coeff_psp
+    _x95 = _x78*coeff_pdp
+    _x96 = _x79*coeff_pdp
+    _x97 = _x71**(-1.0)
+    _x98 = 20*coeff_sp
+    _x99 = 17*_x80
+    _x100 = 20*_x82
+    _x101 = _x13 + eta_dp
+    _x102 = _x32*numpy.cos(_x101)
+    _x103 = (2/45)*_x7
+    _x104 = numpy.sqrt(6)
+    _x105 = _x10*_x104
+    _x106 = _x5 + eta_fdp
+    _x107 = numpy.cos(_x106)
+    _x108 = (1/70)*_x107
+    _x109 = _x29 + eta_fdp
+    _x110 = numpy.cos(_x109)
+    _x111 = _x104*_x110
+    _x112 = _x111*_x4
+    _x113 = _x104*_x3
+    _x114 = _x2*_x33*numpy.sin(_x101)
+    _x115 = (2/45)*_x11
+    _x116 = _x113*coeff_fdp*numpy.sin(_x106)
+    _x117 = (1/70)*_x116
+    _x118 = _x104*_x4*coeff_fdp*numpy.sin(_x109)
+    _x119 = (2/175)*_x118
+    _x120 = _x13 + eta_fdp
+    _x121 = numpy.sin(_x120)
+    _x122 = 8*_x45
+    _x123 = _x122*_x43
+    _x124 = _x123*coeff_dp
+    _x125 = 10*_x104
+    _x126 = _x125*coeff_sp
+    _x127 = _x121*_x126
+    _x128 = _x127*coeff_fdp
+    _x129 = _x124 + _x128
+    _x130 = -_x129 + 3*_x31*_x32*coeff_dp*coeff_pdp + 30*_x32*_x38*coeff_dp*coeff_psp
+    _x131 = _x125*coeff_fdp
+    _x132 = _x130*_x131
+    _x133 = numpy.cos(_x120)
+    _x134 = _x126*_x133
+    _x135 = _x134*coeff_fdp
+    _x136 = 3*_x33
+    _x137 = _x136*coeff_pdp
+    _x138 = _x137*_x59
+    _x139 = 30*_x33
+    _x140 = _x139*coeff_psp
+    _x141 = _x140*_x56
+    _x142 = _x122*_x62*coeff_dp
+    _x143 = _x138 + _x141 - _x142
+    _x144 = -_x135 - _x143
+    _x145 = _x131*_x144
+    _x146 = _x130**2 + _x144**2
+    _x147 = _x72/numpy.sqrt(_x146)
+    _x148 = _x130*_x139
+    _x149 = _x139*_x144
+    _x150 = _x130*_x136
+    _x151 = _x136*_x144
+    _x152 = 6*_x80
+    _x153 = 60*_x82
+    _x154 = 16*_x45
+    _x155 = _x154*_x43
+    _x156 = (1/2)*_x130
+    _x157 = (1/2)*_x144
+    _x158 = 16*_x86
+    _x159 = _x104*_x98
+    _x160 = _x121*_x159
+    _x161 = _x133*_x159
+    _x162 = _x140*_x38
+    _x163 = _x137*_x31
+    _x164 = 6*_x33*coeff_pdp
+    _x165 = 60*_x33*coeff_psp
+    _x166 = _x155*coeff_dp
+    _x167 = _x154*_x62*coeff_dp
+    _x168 = _x146**(-1.0)
+    _x169 = 3*_x80
+    _x170 = 30*_x82
+    _x171 = 8*_x86
+    _x172 = (2/105)*_x107
+    _x173 = (2/105)*_x116
+    _x174 = (1/525)*_x118
+    return numpy.array([[_x2, (1/18)*_x3 + _x4*_x8, _x3*_x8 + (17/900)*_x4, _x9, (1/75)*_x10, 0, _x12, -_x12, 0, 0], [_x73*(_x51*(_x17 + _x21) + _x70*(_x53 + _x55)), _x73*(_x51*(100*_x19*coeff_sp + _x75) + _x70*(100*_x54*coeff_sp - _x76)), _x73*(_x51*(40*_x15*coeff_sp + _x78) + _x70*(40*_x52*coeff_sp - _x79)), _x73*(_x51*(_x31*_x81 + _x38*_x83 - _x85) + _x70*(24*_x44*_x62*coeff_fdp - _x56*_x83 - _x59*_x81)), _x73*(12*_x44*_x62*_x69*coeff_dp - _x50*_x88), _x73*(_x51*(-_x91 - _x92) + _x70*(_x89 + _x90)), _x73*(_x51*(_x92 - _x94) + _x70*(-_x90 - _x93)), _x73*(_x51*(_x91 - _x96) + _x70*(-_x89 - _x95)), _x73*(_x51*(-_x62*_x84*coeff_dp + _x94 + _x96) + _x70*(-_x85*coeff_dp + _x93 + _x95)), _x73*(_x48*_x69 + _x50*_x63)], [_x97*(-_x50*(_x64 + _x66) + _x69*(_x23 + _x26)), _x97*(-_x50*(50*_x54*coeff_sp - _x57) + _x69*(50*_x19*coeff_sp + _x40)), _x97*(-_x50*(20*_x52*coeff_sp - _x60) + _x69*(_x15*_x98 + _x35)), _x97*(-_x50*(-_x100*_x56 + 12*_x44*_x62*coeff_fdp - _x59*_x99) + _x69*(_x100*_x38 + _x31*_x99 - _x47)), _x97*(-_x50*_x62*_x87 - _x69*_x88), _x97*(-_x28*_x50 - _x68*_x69), _x97*(-_x50*(-_x27 - _x41) + _x69*(-_x58 + _x67)), _x97*(-_x50*(-_x24 - _x36) + _x69*(-_x61 + _x65)), _x97*(-_x49*_x50 + _x69*(_x58 + _x61 - _x63)), _x97*(12*_x44*_x62*_x69*coeff_dp*coeff_fdp - _x48*_x50)], [-_x102*_x9, _x103*_x4 - _x105*_x108 + (1/9)*_x3, -2/175*_x10*_x111 + _x103*_x3 + (7/900)*_x4, -_x102*_x2 + _x9, (8/525)*_x0*coeff_fdp - _x108*_x113 - 2/175*_x112, -_x114, _x115 - _x117, -_x115 - _x119, _x114, _x117 + _x119], [_x147*(-_x121*_x132 - _x133*_x145), _x147*(_x148*_x38 - _x149*_x56), _x147*(_x150*_x31 - _x151*_x59), _x147*(_x156*(_x152*_x31 + _x153*_x38 - _x155) + _x157*(-_x152*_x59 - _x153*_x56 + 16*_x44*_x62*coeff_fdp)), _x147*(_x156*(-_x158*_x43 - _x160) + _x157*(_x158*_x62 - _x161)), _x147*(-_x128*_x144 + _x130*_x135), _x147*(-_x130*_x141 - _x144*_x162), _x147*(-_x130*_x138 - _x144*_x163), _x147*(_x156*(_x164*_x59 + _x165*_x56 - _x167) + _x157*(_x164*_x31 + _x165*_x38 - _x166)), _x147*(_x156*(-_x161*coeff_fdp + _x167) + _x157*(_x160*coeff_fdp + _x166))], [_x168*(-_x121*_x145 + _x132*_x133), _x168*(_x148*_x56 + _x149*_x38), _x168*(_x150*_x59 + _x151*_x31), _x168*(-_x130*(-_x169*_x59 - _x170*_x56 + 8*_x44*_x62*coeff_fdp) + _x144*(-_x123 + _x169*_x31 + _x170*_x38)), _x168*(-_x130*(-_x134 + _x171*_x62) + _x144*(-_x127 - _x171*_x43)), _x168*(_x128*_x130 + _x135*_x144), _x168*(_x130*_x162 - _x141*_x144), _x168*(_x130*_x163 - _x138*_x144), _x168*(-_x130*(-_x124 + _x162 + _x163) + _x143*_x144), _x168*(-_x129*_x130 + _x144*(-_x135 + _x142))], [0, -_x105*_x172, -1/525*_x105*_x110, 0, (2/175)*_x0*coeff_fdp - 1/525*_x112 - _x113*_x172, 0, -_x173, -_x174, 0, _x173 + _x174]])
+
+
+def yfused(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp):
+    _x0 = numpy.pi**(-1.0)
+    _x1 = (1/12)*_x0
+    _x2 = _x1*coeff_dp**2
+    _x3 = coeff_fdp**2
+    _x4 = _x0*_x3
+    _x5 = _x0*coeff_pdp**2
+    _x6 = _x0*coeff_psp**2
+    _x7 = _x0*coeff_psp
+    _x8 = -eta_psp
+    _x9 = _x8 + eta_pdp
+    _x10 = numpy.cos(_x9)
+    _x11 = (1/45)*_x10
+    _x12 = _x11*_x7
+    _x13 = -eta_sp
+    _x14 = _x13 + eta_pdp
+    _x15 = numpy.sin(_x14)
+    _x16 = 20*coeff_pdp
+    _x17 = _x15*_x16
+    _x18 = _x17*coeff_sp
+    _x19 = _x13 + eta_psp
+    _x20 = numpy.sin(_x19)
+    _x21 = 50*coeff_psp
+    _x22 = _x20*_x21
+    _x23 = _x22*coeff_sp
+    _x24 = _x18 + _x23
+    _x25 = -eta_pdp
+    _x26 = _x25 + eta_dp
+    _x27 = numpy.sin(_x26)
+    _x28 = numpy.sqrt(2)
+    _x29 = _x28*coeff_dp
+    _x30 = 17*_x29
+    _x31 = _x27*_x30
+    _x32 = _x31*coeff_pdp
+    _x33 = _x8 + eta_dp
+    _x34 = numpy.sin(_x33)
+    _x35 = 20*_x29
+    _x36 = _x34*_x35
+    _x37 = _x36*coeff_psp
+    _x38 = eta_dp - eta_fdp
+    _x39 = numpy.sin(_x38)
+    _x40 = numpy.sqrt(3)
+    _x41 = _x40*coeff_fdp
+    _x42 = 12*_x41
+    _x43 = _x39*_x42
+    _x44 = _x43*coeff_dp
+    _x45 = _x32 + _x37 - _x44
+    _x46 = _x24 + _x45
+    _x47 = numpy.cos(_x33)
+    _x48 = _x35*_x47
+    _x49 = _x48*coeff_psp
+    _x50 = numpy.cos(_x26)
+    _x51 = _x30*_x50
+    _x52 = _x51*coeff_pdp
+    _x53 = numpy.cos(_x38)
+    _x54 = _x42*_x53*coeff_dp
+    _x55 = numpy.cos(_x14)
+    _x56 = _x16*_x55
+    _x57 = _x56*coeff_sp
+    _x58 = numpy.cos(_x19)
+    _x59 = _x21*_x58
+    _x60 = _x59*coeff_sp
+    _x61 = _x57 + _x60
+    _x62 = -_x49 - _x52 + _x54 + _x61
+    _x63 = _x46**2 + _x62**2
+    _x64 = numpy.sqrt(_x63)
+    _x65 = (1/300)*_x0
+    _x66 = (2/45)*_x10
+    _x67 = _x66*_x7
+    _x68 = _x13 + eta_dp
+    _x69 = numpy.cos(_x68)
+    _x70 = (1/6)*_x0
+    _x71 = _x70*coeff_sp
+    _x72 = _x29*_x71
+    _x73 = _x0*coeff_pdp
+    _x74 = numpy.sqrt(6)
+    _x75 = _x25 + eta_fdp
+    _x76 = numpy.cos(_x75)
+    _x77 = _x74*_x76
+    _x78 = _x73*_x77
+    _x79 = (2/175)*_x78
+    _x80 = _x8 + eta_fdp
+    _x81 = numpy.cos(_x80)
+    _x82 = (1/70)*_x81
+    _x83 = _x7*_x74
+    _x84 = _x82*_x83
+    _x85 = 8*_x41
+    _x86 = _x39*_x85
+    _x87 = _x86*coeff_dp
+    _x88 = _x13 + eta_fdp
+    _x89 = numpy.sin(_x88)
+    _x90 = 10*_x74
+    _x91 = _x90*coeff_sp
+    _x92 = _x89*_x91
+    _x93 = _x92*coeff_fdp
+    _x94 = _x87 + _x93
+    _x95 = 3*_x27*_x28*coeff_dp*coeff_pdp + 30*_x28*_x34*coeff_dp*coeff_psp - _x94
+    _x96 = numpy.cos(_x88)
+    _x97 = _x91*_x96
+    _x98 = _x97*coeff_fdp
+    _x99 = 3*_x29
+    _x100 = _x99*coeff_pdp
+    _x101 = _x100*_x50
+    _x102 = 30*_x29
+    _x103 = _x102*coeff_psp
+    _x104 = _x103*_x47
+    _x105 = _x53*_x85*coeff_dp
+    _x106 = _x101 + _x104 - _x105
+    _x107 = _x106 + _x98
+    _x108 = -_x107
+    _x109 = _x108**2 + _x95**2
+    _x110 = numpy.sqrt(_x109)
+    _x111 = (1/525)*_x78
+    _x112 = (2/105)*_x81
+    _x113 = _x112*_x83
+    _x114 = _x70*coeff_dp
+    _x115 = _x0*coeff_fdp
+    _x116 = _x7*coeff_pdp*numpy.sin(_x9)
+    _x117 = (1/45)*_x116
+    _x118 = 40*coeff_pdp
+    _x119 = _x118*_x15
+    _x120 = 100*coeff_psp
+    _x121 = _x120*_x20
+    _x122 = (1/2)*_x46
+    _x123 = _x118*_x55
+    _x124 = _x120*_x58
+    _x125 = (1/2)*_x62
+    _x126 = _x65/_x64
+    _x127 = 40*_x29
+    _x128 = _x127*_x34
+    _x129 = _x127*_x47
+    _x130 = 34*_x29
+    _x131 = _x130*_x27
+    _x132 = _x130*_x50
+    _x133 = _x28*coeff_pdp
+    _x134 = 34*_x133
+    _x135 = _x28*coeff_psp
+    _x136 = 40*_x135
+    _x137 = 24*_x41
+    _x138 = _x137*_x39
+    _x139 = _x40*coeff_dp
+    _x140 = 12*_x139
+    _x141 = _x140*_x39
+    _x142 = _x119*coeff_sp
+    _x143 = _x121*coeff_sp
+    _x144 = _x123*coeff_sp
+    _x145 = _x124*coeff_sp
+    _x146 = _x128*coeff_psp
+    _x147 = _x129*coeff_psp
+    _x148 = _x131*coeff_pdp
+    _x149 = _x132*coeff_pdp
+    _x150 = _x63**(-1.0)
+    _x151 = 20*coeff_sp
+    _x152 = 17*_x133
+    _x153 = 20*_x135
+    _x154 = _x28*_x69
+    _x155 = _x115*_x74
+    _x156 = _x72*numpy.sin(_x68)
+    _x157 = (2/45)*_x116
+    _x158 = _x83*coeff_fdp*numpy.sin(_x80)
+    _x159 = (1/70)*_x158
+    _x160 = _x73*_x74*coeff_fdp*numpy.sin(_x75)
+    _x161 = (2/175)*_x160
+    _x162 = _x90*coeff_fdp
+    _x163 = _x162*_x95
+    _x164 = _x108*_x162
+    _x165 = _x65/_x110
+    _x166 = _x102*_x95
+    _x167 = _x102*_x108
+    _x168 = _x95*_x99
+    _x169 = _x108*_x99
+    _x170 = 6*_x133
+    _x171 = 60*_x135
+    _x172 = 16*_x41
+    _x173 = _x172*_x39
+    _x174 = (1/2)*_x95
+    _x175 = (1/2)*_x108
+    _x176 = 16*_x139
+    _x177 = _x151*_x74
+    _x178 = _x177*_x89
+    _x179 = _x177*_x96
+    _x180 = _x103*_x34
+    _x181 = _x100*_x27
+    _x182 = 6*_x29*coeff_pdp
+    _x183 = 60*_x29*coeff_psp
+    _x184 = _x173*coeff_dp
+    _x185 = _x172*_x53*coeff_dp
+    _x186 = _x109**(-1.0)
+    _x187 = 3*_x133
+    _x188 = 30*_x135
+    _x189 = 8*_x139
+    _x190 = (2/105)*_x158
+    _x191 = (1/525)*_x160
+    return (
+        numpy.array([[_x1*coeff_sp**2 + _x12*coeff_pdp + _x2 + (1/150)*_x4 + (17/1800)*_x5 + (1/36)*_x6], [_x64*_x65], [numpy.angle(1j*_x46 + _x62)], [_x2 + (4/525)*_x4 + (7/1800)*_x5 + (1/18)*_x6 + _x67*coeff_pdp - _x69*_x72 - _x79*coeff_fdp - _x84*coeff_fdp], [_x110*_x65], [numpy.angle(-_x107 + 1j*_x95)], [(1/175)*_x0*_x3 - _x111*coeff_fdp - _x113*coeff_fdp]]),
+        numpy.array([[_x71, _x11*_x73 + (1/18)*_x7, _x12 + (17/900)*_x73, _x114, (1/75)*_x115, 0, _x117, -_x117, 0, 0], [_x126*(_x122*(_x119 + _x121) + _x125*(_x123 + _x124)), _x126*(_x122*(_x128 + 100*_x20*coeff_sp) + _x125*(-_x129 + 100*_x58*coeff_sp)), _x126*(_x122*(_x131 + 40*_x15*coeff_sp) + _x125*(-_x132 + 40*_x55*coeff_sp)), _x126*(_x122*(_x134*_x27 + _x136*_x34 - _x138) + _x125*(-_x134*_x50 - _x136*_x47 + 24*_x40*_x53*coeff_fdp)), _x126*(-_x141*_x46 + 12*_x40*_x53*_x62*coeff_dp), _x126*(_x122*(-_x144 - _x145) + _x125*(_x142 + _x143)), _x126*(_x122*(_x145 - _x147) + _x125*(-_x143 - _x146)), _x126*(_x122*(_x144 - _x149) + _x125*(-_x142 - _x148)), _x126*(_x122*(-_x137*_x53*coeff_dp + _x147 + _x149) + _x125*(-_x138*coeff_dp + _x146 + _x148)), _x126*(_x44*_x62 + _x46*_x54)], [_x150*(-_x46*(_x56 + _x59) + _x62*(_x17 + _x22)), _x150*(-_x46*(-_x48 + 50*_x58*coeff_sp) + _x62*(50*_x20*coeff_sp + _x36)), _x150*(-_x46*(-_x51 + 20*_x55*coeff_sp) + _x62*(_x15*_x151 + _x31)), _x150*(-_x46*(-_x152*_x50 - _x153*_x47 + 12*_x40*_x53*coeff_fdp) + _x62*(_x152*_x27 + _x153*_x34 - _x43)), _x150*(-_x140*_x46*_x53 - _x141*_x62), _x150*(-_x24*_x46 - _x61*_x62), _x150*(-_x46*(-_x23 - _x37) + _x62*(-_x49 + _x60)), _x150*(-_x46*(-_x18 - _x32) + _x62*(-_x52 + _x57)), _x150*(-_x45*_x46 + _x62*(_x49 + _x52 - _x54)), _x150*(12*_x40*_x53*_x62*coeff_dp*coeff_fdp - _x44*_x46)], [-_x114*_x154, -_x155*_x82 + _x66*_x73 + (1/9)*_x7, -2/175*_x115*_x77 + _x67 + (7/900)*_x73, _x114 - _x154*_x71, (8/525)*_x0*coeff_fdp - _x79 - _x84, -_x156, _x157 - _x159, -_x157 - _x161, _x156, _x159 + _x161], [_x165*(-_x163*_x89 - _x164*_x96), _x165*(_x166*_x34 - _x167*_x47), _x165*(_x168*_x27 - _x169*_x50), _x165*(_x174*(_x170*_x27 + _x171*_x34 - _x173) + _x175*(-_x170*_x50 - _x171*_x47 + 16*_x40*_x53*coeff_fdp)), _x165*(_x174*(-_x176*_x39 - _x178) + _x175*(_x176*_x53 - _x179)), _x165*(-_x108*_x93 + _x95*_x98), _x165*(-_x104*_x95 - _x108*_x180), _x165*(-_x101*_x95 - _x108*_x181), _x165*(_x174*(_x182*_x50 + _x183*_x47 - _x185) + _x175*(_x182*_x27 + _x183*_x34 - _x184)), _x165*(_x174*(-_x179*coeff_fdp + _x185) + _x175*(_x178*coeff_fdp + _x184))], [_x186*(_x163*_x96 - _x164*_x89), _x186*(_x166*_x47 + _x167*_x34), _x186*(_x168*_x50 + _x169*_x27), _x186*(_x108*(_x187*_x27 + _x188*_x34 - _x86) - _x95*(-_x187*_x50 - _x188*_x47 + 8*_x40*_x53*coeff_fdp)), _x186*(_x108*(-_x189*_x39 - _x92) - _x95*(_x189*_x53 - _x97)), _x186*(_x108*_x98 + _x93*_x95), _x186*(-_x104*_x108 + _x180*_x95), _x186*(-_x101*_x108 + _x181*_x95), _x186*(_x106*_x108 - _x95*(_x180 + _x181 - _x87)), _x186*(_x108*(_x105 - _x98) - _x94*_x95)], [0, -_x112*_x155, -1/525*_x155*_x76, 0, (2/175)*_x0*coeff_fdp - _x111 - _x113, 0, -_x190, -_x191, 0, _x190 + _x191]]),
+    )
+
+
+def ymat_vectorized(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp):
+    _x0 = numpy.pi**(-1.0)
+    _x1 = (1/12)*_x0
+    _x2 = _x1*coeff_dp**2
+    _x3 = coeff_fdp**2
+    _x4 = _x0*_x3
+    _x5 = _x0*coeff_pdp**2
+    _x6 = _x0*coeff_psp**2
+    _x7 = -eta_psp
+    _x8 = _x0*coeff_pdp
+    _x9 = _x8*coeff_psp*numpy.cos(_x7 + eta_pdp)
+    _x10 = -eta_sp
+    _x11 = _x10 + eta_pdp
+    _x12 = 20*coeff_pdp*coeff_sp
+    _x13 = _x10 + eta_psp
+    _x14 = 50*coeff_psp*coeff_sp
+    _x15 = -eta_pdp
+    _x16 = _x15 + eta_dp
+    _x17 = numpy.sin(_x16)
+    _x18 = numpy.sqrt(2)
+    _x19 = _x18*coeff_dp
+    _x20 = _x19*coeff_pdp
+    _x21 = 17*_x20
+    _x22 = _x7 + eta_dp
+    _x23 = numpy.sin(_x22)
+    _x24 = _x19*coeff_psp
+    _x25 = 20*_x24
+    _x26 = eta_dp - eta_fdp
+    _x27 = numpy.sin(_x26)
+    _x28 = numpy.sqrt(3)
+    _x29 = _x28*coeff_dp*coeff_fdp
+    _x30 = 12*_x29
+    _x31 = _x12*numpy.sin(_x11) + _x14*numpy.sin(_x13) + _x17*_x21 + _x23*_x25 - _x27*_x30
+    _x32 = numpy.cos(_x16)
+    _x33 = numpy.cos(_x22)
+    _x34 = numpy.cos(_x26)
+    _x35 = _x12*numpy.cos(_x11) + _x14*numpy.cos(_x13) - _x21*_x32 - _x25*_x33 + _x30*_x34
+    _x36 = (1/300)*_x0
+    _x37 = numpy.sqrt(6)*coeff_fdp
+    _x38 = _x37*_x8*numpy.cos(_x15 + eta_fdp)
+    _x39 = _x0*_x37*coeff_psp*numpy.cos(_x7 + eta_fdp)
+    _x40 = _x10 + eta_fdp
+    _x41 = 10*_x37*coeff_sp
+    _x42 = 3*_x17*_x18*coeff_dp*coeff_pdp + 30*_x18*_x23*coeff_dp*coeff_psp - 8*_x27*_x29 - _x41*numpy.sin(_x40)
+    _x43 = 3*_x20*_x32 + 30*_x24*_x33 - 8*_x28*_x34*coeff_dp*coeff_fdp + _x41*numpy.cos(_x40)
+    _shape = numpy.broadcast(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp).shape
+    return numpy.array([numpy.broadcast_to(_e, _shape) for _e in (_x1*coeff_sp**2 + _x2 + (1/150)*_x4 + (17/1800)*_x5 + (1/36)*_x6 + (1/45)*_x9, _x36*numpy.sqrt(_x31**2 + _x35**2), numpy.angle(1j*_x31 + _x35), -1/6*_x0*_x19*coeff_sp*numpy.cos(_x10 + eta_dp) + _x2 - 2/175*_x38 - 1/70*_x39 + (4/525)*_x4 + (7/1800)*_x5 + (1/18)*_x6 + (2/45)*_x9, _x36*numpy.sqrt(_x42**2 + _x43**2), numpy.angle(1j*_x42 - _x43), (1/175)*_x0*_x3 - 1/525*_x38 - 2/105*_x39,)], dtype=float).reshape((7, 1) + _shape)
+
+
+def yjacmat_vectorized(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp):
+    _x0 = numpy.pi**(-1.0)
+    _x1 = (1/6)*_x0
+    _x2 = _x1*coeff_sp
+    _x3 = _x0*coeff_psp
+    _x4 = _x0*coeff_pdp
+    _x5 = -eta_psp
+    _x6 = _x5 + eta_pdp
+    _x7 = numpy.cos(_x6)
+    _x8 = (1/45)*_x7
+    _x9 = _x1*coeff_dp
+    _x10 = _x0*coeff_fdp
+    _x11 = _x3*coeff_pdp*numpy.sin(_x6)
+    _x12 = (1/45)*_x11
+    _x13 = -eta_sp
+    _x14 = _x13 + eta_pdp
+    _x15 = numpy.sin(_x14)
+    _x16 = 40*coeff_pdp
+    _x17 = _x15*_x16
+    _x18 = _x13 + eta_psp
+    _x19 = numpy.sin(_x18)
+    _x20 = 100*coeff_psp
+    _x21 = _x19*_x20
+    _x22 = 20*coeff_pdp
+    _x23 = _x15*_x22
+    _x24 = _x23*coeff_sp
+    _x25 = 50*coeff_psp
+    _x26 = _x19*_x25
+    _x27 = _x26*coeff_sp
+    _x28 = _x24 + _x27
+    _x29 = -eta_pdp
+    _x30 = _x29 + eta_dp
+    _x31 = numpy.sin(_x30)
+    _x32 = numpy.sqrt(2)
+    _x33 = _x32*coeff_dp
+    _x34 = 17*_x33
+    _x35 = _x31*_x34
+    _x36 = _x35*coeff_pdp
+    _x37 = _x5 + eta_dp
+    _x38 = numpy.sin(_x37)
+    _x39 = 20*_x33
+    _x40 = _x38*_x39
+    _x41 = _x40*coeff_psp
+    _x42 = eta_dp - eta_fdp
+    _x43 = numpy.sin(_x42)
+    _x44 = numpy.sqrt(3)
+    _x45 = _x44*coeff_fdp
+    _x46 = 12*_x45
+    _x47 = _x43*_x46
+    _x48 = _x47*coeff_dp
+    _x49 = _x36 + _x41 - _x48
+    _x50 = _x28 + _x49
+    _x51 = (1/2)*_x50
+    _x52 = numpy.cos(_x14)
+    _x53 = _x16*_x52
+    _x54 = numpy.cos(_x18)
+    _x55 = _x20*_x54
+    _x56 = numpy.cos(_x37)
+    _x57 = _x39*_x56
+    _x58 = _x57*coeff_psp
+    _x59 = numpy.cos(_x30)
+    _x60 = _x34*_x59
+    _x61 = _x60*coeff_pdp
+    _x62 = numpy.cos(_x42)
+    _x63 = _x46*_x62*coeff_dp
+    _x64 = _x22*_x52
+    _x65 = _x64*coeff_sp
+    _x66 = _x25*_x54
+    _x67 = _x66*coeff_sp
+    _x68 = _x65 + _x67
+    _x69 = -_x58 - _x61 + _x63 + _x68
+    _x70 = (1/2)*_x69
+    _x71 = _x50**2 + _x69**2
+    _x72 = (1/300)*_x0
+    _x73 = _x72/numpy.sqrt(_x71)
+    _x74 = 40*_x33
+    _x75 = _x38*_x74
+    _x76 = _x56*_x74
+    _x77 = 34*_x33
+    _x78 = _x31*_x77
+    _x79 = _x59*_x77
+    _x80 = _x32*coeff_pdp
+    _x81 = 34*_x80
+    _x82 = _x32*coeff_psp
+    _x83 = 40*_x82
+    _x84 = 24*_x45
+    _x85 = _x43*_x84
+    _x86 = _x44*coeff_dp
+    _x87 = 12*_x86
+    _x88 = _x43*_x87
+    _x89 = _x17*coeff_sp
+    _x90 = _x21*coeff_sp
+    _x91 = _x53*coeff_sp
+    _x92 = _x55*coeff_sp
+    _x93 = _x75*coeff_psp
+    _x94 = _x76*coeff_psp
+    _x95 = _x78*coeff_pdp
+    _x96 = _x79*coeff_pdp
+    _x97 = _x71**(-1.0)
+    _x98 = 20*coeff_sp
+    _x99 = 17*_x80
+    _x100 = 20*_x82
+    _x101 = _x13 + eta_dp
+    _x102 = _x32*numpy.cos(_x101)
+    _x103 = (2/45)*_x7
+    _x104 = numpy.sqrt(6)
+    _x105 = _x10*_x104
+    _x106 = _x5 + eta_fdp
+    _x107 = numpy.cos(_x106)
+    _x108 = (1/70)*_x107
+    _x109 = _x29 + eta_fdp
+    _x110 = numpy.cos(_x109)
+    _x111 = _x104*_x110
+    _x112 = _x111*_x4
+    _x113 = _x104*_x3
+    _x114 = _x2*_x33*numpy.sin(_x101)
+    _x115 = (2/45)*_x11
+    _x116 = _x113*coeff_fdp*numpy.sin(_x106)
+    _x117 = (1/70)*_x116
+    _x118 = _x104*_x4*coeff_fdp*numpy.sin(_x109)
+    _x119 = (2/175)*_x118
+    _x120 = _x13 + eta_fdp
+    _x121 = numpy.sin(_x120)
+    _x122 = 8*_x45
+    _x123 = _x122*_x43
+    _x124 = _x123*coeff_dp
+    _x125 = 10*_x104
+    _x126 = _x125*coeff_sp
+    _x127 = _x121*_x126
+    _x128 = _x127*coeff_fdp
+    _x129 = _x124 + _x128
+    _x130 = -_x129 + 3*_x31*_x32*coeff_dp*coeff_pdp + 30*_x32*_x38*coeff_dp*coeff_psp
+    _x131 = _x125*coeff_fdp
+    _x132 = _x130*_x131
+    _x133 = numpy.cos(_x120)
+    _x134 = _x126*_x133
+    _x135 = _x134*coeff_fdp
+    _x136 = 3*_x33
+    _x137 = _x136*coeff_pdp
+    _x138 = _x137*_x59
+    _x139 = 30*_x33
+    _x140 = _x139*coeff_psp
+    _x141 = _x140*_x56
+    _x142 = _x122*_x62*coeff_dp
+    _x143 = _x138 + _x141 - _x142
+    _x144 = -_x135 - _x143
+    _x145 = _x131*_x144
+    _x146 = _x130**2 + _x144**2
+    _x147 = _x72/numpy.sqrt(_x146)
+    _x148 = _x130*_x139
+    _x149 = _x139*_x144
+    _x150 = _x130*_x136
+    _x151 = _x136*_x144
+    _x152 = 6*_x80
+    _x153 = 60*_x82
+    _x154 = 16*_x45
+    _x155 = _x154*_x43
+    _x156 = (1/2)*_x130
+    _x157 = (1/2)*_x144
+    _x158 = 16*_x86
+    _x159 = _x104*_x98
+    _x160 = _x121*_x159
+    _x161 = _x133*_x159
+    _x162 = _x140*_x38
+    _x163 = _x137*_x31
+    _x164 = 6*_x33*coeff_pdp
+    _x165 = 60*_x33*coeff_psp
+    _x166 = _x155*coeff_dp
+    _x167 = _x154*_x62*coeff_dp
+    _x168 = _x146**(-1.0)
+    _x169 = 3*_x80
+    _x170 = 30*_x82
+    _x171 = 8*_x86
+    _x172 = (2/105)*_x107
+    _x173 = (2/105)*_x116
+    _x174 = (1/525)*_x118
+    _shape = numpy.broadcast(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp).shape
+    return numpy.array([numpy.broadcast_to(_e, _shape) for _e in (_x2, (1/18)*_x3 + _x4*_x8, _x3*_x8 + (17/900)*_x4, _x9, (1/75)*_x10, 0, _x12, -_x12, 0, 0, _x73*(_x51*(_x17 + _x21) + _x70*(_x53 + _x55)), _x73*(_x51*(100*_x19*coeff_sp + _x75) + _x70*(100*_x54*coeff_sp - _x76)), _x73*(_x51*(40*_x15*coeff_sp + _x78) + _x70*(40*_x52*coeff_sp - _x79)), _x73*(_x51*(_x31*_x81 + _x38*_x83 - _x85) + _x70*(24*_x44*_x62*coeff_fdp - _x56*_x83 - _x59*_x81)), _x73*(12*_x44*_x62*_x69*coeff_dp - _x50*_x88), _x73*(_x51*(-_x91 - _x92) + _x70*(_x89 + _x90)), _x73*(_x51*(_x92 - _x94) + _x70*(-_x90 - _x93)), _x73*(_x51*(_x91 - _x96) + _x70*(-_x89 - _x95)), _x73*(_x51*(-_x62*_x84*coeff_dp + _x94 + _x96) + _x70*(-_x85*coeff_dp + _x93 + _x95)), _x73*(_x48*_x69 + _x50*_x63), _x97*(-_x50*(_x64 + _x66) + _x69*(_x23 + _x26)), _x97*(-_x50*(50*_x54*coeff_sp - _x57) + _x69*(50*_x19*coeff_sp + _x40)), _x97*(-_x50*(20*_x52*coeff_sp - _x60) + _x69*(_x15*_x98 + _x35)), _x97*(-_x50*(-_x100*_x56 + 12*_x44*_x62*coeff_fdp - _x59*_x99) + _x69*(_x100*_x38 + _x31*_x99 - _x47)), _x97*(-_x50*_x62*_x87 - _x69*_x88), _x97*(-_x28*_x50 - _x68*_x69), _x97*(-_x50*(-_x27 - _x41) + _x69*(-_x58 + _x67)), _x97*(-_x50*(-_x24 - _x36) + _x69*(-_x61 + _x65)), _x97*(-_x49*_x50 + _x69*(_x58 + _x61 - _x63)), _x97*(12*_x44*_x62*_x69*coeff_dp*coeff_fdp - _x48*_x50), -_x102*_x9, _x103*_x4 - _x105*_x108 + (1/9)*_x3, -2/175*_x10*_x111 + _x103*_x3 + (7/900)*_x4, -_x102*_x2 + _x9, (8/525)*_x0*coeff_fdp - _x108*_x113 - 2/175*_x112, -_x114, _x115 - _x117, -_x115 - _x119, _x114, _x117 + _x119, _x147*(-_x121*_x132 - _x133*_x145), _x147*(_x148*_x38 - _x149*_x56), _x147*(_x150*_x31 - _x151*_x59), _x147*(_x156*(_x152*_x31 + _x153*_x38 - _x155) + _x157*(-_x152*_x59 - _x153*_x56 + 16*_x44*_x62*coeff_fdp)), _x147*(_x156*(-_x158*_x43 - _x160) + _x157*(_x158*_x62 - _x161)), _x147*(-_x128*_x144 + _x130*_x135), _x147*(-_x130*_x141 - _x144*_x162), _x147*(-_x130*_x138 - _x144*_x163), _x147*(_x156*(_x164*_x59 + _x165*_x56 - _x167) + _x157*(_x164*_x31 + _x165*_x38 - _x166)), _x147*(_x156*(-_x161*coeff_fdp + _x167) + _x157*(_x160*coeff_fdp + _x166)), _x168*(-_x121*_x145 + _x132*_x133), _x168*(_x148*_x56 + _x149*_x38), _x168*(_x150*_x59 + _x151*_x31), _x168*(-_x130*(-_x169*_x59 - _x170*_x56 + 8*_x44*_x62*coeff_fdp) + _x144*(-_x123 + _x169*_x31 + _x170*_x38)), _x168*(-_x130*(-_x134 + _x171*_x62) + _x144*(-_x127 - _x171*_x43)), _x168*(_x128*_x130 + _x135*_x144), _x168*(_x130*_x162 - _x141*_x144), _x168*(_x130*_x163 - _x138*_x144), _x168*(-_x130*(-_x124 + _x162 + _x163) + _x143*_x144), _x168*(-_x129*_x130 + _x144*(-_x135 + _x142)), 0, -_x105*_x172, -1/525*_x105*_x110, 0, (2/175)*_x0*coeff_fdp - 1/525*_x112 - _x113*_x172, 0, -_x173, -_x174, 0, _x173 + _x174,)], dtype=float).reshape((7, 10) + _shape)
+
+
+def ymat_pretty(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp):
+    ret = allmat(coeff_sp, coeff_psp, coeff_pdp, coeff_dp, coeff_fdp, eta_sp, eta_psp, eta_pdp, eta_dp, eta_fdp)
+    return {k.name.lower(): v for k, v in zip(AllKeys, ret[:, 0])}
@@ -0,0 +1,100 @@
+"""
+Closed-form helium beta parameters and their jacobian, written by hand from the solved He PAD equations.
+All the functions broadcast over their arguments; pass arrays to evaluate many points at once.
+"""
+import cmath
+from math import pi, sqrt
+from typing import Tuple
+
+import numpy
+from numpy import ndarray, array, broadcast, broadcast_to
+
+from ._generated.helium import XKeys, YKeys
+
+
+__all__ = [
+    'XKeys',
+    'YKeys',
+    'ymat',
+    'yjacmat',
+    'yfused',
+]
+
+
+def filled(rows: list, shape: tuple) -> ndarray:
+    if shape == ():
+        return array(rows, dtype=float)
+    return array([[broadcast_to(e, shape) for e in row] for row in rows], dtype=float)
+
+
+def evaluate(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d, jacobian: bool) -> Tuple[ndarray, ...]:
+    shape = broadcast(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d).shape
+    if shape == ():  # Python floats are much faster than 0-d arrays
+        cs, cp, cd, es, ep, ed = map(float, (coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d))
+        cexp, carg = cmath.exp, cmath.phase
+    else:
+        cs, cp, cd, es, ep, ed = coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d
+        cexp, carg = numpy.exp, numpy.angle
+
+    # b1 is cp |w| cos(phi - arg(w exp(-i eta_p))) / (10 pi)
+    ws, wd = 5 * sqrt(3) * cexp(1j * es), 2 * sqrt(15) * cexp(1j * ed)
+    w = cs * ws + cd * wd
+    wabs = abs(w)
+    ds = cexp(1j * (ed - es))
+    y = [
+        [(cs ** 2 + cp ** 2 + cd ** 2) / (4 * pi)],
+        [cp * wabs / (10 * pi)],
+        [carg(w * cexp(-1j * ep))],
+        [(5 * cd ** 2 + 7 * sqrt(5) * cd * cs * ds.real + 7 * cp ** 2) / (14 * pi)],
+        [3 * sqrt(15) * cd * cp / (10 * pi)],
+        [carg(cexp(1j * (ed - ep)))],
+        [9 * cd ** 2 / (14 * pi)],
+    ]
+    if not jacobian:
+        return filled(y, shape),
+
+    # d|w| = Re(conj(w) dw) / |w| and d(arg w) = Im(dw / w); by coeff_s, coeff_d, eta_s and eta_d
+    dw = ws, wd, 1j * cs * ws, 1j * cd * wd
+    damp = [cp * (w.conjugate() * d).real / wabs / (10 * pi) for d in dw]
+    dshift = [(d / w).imag for d in dw]
+    jac = [  # columns: coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d
+        [cs / (2 * pi), cp / (2 * pi), cd / (2 * pi), 0, 0, 0],
+        [damp[0], wabs / (10 * pi), damp[1], damp[2], 0, damp[3]],
+        [dshift[0], 0, dshift[1], dshift[2], -1, dshift[3]],
+        [sqrt(5) * cd * ds.real / (2 * pi),
+         cp / pi,
+         (10 * cd + 7 * sqrt(5) * cs * ds.real) / (14 * pi),
+         sqrt(5) * cd * cs * ds.imag / (2 * pi),
+         0,
+         -sqrt(5) * cd * cs * ds.imag / (2 * pi)],
+        [0, 3 * sqrt(15) * cd / (10 * pi), 3 * sqrt(15) * cp / (10 * pi), 0, 0, 0],
+        [0, 0, 0, 0, -1, 1],
+        [0, 0, 9 * cd / (7 * pi), 0, 0, 0],
+    ]
+    return filled(y, shape), filled(jac, shape)
+
+
+def yfused(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d) -> Tuple[ndarray, ndarray]:
+    """
+    Beta parameters b0, b1_amp, b1_shift, b2, b3_amp, b3_shift, b4 and their jacobian
+    :return: Arrays of shapes (7, 1, ...) and (7, 6, ...)
+    """
+    return evaluate(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d, jacobian=True)
+
+
+def ymat(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d) -> ndarray:
+    """
+    Beta parameters b0, b1_amp, b1_shift, b2, b3_amp, b3_shift, b4
+    :return: Array of shape (7, 1, ...)
+    """
+    ret, = evaluate(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d, jacobian=False)
+    return ret
+
+
+def yjacmat(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d) -> ndarray:
+    """
+    Jacobian of the beta parameters
+    :return: Array of shape (7, 6, ...)
+    """
+    _, ret = yfused(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d)
+    return ret
@@ -0,0 +1,88 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Sequence, Optional, Tuple, List
+
+from numpy import ndarray, array, asarray, array_split, where, percentile, pi
+from numpy.random import default_rng
+from pandas import DataFrame
+
+from .fit_pad import TargetPad
+from .multistart import fit_from
+
+
+__all__ = [
+    'resample_zintercepts',
+    'bootstrap_fit',
+    'percentile_intervals',
+]
+
+
+def resample_zintercepts(pad: TargetPad, n_samples: int, seed: Optional[int] = None) -> ndarray:
+    """
+    Resample the measured betas of a target, as normal deviates within their errors
+    :param pad: Target PAD whose betas are resampled; it must be made with the *_err keyword arguments
+    :param n_samples: Number of resampled sets
+    :param seed: Seed of the random generator
+    :return: Resampled betas; shape: (n_samples, z)
+    """
+    if not pad.zerror[1:].all():
+        raise ValueError('Target has no errors of the measured betas to resample from!')
+    rng = default_rng(seed)
+    return pad.zintercept + pad.zerror * rng.standard_normal((n_samples, pad.zintercept.size))
+
+
+def fit_resampled(pad: TargetPad, x0: ndarray, bounds: Tuple[Sequence[float], Sequence[float]],
+                  zintercepts: ndarray, kwargs: dict) -> List[dict]:
+    return [fit_from(pad.with_zintercept(z), x0, bounds, kwargs) for z in zintercepts]
+
+
+def bootstrap_fit(pad: TargetPad, x0: Sequence[float], bounds: Tuple[Sequence[float], Sequence[float]],
+                  n_samples: int = 1000, workers: Optional[int] = None, seed: Optional[int] = 0,
+                  **kwargs) -> DataFrame:
+    """
+    Refit a PAD to betas resampled within their errors, in parallel. Each refit starts from the nominal solution
+    :param pad: Target PAD to fit; it must be made with the *_err keyword arguments
+    :param x0: Nominal solution of the varying x parameters
+    :param bounds: Lower and upper bounds of the varying x parameters, as passed to scipy.optimize.least_squares
+    :param n_samples: Number of resampled sets of betas
+    :param workers: Number of worker processes. Fits run in this process if it is 1
+    :param seed: Seed of the random generator. The resampled betas depend only on it, not on the workers
+    :param kwargs: Keyword arguments which pass to function scipy.optimize.least_squares
+    :return: Fitted parameters of every resampled set, with phases unwrapped to the nearest of the nominal ones.
+        A refit which raised has cost inf and success False, see function multistart.fit_from; ValueError is raised
+        if none of the refits succeeded
+    """
+    x0 = asarray(x0, dtype=float)
+    zintercepts = resample_zintercepts(pad, n_samples, seed=seed)
+    if workers == 1:
+        fitted = fit_resampled(pad, x0, bounds, zintercepts, kwargs)
+    else:
+        chunks = array_split(zintercepts, max(1, min(n_samples, 4 * (workers or 8))))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            fitted = [d for ds in executor.map(fit_resampled, repeat(pad), repeat(x0), repeat(bounds),
+                                               chunks, repeat(kwargs))
+                      for d in ds]
+    if not any(d['success'] for d in fitted):
+        raise ValueError('None of the {} refits succeeded!'.format(n_samples))
+
+    xkeys = [k for k in pad.XKEYS if k not in pad.xfixed]
+    is_phase = array([k.name.startswith('ETA_') for k in xkeys])
+    return DataFrame([{
+        **{k.name.lower(): v
+           for k, v in zip(xkeys, where(is_phase, x0 + (d['x'] - x0 + pi) % (2 * pi) - pi, d['x']))},
+        'cost': d['cost'],
+        'nfev': d['nfev'],
+        'success': d['success'],
+    } for d in fitted])
+
+
+def percentile_intervals(fitted: DataFrame, q: Sequence[float] = (2.5, 50, 97.5)) -> DataFrame:
+    """
+    Percentiles of the bootstrapped parameters, over the successful refits
+    :param fitted: Returned by function bootstrap_fit
+    :param q: Percentiles to compute
+    :return: Percentiles of each parameter; index: parameter names, columns: the percentiles
+    """
+    names = [k for k in fitted.columns if k not in {'cost', 'nfev', 'success'}]
+    succeeded = fitted.loc[fitted['success'], names]
+    return DataFrame(percentile(succeeded.values, q, axis=0).T, index=names, columns=['p{:g}'.format(p) for p in q])
@@ -0,0 +1,74 @@
+from enum import EnumMeta
+from hashlib import sha256
+from inspect import getsource
+from os import environ, makedirs, fdopen, replace, remove
+from os.path import join, expanduser, isfile
+from tempfile import mkstemp
+from typing import Callable, Union
+
+import cloudpickle
+from cloudpickle import dump, load
+
+
+__all__ = [
+    'cache_dir',
+    'cache_key',
+    'cached',
+]
+
+
+def cache_dir() -> str:
+    """
+    Directory of the cache, shared by all processes regardless of their working directory.
+    Set environment variable PADTOOLS_CACHE to override it
+    """
+    return environ.get('PADTOOLS_CACHE', join(expanduser('~'), '.cache', 'padtools'))
+
+
+def cache_key(*parts: Union[str, EnumMeta, Callable]) -> str:
+    """
+    Hash of the given parts and the version of the pickler. Enums are hashed by their members, and modules,
+    classes and functions by their source, so that a key changes with the code building the cached object
+    """
+    h = sha256()
+    for p in (cloudpickle.__version__, *parts):
+        if isinstance(p, EnumMeta):
+            p = '{}({})'.format(p.__qualname__, ', '.join('{}={!r}'.format(k.name, k.value) for k in p))
+        elif not isinstance(p, str):
+            p = getsource(p)
+        h.update(p.encode())
+        h.update(b'\0')
+    return h.hexdigest()[:16]
+
+
+def cached(name: str, key: str, build: Callable[[], dict]) -> dict:
+    """
+    Load a dict stored as {name}-{key}.db in the cache directory, or build and store it.
+    The file is written to a temporary file first and renamed, so concurrent readers
+    never see a partial file and concurrent writers just overwrite each other with the same content
+    :param name: Name of the cached object
+    :param key: Content address of the object; see function cache_key
+    :param build: Function building the object on a cache miss
+    :return: Cached object
+    """
+    directory = cache_dir()
+    filename = join(directory, '{}-{}.db'.format(name, key))
+    if isfile(filename):
+        try:
+            with open(filename, 'rb') as f:
+                return load(f)
+        except Exception as err:
+            print("Fail to load {} ({!r}). Build it again...".format(filename, err))
+
+    ret = build()
+    makedirs(directory, exist_ok=True)
+    fd, tmp = mkstemp(dir=directory, prefix='{}-{}.'.format(name, key), suffix='.tmp')
+    try:
+        with fdopen(fd, 'wb') as f:
+            print("Storing the answer...")
+            dump(ret, f)
+        replace(tmp, filename)
+    except BaseException:
+        remove(tmp)
+        raise
+    return ret
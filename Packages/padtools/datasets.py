@@ -0,0 +1,83 @@
+"""
+Cached loader of the Excel reference tables, such as "Data/Ne betas - TDHF 2018-09-17.xlsx".
+Each sheet is parsed by openpyxl once and stored as a Parquet file in the cache directory, keyed by the content of
+the workbook, so that later loads, also from other processes, read the Parquet file instead.
+Sheets which Parquet can not store as they are, such as ones with columns of mixed types, are pickled instead.
+"""
+from hashlib import sha256
+from os import makedirs, replace, remove, close
+from os.path import join, abspath, getmtime, getsize
+from tempfile import mkstemp
+from typing import Callable, Optional, Union
+
+from pandas import DataFrame, read_excel, read_parquet, read_pickle
+from pyarrow import ArrowException
+
+from .cache import cache_dir, cache_key
+
+
+__all__ = [
+    'first',
+    'load_excel',
+]
+
+
+def first(key: str) -> str:
+    """
+    First word of a column name, such as 'coeff_s' of 'coeff_s (au)'
+    """
+    return key.split()[0]
+
+
+_hashed = {}
+
+
+def _content_hash(filename: str) -> str:
+    # files are hashed again only if they are touched
+    at = abspath(filename), getmtime(filename), getsize(filename)
+    if at not in _hashed:
+        with open(filename, 'rb') as f:
+            _hashed[at] = sha256(f.read()).hexdigest()
+    return _hashed[at]
+
+
+def load_excel(filename: str, sheet_name: Union[str, int] = 0, rename: Optional[Callable[[str], str]] = None,
+               **kwargs) -> DataFrame:
+    """
+    Load a sheet of an Excel workbook through its Parquet copy in the cache directory
+    :param filename: Excel workbook
+    :param sheet_name: Name or position of the sheet
+    :param rename: Function renaming the columns, such as function first
+    :param kwargs: Keyword arguments which pass to function pandas.read_excel
+    :return: Sheet
+    """
+    key = cache_key(_content_hash(filename), repr(sheet_name), repr(sorted(kwargs.items())))
+    directory = join(cache_dir(), 'datasets')
+    for ext, read in (('parquet', read_parquet), ('pkl', read_pickle)):
+        try:
+            df = read(join(directory, '{}.{}'.format(key, ext)))
+            break
+        except (OSError, ValueError):
+            pass
+    else:
+        df = read_excel(filename, sheet_name=sheet_name, **kwargs)
+        makedirs(directory, exist_ok=True)
+        if all(isinstance(k, str) for k in df.columns):
+            try:
+                _store(df, directory, key, 'parquet', df.to_parquet)
+            except (ValueError, TypeError, ArrowException):  # such as object columns of mixed types
+                _store(df, directory, key, 'pkl', df.to_pickle)
+        else:  # Parquet stores column names as strings
+            _store(df, directory, key, 'pkl', df.to_pickle)
+    return df if rename is None else df.rename(rename, axis='columns')
+
+
+def _store(df: DataFrame, directory: str, key: str, ext: str, write: Callable[[str], None]) -> None:
+    fd, tmp = mkstemp(dir=directory, prefix='{}.'.format(key), suffix='.tmp')
+    close(fd)
+    try:
+        write(tmp)
+        replace(tmp, join(directory, '{}.{}'.format(key, ext)))
+    except BaseException:
+        remove(tmp)
+        raise
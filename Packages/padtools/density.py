@@ -0,0 +1,155 @@
+"""
+Binary store of the TDCASSCF photoelectron density files, "Data/Ne photoelectron density - TDCASSCF - G*.json".
+Each JSON file is converted once to a directory of .npy arrays with a small JSON index, which is memory-mapped
+on load instead of parsing the text again.
+
+Example:
+    python -m padtools.density "Data/Ne photoelectron density - TDCASSCF - G"*.json
+"""
+from argparse import ArgumentParser
+from json import load as load_json, dump as dump_json
+from os import makedirs, replace, stat
+from os.path import join, isdir, basename, splitext, abspath, dirname
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import NamedTuple, Optional, Iterator
+
+from numpy import ndarray, array, save, load as load_npy
+
+from .cache import cache_dir, cache_key
+from .jsonstream import iter_data
+
+
+__all__ = [
+    'DensityGroup',
+    'convert',
+    'load',
+    'load_cached',
+    'iter_density_frames',
+]
+
+
+AXES = {
+    'mag_q_num': 'Mag q num',
+    'momentum': 'Momentum (au)',
+    'polar_ang': 'Polar ang (rad)',
+}
+
+
+class DensityGroup(NamedTuple):
+    group: str
+    photon_energy: ndarray  # shape: (n,)
+    opt_phase: ndarray  # shape: (n,); in deg
+    mag_q_num: ndarray  # shape: (q,)
+    momentum: ndarray  # shape: (r,); in au
+    polar_ang: ndarray  # shape: (theta,); in rad
+    density: ndarray  # shape: (n, q, r, theta)
+
+
+def convert(filename: str, to: str) -> None:
+    """
+    Convert a TDCASSCF photoelectron density JSON file to a directory of .npy arrays.
+    All entries of the file must share the same axes. The directory is written next to its final place and renamed,
+    so readers never see a partial one
+    :param filename: JSON file to convert
+    :param to: Directory to write; it is replaced if it exists
+    """
+    with open(filename, 'r') as f:
+        data = load_json(f)
+
+    first, *_ = data['Data']
+    axes = {k: array(first[v]['Values']) for k, v in AXES.items()}
+    for d in data['Data']:
+        for k, v in AXES.items():
+            if not (array(d[v]['Values']) == axes[k]).all():
+                raise ValueError('Entries of {} have different {} axes!'.format(filename, v))
+        if d['Density']['indexes'] != list(AXES.values()):
+            raise ValueError('Density of {} is indexed by {}!'.format(filename, d['Density']['indexes']))
+    density = array([d['Density']['Values'] for d in data['Data']], dtype=float)
+
+    parent = dirname(abspath(to))
+    makedirs(parent, exist_ok=True)
+    tmp = mkdtemp(dir=parent, prefix='{}.'.format(basename(to)), suffix='.tmp')
+    try:
+        with open(join(tmp, 'index.json'), 'w') as f:
+            dump_json({
+                'Group': data['Group'],
+                'Photon energy (eV)': [d['Photon energy (eV)'] for d in data['Data']],
+                'Opt phase (deg)': [d['Opt phase (deg)'] for d in data['Data']],
+            }, f)
+        for k, v in axes.items():
+            save(join(tmp, '{}.npy'.format(k)), v)
+        save(join(tmp, 'density.npy'), density)
+        if isdir(to):
+            rmtree(to)
+        replace(tmp, to)
+    except BaseException:
+        rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def load(directory: str, mmap_mode: Optional[str] = 'r') -> DensityGroup:
+    """
+    Load a directory written by function convert
+    :param directory: Directory to load
+    :param mmap_mode: Passed to numpy.load for the density; None reads it into memory
+    :return: Density of a group and its axes
+    """
+    with open(join(directory, 'index.json'), 'r') as f:
+        index = load_json(f)
+    return DensityGroup(
+        group=index['Group'],
+        photon_energy=array(index['Photon energy (eV)'], dtype=float),
+        opt_phase=array(index['Opt phase (deg)'], dtype=float),
+        **{k: load_npy(join(directory, '{}.npy'.format(k))) for k in AXES},
+        density=load_npy(join(directory, 'density.npy'), mmap_mode=mmap_mode),
+    )
+
+
+def load_cached(filename: str, mmap_mode: Optional[str] = 'r') -> DensityGroup:
+    """
+    Load a TDCASSCF photoelectron density JSON file through its binary copy in the cache directory,
+    converting it first if the JSON file is new or has changed since
+    :param filename: JSON file to load
+    :param mmap_mode: Passed to numpy.load for the density; None reads it into memory
+    :return: Density of a group and its axes
+    """
+    st = stat(filename)
+    key = cache_key(abspath(filename), str(st.st_size), str(st.st_mtime_ns))
+    directory = join(cache_dir(), 'density', '{}-{}'.format(splitext(basename(filename))[0], key))
+    if not isdir(directory):
+        print("Converting {}...".format(filename))
+        convert(filename, directory)
+    return load(directory, mmap_mode=mmap_mode)
+
+
+def iter_density_frames(filename: str, photon: float = None, phase: float = None) -> Iterator[dict]:
+    """
+    Stream the entries of a TDCASSCF photoelectron density JSON file, without loading the whole file
+    :param filename: JSON file to read
+    :param photon: Only the entries of this photon energy (eV) are yielded, if it is given
+    :param phase: Only the entries of this optical phase (deg) are yielded, if it is given
+    :return: Entries with keys "Photon energy (eV)", "Opt phase (deg)", "Mag q num", "Momentum (au)",
+        "Polar ang (rad)" and "Density", whose arrays are decoded to ndarrays
+    """
+    where = {}
+    if photon is not None:
+        where['Photon energy (eV)'] = photon
+    if phase is not None:
+        where['Opt phase (deg)'] = phase
+    return iter_data(filename, where=where)
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Convert TDCASSCF photoelectron density JSON files to .npy arrays')
+    parser.add_argument('filenames', nargs='+', help='JSON files to convert')
+    parser.add_argument('--to', default=None,
+                        help='Directory to write the converted files in; default: the padtools cache')
+    args = parser.parse_args()
+    for fn in args.filenames:
+        if args.to is None:
+            load_cached(fn)
+        else:
+            to = join(args.to, splitext(basename(fn))[0])
+            print("Converting {} to {}...".format(fn, to))
+            convert(fn, to)
@@ -1,18 +1,25 @@
 from abc import ABC
+from copy import copy
 from enum import auto, IntEnum, EnumMeta
+from functools import lru_cache
 from itertools import count
-from typing import Dict, Iterable, Set, Callable
+from typing import Dict, Iterable, Set, Callable, Tuple
 
-from numpy import array, pi, ndarray, stack, fromiter
+from numpy import array, pi, ndarray, stack, fromiter, asarray, moveaxis
 from numpy.linalg import pinv
 
-from . import solve_helium_eq as he
-from . import solve_neon_eq as ne
+# The targets evaluate the generated modules, which import only NumPy, so that defining them neither imports
+# SymPy nor solves or loads the PAD equations; see padtools.generate
+from . import analytic_helium as he
+from ._generated import neon as ne
+from .partial_waves import PartialWaveModel
 
 
 __all__ = [
     'TargetHeliumPad',
     'TargetNeonPad',
+    'PartialWaveTargetPad',
+    'partial_wave_target',
 ]
 
 
@@ -37,6 +44,9 @@ class TargetPad(ABC):
     WONLY_XKEYS: Set[IntEnum]
     YMAT: Callable[..., ndarray]
     YJACMAT: Callable[..., ndarray]
+    YFUSED: Callable[..., Tuple[ndarray, ndarray]]
+    YMAT_BATCH: Callable[..., ndarray]
+    YJACMAT_BATCH: Callable[..., ndarray]
 
     def __init__(self,
                  w2w_beta1_amp: float, w2w_beta1_shift: float, w2w_beta2: float,
@@ -114,6 +124,8 @@ class TargetPad(ABC):
             wonly_beta2,
             wonly_beta4,
         ))
+        self.__cached_at = None
+        self.__cached = {}
 
     @property
     def xfixed(self):
@@ -131,6 +143,14 @@ class TargetPad(ABC):
     def zintercept(self):
         return self.__zintercept
 
+    def with_zintercept(self, zintercept: ndarray) -> 'TargetPad':
+        """Copy of this target with the measured betas replaced, keeping errors and weights"""
+        ret = copy(self)
+        ret.__zintercept = asarray(zintercept, dtype=float)
+        ret.__cached_at = None
+        ret.__cached = {}
+        return ret
+
     def __arrange_xargs(self, xargs: ndarray) -> ndarray:
         inx = count()
         return fromiter(
@@ -138,17 +158,38 @@ class TargetPad(ABC):
             dtype=xargs.dtype,
         )
 
+    def __evaluated_at(self, xargs: ndarray) -> dict:
+        # Cache of the last evaluated point; least_squares calls the residual and
+        # its jacobian one after another at the same point
+        xargs = asarray(xargs)
+        at = xargs.dtype.str, xargs.tobytes()
+        if at != self.__cached_at:
+            self.__cached_at = at
+            self.__cached = {'arranged': self.__arrange_xargs(xargs)}
+        return self.__cached
+
+    def __zmat_at(self, xargs: ndarray) -> ndarray:
+        cached = self.__evaluated_at(xargs)
+        if 'zmat' not in cached:
+            cached['zmat'] = self.zmat(cached['arranged'])
+        return cached['zmat']
+
+    def __zjacmat_at(self, xargs: ndarray) -> ndarray:
+        cached = self.__evaluated_at(xargs)
+        if 'zjacmat' not in cached:
+            cached['zmat'], cached['zjacmat'] = self.zmat_and_zjacmat(cached['arranged'])
+        return cached['zjacmat']
+
     @classmethod
     def wonly_xmask(cls, xargs_arranged: ndarray) -> ndarray:
         ret = xargs_arranged.copy()
         where = list(set(cls.XKEYS) - cls.WONLY_XKEYS)
-        ret[where] = 0
+        ret[..., where] = 0
         return ret
 
     @classmethod
-    def zmat(cls, xargs_arranged: ndarray) -> ndarray:
-        w2w = cls.YMAT(*xargs_arranged)[:, 0]
-        w = cls.YMAT(*cls.wonly_xmask(xargs_arranged))[:, 0]
+    def __zmat_of(cls, w2w: ndarray, w: ndarray) -> ndarray:
+        # shapes: (y,...) -> (z,...)
         yk = cls.YKEYS
         zk = cls.ZKEYS
         ret = stack([*w2w, *w[[yk.B2, yk.B4]]])
@@ -161,11 +202,8 @@ class TargetPad(ABC):
         return ret
 
     @classmethod
-    def zjacmat(cls, xargs_arranged: ndarray) -> ndarray:
-        w2w = cls.YMAT(*xargs_arranged)[:, 0]
-        w = cls.YMAT(*cls.wonly_xmask(xargs_arranged))[:, 0]
-        w2wjac = cls.YJACMAT(*xargs_arranged)
-        wjac = cls.YJACMAT(*cls.wonly_xmask(xargs_arranged))
+    def __zjacmat_of(cls, w2w: ndarray, w: ndarray, w2wjac: ndarray, wjac: ndarray) -> ndarray:
+        # shapes: (y,...), (y,x,...) -> (z,x,...)
         yk = cls.YKEYS
         zk = cls.ZKEYS
         ret = stack([*w2wjac, *wjac[[yk.B2, yk.B4]]])
@@ -183,6 +221,40 @@ class TargetPad(ABC):
         )
         return ret
 
+    @classmethod
+    def zmat(cls, xargs_arranged: ndarray) -> ndarray:
+        w2w = cls.YMAT(*xargs_arranged)[:, 0]
+        w = cls.YMAT(*cls.wonly_xmask(xargs_arranged))[:, 0]
+        return cls.__zmat_of(w2w, w)
+
+    @classmethod
+    def zmat_and_zjacmat(cls, xargs_arranged: ndarray) -> Tuple[ndarray, ndarray]:
+        w2w, w2wjac = cls.YFUSED(*xargs_arranged)
+        w, wjac = cls.YFUSED(*cls.wonly_xmask(xargs_arranged))
+        w2w, w = w2w[:, 0], w[:, 0]
+        return cls.__zmat_of(w2w, w), cls.__zjacmat_of(w2w, w, w2wjac, wjac)
+
+    @classmethod
+    def zjacmat(cls, xargs_arranged: ndarray) -> ndarray:
+        _, ret = cls.zmat_and_zjacmat(xargs_arranged)
+        return ret
+
+    @classmethod
+    def zmat_batch(cls, xargs_arranged: ndarray) -> ndarray:
+        xargs_arranged = asarray(xargs_arranged, dtype=float)  # shape: (n,x)
+        w2w = cls.YMAT_BATCH(*xargs_arranged.T)[:, 0]
+        w = cls.YMAT_BATCH(*cls.wonly_xmask(xargs_arranged).T)[:, 0]
+        return moveaxis(cls.__zmat_of(w2w, w), -1, 0)  # shape: (n,z)
+
+    @classmethod
+    def zjacmat_batch(cls, xargs_arranged: ndarray) -> ndarray:
+        xargs_arranged = asarray(xargs_arranged, dtype=float)  # shape: (n,x)
+        w2w = cls.YMAT_BATCH(*xargs_arranged.T)[:, 0]
+        w = cls.YMAT_BATCH(*cls.wonly_xmask(xargs_arranged).T)[:, 0]
+        w2wjac = cls.YJACMAT_BATCH(*xargs_arranged.T)
+        wjac = cls.YJACMAT_BATCH(*cls.wonly_xmask(xargs_arranged).T)
+        return moveaxis(cls.__zjacmat_of(w2w, w, w2wjac, wjac), -1, 0)  # shape: (n,z,x)
+
     @classmethod
     def xjacmat_byz(cls, xargs_arranged: ndarray) -> ndarray:
         called = cls.zjacmat(xargs_arranged)  # shape: (z,x)
@@ -198,20 +270,22 @@ class TargetPad(ABC):
         return ret
 
     def zdiffmat(self, xargs: ndarray) -> ndarray:
-        arranged = self.__arrange_xargs(xargs)
-        called = self.zmat(arranged)
+        called = self.__zmat_at(xargs)
         return self.zweight ** 0.5 * self.__norm_phases(self.zintercept - called)
 
     def zdiffjacmat(self, xargs: ndarray) -> ndarray:
-        arranged = self.__arrange_xargs(xargs)
-        called = self.zjacmat(arranged)
+        called = self.__zjacmat_at(xargs)
         return self.zweight[:, None] ** 0.5 * -called[:, self.__xkeys_varying]
 
+    def xerror(self, xargs: ndarray) -> ndarray:
+        called = self.__zjacmat_at(xargs)
+        return ((pinv(called) ** 2) @ (self.zerror ** 2)) ** 0.5
+
     def report(self, xargs: ndarray) -> None:
-        xargs_arranged = self.__arrange_xargs(xargs)
-        xerror = ((self.xjacmat_byz(xargs_arranged) ** 2) @ (self.zerror ** 2)) ** 0.5
-        zmat_called = self.zmat(xargs_arranged)
-        zjacmat_called = self.zjacmat(xargs_arranged)
+        xargs_arranged = self.__evaluated_at(xargs)['arranged']
+        zjacmat_called = self.__zjacmat_at(xargs)
+        zmat_called = self.__zmat_at(xargs)
+        xerror = self.xerror(xargs)
 
         print("{:18s}{:>12s}{:>12s}{:>12s}{:>12s}{}".format(
             "", "", "", "", "",
@@ -251,8 +325,11 @@ class TargetHeliumPad(TargetPad):
         he.XKeys.ETA_S,
         he.XKeys.ETA_D,
     }
-    YMAT = he.ymat_lambdified
-    YJACMAT = he.yjacmat_lambdified
+    YMAT = he.ymat
+    YJACMAT = he.yjacmat
+    YFUSED = he.yfused
+    YMAT_BATCH = he.ymat
+    YJACMAT_BATCH = he.yjacmat
 
 
 class TargetNeonPad(TargetPad):
@@ -267,5 +344,66 @@ class TargetNeonPad(TargetPad):
         ne.XKeys.ETA_PDP,
         ne.XKeys.ETA_FDP,
     }
-    YMAT = ne.ymat_lambdified
-    YJACMAT = ne.yjacmat_lambdified
+    YMAT = ne.ymat
+    YJACMAT = ne.yjacmat
+    YFUSED = ne.yfused
+    YMAT_BATCH = ne.ymat_vectorized
+    YJACMAT_BATCH = ne.yjacmat_vectorized
+
+
+class PartialWaveTargetPad(TargetPad):
+    """
+    Base of the targets of function partial_wave_target. The targets are made on the fly, so their instances are
+    pickled as the model, the name and the reference path of the target, and rebuilt in the same class
+    """
+    MODEL: PartialWaveModel
+    ETA_REF_PATH: str
+
+    def __reduce__(self):
+        return partial_wave_pad, (type(self).__name__, self.MODEL, self.ETA_REF_PATH), self.__dict__
+
+
+def partial_wave_pad(name: str, model: PartialWaveModel, eta_ref: str) -> PartialWaveTargetPad:
+    """
+    Empty instance of a target of function partial_wave_target, whose state is restored by pickle or copy
+    """
+    cls = partial_wave_class(name, model, eta_ref)
+    return cls.__new__(cls)
+
+
+def partial_wave_target(name: str, model: PartialWaveModel, eta_ref: str) -> type:
+    """
+    Target of a partial-wave model, which needs no solved equations, such as
+    partial_wave_target('TargetNeonPad', PartialWaveModel(channels), eta_ref='fdp').
+    The same arguments give the same class
+    :param name: Name of the target class
+    :param model: Partial-wave model whose betas are up to order 4
+    :param eta_ref: Path whose phase is fixed to 0 by default
+    :return: Subclass of PartialWaveTargetPad. Only the paths which are not one-photon paths are kept in the
+        omega-only PADs
+    """
+    return partial_wave_class(name, model, eta_ref)
+
+
+@lru_cache(maxsize=None)
+def partial_wave_class(name: str, model: PartialWaveModel, eta_ref: str) -> type:
+    if model.lmax != 4:
+        raise ValueError('Betas of the model are up to order {} but not 4!'.format(model.lmax))
+    if eta_ref not in model.paths:
+        raise ValueError('Path {} is unknown!'.format(eta_ref))
+    xkeys = model.XKeys
+    return type(name, (PartialWaveTargetPad,), {
+        '__module__': __name__,
+        'MODEL': model,
+        'ETA_REF_PATH': eta_ref,
+        'XKEYS': xkeys,
+        'YKEYS': model.YKeys,
+        'ETA_REF': xkeys['ETA_{}'.format(eta_ref.upper())],
+        'WONLY_XKEYS': {xkeys['{}_{}'.format(k, p.upper())]
+                        for p in model.paths if p not in model.one_photon for k in ('COEFF', 'ETA')},
+        'YMAT': model.ymat,
+        'YJACMAT': model.yjacmat,
+        'YFUSED': model.yfused,
+        'YMAT_BATCH': model.ymat,
+        'YJACMAT_BATCH': model.yjacmat,
+    })
@@ -0,0 +1,96 @@
+"""
+Generate pure-NumPy modules padtools/_generated/{helium,neon}.py from the solved PAD equations.
+The generated modules depend only on NumPy; run this module again whenever the equations change:
+
+    python -m padtools.generate
+"""
+from enum import EnumMeta
+from importlib import import_module
+from os.path import join, dirname
+from textwrap import dedent
+
+import sympy
+from sympy import Matrix
+
+from .tools import fused_pycode
+
+
+__all__ = [
+    'TARGETS',
+    'module_pycode',
+    'generate',
+]
+
+
+TARGETS = {
+    'helium': 'solve_helium_eq',
+    'neon': 'solve_neon_eq',
+}
+
+
+def enum_pycode(enum: EnumMeta) -> str:
+    lines = ["class {}(IntEnum):  # length: {}".format(enum.__name__, len(enum))]
+    lines += ["    {} = {}".format(k.name, k.value) for k in enum]
+    return "\n".join(lines) + "\n"
+
+
+def module_pycode(target: str) -> str:
+    module = import_module('.{}'.format(TARGETS[target]), __package__)
+    solved, xmat = module.solved, module.xmat
+    ymat = Matrix([solved[k.name.lower()] for k in module.YKeys])
+    allmat = Matrix([solved[k.name.lower()] for k in module.AllKeys])
+    yjacmat = ymat.jacobian(xmat)
+    args = ", ".join(str(x) for x in xmat)
+
+    header = dedent('''\
+        """
+        Solved {target} PAD equations.
+        Generated by padtools.generate from padtools.{module} with SymPy {version}; do not edit
+        """
+        from enum import IntEnum
+
+        import numpy
+
+
+        __all__ = [
+            'XKeys',
+            'YKeys',
+            'AllKeys',
+            'ymat',
+            'allmat',
+            'yjacmat',
+            'yfused',
+            'ymat_vectorized',
+            'yjacmat_vectorized',
+            'ymat_pretty',
+        ]
+    ''').format(target=target, module=TARGETS[target], version=sympy.__version__)
+    pretty = dedent('''\
+        def ymat_pretty({args}):
+            ret = allmat({args})
+            return {{k.name.lower(): v for k, v in zip(AllKeys, ret[:, 0])}}
+    ''').format(args=args)
+    return "\n\n".join([
+        header,
+        *(enum_pycode(e) for e in (module.XKeys, module.YKeys, module.AllKeys)),
+        fused_pycode('ymat', xmat, [ymat]),
+        fused_pycode('allmat', xmat, [allmat]),
+        fused_pycode('yjacmat', xmat, [yjacmat]),
+        fused_pycode('yfused', xmat, [ymat, yjacmat]),
+        fused_pycode('ymat_vectorized', xmat, [ymat], broadcasting=True),
+        fused_pycode('yjacmat_vectorized', xmat, [yjacmat], broadcasting=True),
+        pretty,
+    ])
+
+
+def generate(*targets: str) -> None:
+    for target in targets or TARGETS:
+        filename = join(dirname(__file__), '_generated', '{}.py'.format(target))
+        print("Generating {}...".format(filename))
+        code = module_pycode(target)
+        with open(filename, 'w') as f:
+            f.write(code)
+
+
+if __name__ == '__main__':
+    generate()
@@ -0,0 +1,168 @@
+"""
+Local store of the VMI images of the runs, one memory-mapped .npy file per run and target, with a JSON sidecar
+holding the number of shots. Images are imported once from the MongoDB of the beamtime, so that the image scripts
+run offline and without unpickling anything.
+
+Example:
+    python -m padtools.images reduced 463-486
+    python -m padtools.images reconstructed 463-486
+"""
+from argparse import ArgumentParser
+from json import load as load_json, dump as dump_json
+from os import environ, makedirs, fdopen, replace, remove
+from os.path import join, isfile, dirname
+from pickle import loads
+from tempfile import mkstemp
+from typing import Sequence, Iterator
+
+from numpy import ndarray, array, asarray, empty, save, load as load_npy
+
+from .cache import cache_dir
+
+
+__all__ = [
+    'TARGETS',
+    'images_dir',
+    'store_image',
+    'import_from_mongo',
+    'open_image',
+    'iter_images',
+    'get_images',
+    'get_counts',
+]
+
+
+# target: (collection, query, field of the pickled image)
+TARGETS = {
+    'reduced': ('reduced', {'target': 'dfimgs'}, 'reduced'),
+    'reconstructed': ('reconstructed', {}, 'hist'),
+}
+
+
+def images_dir() -> str:
+    """
+    Directory of the image store. Set environment variable PADTOOLS_IMAGES to override it
+    """
+    return environ.get('PADTOOLS_IMAGES', join(cache_dir(), 'images'))
+
+
+def _filename(run: int, target: str, ext: str) -> str:
+    if target not in TARGETS:
+        raise ValueError('Target {} is unknown!'.format(target))
+    return join(images_dir(), target, 'run{:04d}.{}'.format(run, ext))
+
+
+def _write(filename: str, write) -> None:
+    fd, tmp = mkstemp(dir=dirname(filename), suffix='.tmp')
+    try:
+        with fdopen(fd, 'wb' if filename.endswith('.npy') else 'w') as f:
+            write(f)
+        replace(tmp, filename)
+    except BaseException:
+        remove(tmp)
+        raise
+
+
+def store_image(run: int, target: str, img: ndarray, n: int) -> None:
+    """
+    Store the image of a run. The sidecar is written last, so a run is in the store only once both files are
+    """
+    makedirs(join(images_dir(), target), exist_ok=True)
+    _write(_filename(run, target, 'npy'), lambda f: save(f, asarray(img)))
+    _write(_filename(run, target, 'json'), lambda f: dump_json({'run': run, 'n': n}, f))
+
+
+def import_from_mongo(runs: Sequence[int], target: str, host: str = 'lithium.local',
+                      database: str = 'FERMI_20144077') -> None:
+    """
+    Import the images of runs from the MongoDB of the beamtime, unpickling each of them once
+    :param runs: Run numbers
+    :param target: 'reduced' or 'reconstructed'
+    :param host: Host of the MongoDB
+    :param database: Name of the database
+    """
+    from pymongo import MongoClient
+
+    collection, query, field = TARGETS[target]
+    db = MongoClient(host)[database]
+    found = set()
+    for d in db[collection].find({**query, 'run': {'$in': list(runs)}}, {'run': 1, 'n': 1, field: 1}):
+        if d['run'] in found:
+            raise ValueError('Run {} has more than one {} image!'.format(d['run'], target))
+        found.add(d['run'])
+        print("Importing the {} image of run {}...".format(target, d['run']))
+        store_image(d['run'], target, loads(d[field]), int(d['n']))
+    missing = sorted(set(runs) - found)
+    if missing:
+        print("Runs {} have no {} image!".format(missing, target))
+
+
+def _sidecar(run: int, target: str) -> dict:
+    if not isfile(_filename(run, target, 'json')):
+        raise FileNotFoundError('Run {} has no {} image in {}! Import it with "python -m padtools.images".'
+                                .format(run, target, images_dir()))
+    with open(_filename(run, target, 'json'), 'r') as f:
+        return load_json(f)
+
+
+def open_image(run: int, target: str) -> ndarray:
+    """
+    Memory-mapped image of a run
+    :param run: Run number
+    :param target: 'reduced' or 'reconstructed'
+    :return: Image; shape: (H, W)
+    """
+    _sidecar(run, target)
+    return load_npy(_filename(run, target, 'npy'), mmap_mode='r')
+
+
+def iter_images(runs: Sequence[int], target: str) -> Iterator[ndarray]:
+    """
+    Memory-mapped images of runs, one by one
+    """
+    return (open_image(run, target) for run in runs)
+
+
+def get_images(runs: Sequence[int], target: str) -> ndarray:
+    """
+    Images of runs, stacked
+    :param runs: Run numbers
+    :param target: 'reduced' or 'reconstructed'
+    :return: Images; shape: (n_runs, H, W)
+    """
+    ret = None
+    for i, img in enumerate(iter_images(runs, target)):
+        if ret is None:
+            ret = empty((len(runs), *img.shape), dtype=img.dtype)
+        ret[i] = img
+    return empty((0, 0, 0)) if ret is None else ret
+
+
+def get_counts(runs: Sequence[int], target: str) -> ndarray:
+    """
+    Number of shots summed into the image of each run
+    :param runs: Run numbers
+    :param target: 'reduced' or 'reconstructed'
+    :return: Counts; shape: (n_runs,)
+    """
+    return array([_sidecar(run, target)['n'] for run in runs], dtype=int)
+
+
+def parse_runs(arg: str) -> list:
+    """
+    Runs given like '463-486,490'
+    """
+    ret = []
+    for part in arg.split(','):
+        fr, _, to = part.partition('-')
+        ret += range(int(fr), int(to or fr) + 1)
+    return ret
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Import VMI images from the MongoDB of the beamtime to the local store')
+    parser.add_argument('target', choices=sorted(TARGETS))
+    parser.add_argument('runs', type=parse_runs, help="Runs to import, such as '463-486,490'")
+    parser.add_argument('--host', default='lithium.local')
+    args = parser.parse_args()
+    import_from_mongo(args.runs, args.target, host=args.host)
@@ -0,0 +1,180 @@
+"""
+Streaming reader of the JSON datasets shaped as {..., "Data": [{...}, ...], ...}, such as
+"Data/Ne photoelectron density - TDCASSCF - G*.json" and "Data/Ne photoelectron yields - Measured - *.json".
+Entries of the "Data" list are read one by one, so that the whole document is never held in memory, and
+arrays stored as {"Shape": [...], "Values": [...]} are decoded straight into NumPy arrays.
+"""
+from io import StringIO
+from json import loads
+from re import compile
+from typing import Iterator, TextIO, Optional
+from warnings import catch_warnings, simplefilter
+
+from numpy import ndarray, array, fromstring, prod
+
+
+__all__ = [
+    'iter_data',
+]
+
+
+_NON_SPACE = compile(r'\S')
+_STRUCT = compile(r'[\[\]{}"]')
+_IN_STRING = compile(r'["\\]')
+_SCALAR_END = compile(r'[\s,\]}]')
+_BRACKETS = str.maketrans('[]', '  ')
+
+
+class _Reader:
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.__f = f
+        self.__chunk_size = chunk_size
+        self.__buf = ''
+        self.__pos = 0
+
+    def __fill(self, keep_from: int) -> int:
+        """Drop the buffer before keep_from and read the next chunk. Return how far the buffer is shifted"""
+        more = self.__f.read(self.__chunk_size)
+        if not more:
+            raise ValueError('Unexpected end of the JSON document!')
+        self.__buf = self.__buf[keep_from:] + more
+        self.__pos -= keep_from
+        return keep_from
+
+    def peek(self) -> str:
+        while True:
+            m = _NON_SPACE.search(self.__buf, self.__pos)
+            if m is not None:
+                self.__pos = m.start()
+                return m.group()
+            self.__fill(len(self.__buf))
+
+    def take(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise ValueError('Expected {!r} but got {!r}!'.format(ch, self.peek()))
+        self.__pos += 1
+
+    def value(self, keep: bool = True) -> Optional[str]:
+        """Text of the next JSON value, or None if it is skipped without keeping"""
+        if self.peek() not in '[{"':
+            while True:
+                m = _SCALAR_END.search(self.__buf, self.__pos)
+                if m is not None:
+                    ret, self.__pos = self.__buf[self.__pos:m.start()], m.start()
+                    return ret
+                self.__fill(self.__pos)
+
+        depth, in_string, i = 0, False, self.__pos
+        while True:
+            m = (_IN_STRING if in_string else _STRUCT).search(self.__buf, i)
+            if m is None:
+                shift = self.__fill(self.__pos if keep else min(i, len(self.__buf)))
+                i -= shift
+                continue
+            ch, i = m.group(), m.end()
+            if in_string:
+                if ch == '\\':
+                    i += 1
+                else:
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in '[{':
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0 and not in_string:
+                ret = self.__buf[self.__pos:i] if keep else None
+                self.__pos = i
+                return ret
+
+    def items(self) -> Iterator[str]:
+        """Keys of the next JSON object; the value of each key must be consumed before the next one"""
+        self.take('{')
+        if self.peek() == '}':
+            self.take('}')
+            return
+        while True:
+            key = loads(self.value())
+            self.take(':')
+            yield key
+            if self.peek() == ',':
+                self.take(',')
+                continue
+            self.take('}')
+            return
+
+    def elements(self) -> Iterator[None]:
+        """Elements of the next JSON array; each element must be consumed before the next one"""
+        self.take('[')
+        if self.peek() == ']':
+            self.take(']')
+            return
+        while True:
+            yield
+            if self.peek() == ',':
+                self.take(',')
+                continue
+            self.take(']')
+            return
+
+
+def _values(text: str, shape: Optional[list]) -> ndarray:
+    try:
+        with catch_warnings():
+            simplefilter('error')
+            ret = fromstring(text.translate(_BRACKETS), sep=',')
+    except (ValueError, DeprecationWarning):
+        ret = None
+    if ret is None or shape is None or ret.size != prod(shape, dtype=int):
+        ret = array(loads(text))  # not a plain array of numbers
+        return ret if shape is None else ret.reshape(shape)
+    if not any(c in text for c in '.eEnN'):
+        ret = ret.astype(int)
+    return ret.reshape(shape)
+
+
+def _block(text: str):
+    reader = _Reader(StringIO(text), len(text) or 1)
+    shape = values = None
+    for key in reader.items():
+        if key == 'Shape':
+            shape = loads(reader.value())
+        elif key == 'Values':
+            values = reader.value()
+        else:
+            reader.value(keep=False)
+    if values is None:
+        return loads(text)  # not an array block
+    return _values(values, shape)
+
+
+def iter_data(filename: str, where: dict = None, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """
+    Iterate over the entries of the "Data" list of a JSON dataset, reading the file chunk by chunk
+    :param filename: JSON file to read
+    :param where: Only entries whose fields equal these are decoded and yielded; the others are skipped
+        without decoding their arrays
+    :param chunk_size: Number of characters read at once
+    :return: Entries, with blocks {"Shape": [...], "Values": [...]} decoded to arrays
+    """
+    where = {} if where is None else where
+    with open(filename, 'r') as f:
+        reader = _Reader(f, chunk_size)
+        for key in reader.items():
+            if key != 'Data':
+                reader.value(keep=False)
+                continue
+            for _ in reader.elements():
+                entry, blocks, skipped = {}, {}, False
+                for k in reader.items():
+                    if skipped:
+                        reader.value(keep=False)
+                    elif reader.peek() == '{':
+                        blocks[k] = reader.value()
+                    else:
+                        entry[k] = loads(reader.value())
+                        skipped = k in where and entry[k] != where[k]
+                if skipped or not all(k in entry for k in where):
+                    continue
+                yield {**entry, **{k: _block(v) for k, v in blocks.items()}}
@@ -0,0 +1,80 @@
+from typing import Sequence, Optional
+
+from numpy import ndarray, asarray, ones, cos, sin, deg2rad, stack, einsum, hypot, arctan2, sqrt
+from numpy.linalg import pinv
+from numpy.polynomial.legendre import legvander
+
+from ._generated.neon import YKeys
+
+
+__all__ = [
+    'legendre_projector',
+    'phase_projector',
+    'project_legendre',
+    'project_betas',
+]
+
+
+def legendre_projector(theta: Sequence[float], lmax: int = 4, weights: Optional[Sequence[float]] = None) -> ndarray:
+    """
+    Weighted least-squares projector onto Legendre polynomials, ie the pseudo-inverse of the design matrix
+    P_l(cos theta) weighted by the square root of the weights
+    :param theta: Polar angles in rad; shape: (theta,)
+    :param lmax: Highest order of the Legendre polynomials
+    :param weights: Weights of the polar angles, such as the quadrature weights of
+        "Data/Ne photoelectron density - TDCASSCF - Filelist.xlsx". Equal weights if None
+    :return: Projector; shape: (l, theta)
+    """
+    design = legvander(cos(asarray(theta, dtype=float)), lmax)  # shape: (theta,l)
+    w = ones(design.shape[0]) if weights is None else sqrt(asarray(weights, dtype=float))
+    return pinv(w[:, None] * design) * w[None, :]
+
+
+def phase_projector(opt_phase: Sequence[float]) -> ndarray:
+    """
+    Least-squares projector of a quantity sampled at optical phases onto c + a cos(phi) + b sin(phi)
+    :param opt_phase: Optical phases in deg; shape: (phi,)
+    :return: Projector onto (c, a, b); shape: (3, phi)
+    """
+    phi = deg2rad(asarray(opt_phase, dtype=float))
+    return pinv(stack([ones(phi.shape), cos(phi), sin(phi)], axis=-1))
+
+
+def project_legendre(density: ndarray, theta: Sequence[float], lmax: int = 4,
+                     weights: Optional[Sequence[float]] = None) -> ndarray:
+    """
+    Legendre coefficients b_l of densities, all at once
+    :param density: Densities whose last axis is the polar angle; shape: (..., theta)
+    :param theta: Polar angles in rad; shape: (theta,)
+    :param lmax: Highest order of the Legendre polynomials
+    :param weights: Weights of the polar angles; see function legendre_projector
+    :return: Legendre coefficients; shape: (l, ...)
+    """
+    return einsum('lt,...t->l...', legendre_projector(theta, lmax, weights), density)
+
+
+def project_betas(density: ndarray, theta: Sequence[float], opt_phase: Sequence[float],
+                  weights: Optional[Sequence[float]] = None) -> ndarray:
+    """
+    Beta parameters of densities at several optical phases, in the layout of YKeys, all at once.
+    The even orders are their phase-averaged Legendre coefficients, and the odd ones are the amplitude and shift of
+    the first harmonic, b_l(phi) = amp cos(phi - shift), same as function padtools.tools.amp_and_shift
+    :param density: Densities whose first axis is the optical phase and last axis is the polar angle,
+        such as padtools.density.DensityGroup.density; shape: (phi, ..., theta)
+    :param theta: Polar angles in rad; shape: (theta,)
+    :param opt_phase: Optical phases in deg; shape: (phi,)
+    :param weights: Weights of the polar angles; see function legendre_projector
+    :return: Betas, not normalized by b0; shape: (7, ...)
+    """
+    coeff = project_legendre(density, theta, 4, weights)  # shape: (l,phi,...)
+    c, a, b = einsum('kp,lp...->kl...', phase_projector(opt_phase), coeff)  # shape: (l,...)
+    ret = {
+        YKeys.B0: c[0],
+        YKeys.B1_AMP: hypot(a[1], b[1]),
+        YKeys.B1_SHIFT: arctan2(b[1], a[1]),
+        YKeys.B2: c[2],
+        YKeys.B3_AMP: hypot(a[3], b[3]),
+        YKeys.B3_SHIFT: arctan2(b[3], a[3]),
+        YKeys.B4: c[4],
+    }
+    return stack([ret[k] for k in YKeys])
@@ -0,0 +1,133 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Sequence, Optional, Tuple
+
+from numpy import ndarray, array, asarray, full, zeros, isfinite, where, minimum, pi, inf, nan
+from pandas import DataFrame
+from scipy.optimize import least_squares
+from scipy.stats import qmc
+
+from .fit_pad import TargetPad
+
+
+__all__ = [
+    'sample_starts',
+    'canonicalize',
+    'multistart_fit',
+]
+
+
+def sample_starts(lower: Sequence[float], upper: Sequence[float], n_starts: int,
+                  method: str = 'lhs', seed: Optional[int] = None, inf_bound: float = 10) -> ndarray:
+    """
+    Sample starting points inside bounds
+    :param lower: Lower bounds
+    :param upper: Upper bounds
+    :param n_starts: Number of starting points
+    :param method: 'lhs' (Latin hypercube) or 'sobol'
+    :param seed: Seed of the sampler
+    :param inf_bound: Infinite bounds are replaced by +-inf_bound for sampling
+    :return: Starting points; shape: (n_starts, x)
+    """
+    lower, upper = asarray(lower, dtype=float), asarray(upper, dtype=float)
+    lower = where(isfinite(lower), lower, -inf_bound)
+    upper = where(isfinite(upper), upper, inf_bound)
+    if method == 'lhs':
+        sampler = qmc.LatinHypercube(d=lower.size, seed=seed)
+    elif method == 'sobol':
+        sampler = qmc.Sobol(d=lower.size, seed=seed)
+    else:
+        raise ValueError('Sampling method {} is unknown!'.format(method))
+    return qmc.scale(sampler.random(n_starts), lower, upper)
+
+
+def canonicalize(pad: TargetPad, x: ndarray) -> ndarray:
+    """
+    Canonical form of solutions, which gives the same PAD. A path of a negative coefficient is flipped to the
+    positive one, with its phase shifted by pi; if it is the path of the fixed reference phase, the other phases are
+    shifted by -pi instead. Phases are wrapped into [-pi, pi)
+    :param pad: Target PAD of the solutions
+    :param x: Varying x parameters; shape: (..., x)
+    :return: Canonical varying x parameters; shape: (..., x)
+    """
+    xkeys = [k for k in pad.XKEYS if k not in pad.xfixed]
+    at = {k.name: i for i, k in enumerate(xkeys)}
+    is_phase = array([k.name.startswith('ETA_') for k in xkeys])
+    x = array(x, dtype=float)
+    shift = zeros(x.shape[:-1])
+    for name, i in at.items():
+        if not name.startswith('COEFF_'):
+            continue
+        flipped = x[..., i] < 0
+        eta = 'ETA_{}'.format(name[len('COEFF_'):])
+        if eta in at:
+            x[..., at[eta]] += where(flipped, pi, 0)
+        elif eta == pad.ETA_REF.name and pad.ETA_REF in pad.xfixed:
+            shift -= where(flipped, pi, 0)
+        else:  # the phase is fixed, and the flip cannot be made up for
+            continue
+        x[..., i] = abs(x[..., i])
+    x[..., is_phase] += shift[..., None]
+    return where(is_phase, (x + pi) % (2 * pi) - pi, x)
+
+
+def fit_from(pad: TargetPad, x0: ndarray, bounds: Tuple[Sequence[float], Sequence[float]], kwargs: dict) -> dict:
+    try:
+        opt = least_squares(pad.zdiffmat, x0, jac=pad.zdiffjacmat, bounds=bounds, **kwargs)
+    except Exception as err:
+        return {'x': full(len(x0), nan), 'cost': inf, 'nfev': 0, 'success': False, 'message': repr(err)}
+    return {'x': opt.x, 'cost': opt.cost, 'nfev': opt.nfev, 'success': opt.success, 'message': opt.message}
+
+
+def multistart_fit(pad: TargetPad, bounds: Tuple[Sequence[float], Sequence[float]], n_starts: int = 64,
+                   workers: Optional[int] = None, method: str = 'lhs', seed: Optional[int] = None,
+                   inf_bound: float = 10, tol: float = 1e-3, **kwargs) -> DataFrame:
+    """
+    Fit a PAD from many starting points sampled inside the bounds, in parallel
+    :param pad: Target PAD to fit
+    :param bounds: Lower and upper bounds of the varying x parameters, as passed to scipy.optimize.least_squares
+    :param n_starts: Number of starting points
+    :param workers: Number of worker processes. Fits run in this process if it is 1
+    :param method: Sampling method of the starting points; 'lhs' (Latin hypercube) or 'sobol'
+    :param seed: Seed of the sampler
+    :param inf_bound: Infinite bounds are replaced by +-inf_bound for sampling
+    :param tol: Solutions whose canonical forms, see function canonicalize, differ by no more than this in every
+        parameter, the phases by their circular distance, are regarded as the same solution
+    :param kwargs: Keyword arguments which pass to function scipy.optimize.least_squares
+    :return: Distinct solutions in the canonical form ranked by cost, with the number of starts which reached each
+        of them
+    """
+    lower, upper = bounds
+    starts = sample_starts(lower, upper, n_starts, method=method, seed=seed, inf_bound=inf_bound)
+    if workers == 1:
+        fitted = list(map(fit_from, repeat(pad), starts, repeat(bounds), repeat(kwargs)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            fitted = list(executor.map(fit_from, repeat(pad), starts, repeat(bounds), repeat(kwargs),
+                                       chunksize=max(1, n_starts // (4 * (workers or 8)))))
+
+    xkeys = [k for k in pad.XKEYS if k not in pad.xfixed]
+    is_phase = array([k.name.startswith('ETA_') for k in xkeys])
+    names = [k.name.lower() for k in xkeys]
+    df = DataFrame([{
+        **dict(zip(names, canonicalize(pad, d['x']))),
+        'cost': d['cost'],
+        'nfev': d['nfev'],
+        'success': d['success'],
+        'message': d['message'],
+    } for d in fitted])
+    df = df[df['cost'] < inf].sort_values('cost', kind='stable')
+
+    # every solution joins the first lower-cost one within tol, or else is a distinct solution
+    distinct, hits = [], []
+    xs = df[names].values
+    for i, x in enumerate(xs):
+        for j, at in enumerate(distinct):
+            diff = abs(x - xs[at])
+            if where(is_phase, minimum(diff, 2 * pi - diff), diff).max() <= tol:
+                hits[j] += 1
+                break
+        else:
+            distinct.append(i)
+            hits.append(1)
+    return df.iloc[distinct].assign(hits=hits).reset_index(drop=True)
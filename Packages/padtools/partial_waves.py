@@ -0,0 +1,250 @@
+"""
+Data-driven PAD models built from partial-wave channels, in the shape of "Data/Ne partial waves - TDCASSCF.json",
+without solving any equation symbolically. The PAD summed over the m's,
+sum_m |sum_{channels of m} coeff * coeff_path * exp(i eta_path + i phi [path is a one-photon path]) Y_lm|^2,
+is expanded in Legendre polynomials with a precomputed tensor of Clebsch-Gordan coefficients, so that the beta
+parameters and their jacobian are evaluated numerically.
+
+Example:
+    model = PartialWaveModel([
+        Channel('sp', 0, 0, -sqrt(3) / 3), Channel('psp', 1, 0, -1 / 3), ...,
+    ])
+    model.ymat(*xargs)  # same as padtools._generated.neon.ymat
+"""
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from numpy import (ndarray, asarray, zeros, pi, exp, hypot, arctan2, broadcast_arrays, stack, tensordot, moveaxis,
+                   errstate)
+
+
+__all__ = [
+    'Channel',
+    'channels_of',
+    'etas_of',
+    'gaunt_tensor',
+    'ModelKeys',
+    'PartialWaveModel',
+]
+
+
+class Channel(NamedTuple):
+    path: str  # such as 'sp' or 'pdp'
+    l: int
+    m: int
+    coeff: float  # fixed factor of the channel, multiplied by coeff_path
+
+
+def channels_of(partial_waves: Sequence[dict]) -> List[Channel]:
+    """
+    Channels of the "Partial waves" of "Data/Ne partial waves - TDCASSCF.json", whose coefficients are the 'c's
+    """
+    return [Channel(d['path'], d['l'], d['m'], d['c']) for d in partial_waves]
+
+
+def etas_of(partial_waves: Sequence[dict]) -> Dict[str, float]:
+    """
+    Phases of the paths of the "Partial waves" of "Data/Ne partial waves - TDCASSCF.json"
+    """
+    ret = {}
+    for d in partial_waves:
+        if ret.setdefault(d['path'], d['eta']) != d['eta']:
+            raise ValueError('Path {} has different eta values!'.format(d['path']))
+    return ret
+
+
+@lru_cache(maxsize=None)
+def gaunt_tensor(lmax: int) -> ndarray:
+    """
+    Legendre coefficients of the products of spherical harmonics,
+    Y_{l1,m}(theta, varphi) conj(Y_{l2,m}(theta, varphi)) = sum_L G[L, l1, l2, m + lmax] P_L(cos theta),
+    where G = (-1)^m sqrt((2 l1 + 1) (2 l2 + 1)) / (4 pi) <l1 0 l2 0|L 0> <l1 m l2 -m|L 0>.
+    Do not modify it; it is shared
+    :param lmax: Highest l of the spherical harmonics
+    :return: Tensor G; shape: (2 lmax + 1, lmax + 1, lmax + 1, 2 lmax + 1)
+    """
+    from sympy.physics.wigner import clebsch_gordan
+
+    ret = zeros((2 * lmax + 1, lmax + 1, lmax + 1, 2 * lmax + 1))
+    for l1 in range(lmax + 1):
+        for l2 in range(lmax + 1):
+            for big_l in range(abs(l1 - l2), l1 + l2 + 1, 2):  # <l1 0 l2 0|L 0> is 0 if l1 + l2 + L is odd
+                cg0 = float(clebsch_gordan(l1, l2, big_l, 0, 0, 0))
+                for m in range(-min(l1, l2), min(l1, l2) + 1):
+                    ret[big_l, l1, l2, m + lmax] = (
+                            (-1) ** m * ((2 * l1 + 1) * (2 * l2 + 1)) ** 0.5 / (4 * pi)
+                            * cg0 * float(clebsch_gordan(l1, l2, big_l, m, -m, 0))
+                    )
+    return ret
+
+
+class ModelKeys(IntEnum):
+    """
+    Base of XKeys and YKeys of a PartialWaveModel. They are made for each model, so their members are pickled
+    as the model and their names
+    """
+    def __reduce_ex__(self, protocol):
+        return key_of, (type(self).model, type(self).__name__, self.name)
+
+
+def key_of(model: 'PartialWaveModel', keys: str, name: str) -> ModelKeys:
+    """
+    Member of XKeys or YKeys of a model by its name, such as key_of(model, 'XKeys', 'ETA_SP')
+    """
+    return getattr(model, keys)[name]
+
+
+class PartialWaveModel:
+    """
+    Beta parameters of a PAD made of partial-wave channels, as functions of the coefficient and the phase of each
+    path. Arguments are ordered as XKeys, coeff_<path>s and then eta_<path>s, with the paths in order of their
+    first channels. Betas are ordered as YKeys: b_L for even L, and the amplitude and shift of
+    b_L(phi) = amp cos(phi - shift) for odd L, same as padtools.tools.amp_and_shift. Even orders are averaged over
+    phi, and odd orders keep only the first harmonic
+    """
+    def __init__(self, channels: Sequence[Channel], one_photon: Optional[Set[str]] = None, lmax: int = 4):
+        """
+        :param channels: Channels, such as the ones of function channels_of
+        :param one_photon: Paths whose phases shift with the relative phase phi of the two colors. If None,
+            paths named by two letters, such as 'sp' and 'dp', as in "Data/Ne partial waves - TDCASSCF.json"
+        :param lmax: Highest order of the betas; the betas of padtools.fit_pad.TargetPad are up to 4
+        """
+        channels = [Channel(*ch) for ch in channels]
+        if not channels:
+            raise ValueError('No channel is given!')
+        for ch in channels:
+            if ch.l < 0 or abs(ch.m) > ch.l:
+                raise ValueError('Channel {} has an invalid m!'.format(ch))
+        self.__channels = channels
+        self.__paths = list(dict.fromkeys(ch.path for ch in channels))
+        if one_photon is None:
+            one_photon = {p for p in self.__paths if len(p) == 2}
+        unknown = set(one_photon) - set(self.__paths)
+        if unknown:
+            raise ValueError('Paths {} have no channel!'.format(sorted(unknown)))
+        self.__one_photon = set(one_photon)
+        self.__lmax = lmax
+        self.XKeys = ModelKeys('XKeys', [*('COEFF_{}'.format(p.upper()) for p in self.__paths),
+                                       *('ETA_{}'.format(p.upper()) for p in self.__paths)], start=0)
+        self.YKeys = ModelKeys('YKeys', [k for big_l in range(lmax + 1) for k in (
+            ('B{}'.format(big_l),) if big_l % 2 == 0 else ('B{}_AMP'.format(big_l), 'B{}_SHIFT'.format(big_l))
+        )], start=0)
+        self.XKeys.model = self.YKeys.model = self
+
+        # pair tensors; shape: (L, channel, channel)
+        lchan = max(ch.l for ch in channels)
+        gaunt = gaunt_tensor(lchan)
+        n = len(channels)
+        pairs = zeros((max(lmax, 2 * lchan) + 1, n, n))
+        for i, a in enumerate(channels):
+            for j, b in enumerate(channels):
+                if a.m == b.m:
+                    pairs[:2 * lchan + 1, i, j] = gaunt[:, a.l, b.l, a.m + lchan] * a.coeff * b.coeff
+        pairs = pairs[:lmax + 1]
+        photon = asarray([ch.path in self.__one_photon for ch in channels], dtype=float)
+        dk = photon[:, None] - photon[None, :]  # difference of the numbers of one-photon paths
+        # static, cos(phi) and sin(phi) parts; symmetric, symmetric and antisymmetric; shape: (3,L,channel,channel)
+        self.__forms = stack([pairs * (dk == 0), pairs * (dk != 0), pairs * dk])
+        self.__inx = asarray([self.__paths.index(ch.path) for ch in channels])
+        self.__onehot = zeros((n, len(self.__paths)))  # shape: (channel,path)
+        self.__onehot[range(n), self.__inx] = 1
+
+    def __reduce__(self):
+        return PartialWaveModel, (self.__channels, self.__one_photon, self.__lmax)
+
+    @property
+    def channels(self) -> List[Channel]:
+        return list(self.__channels)
+
+    @property
+    def paths(self) -> List[str]:
+        return list(self.__paths)
+
+    @property
+    def one_photon(self) -> Set[str]:
+        return set(self.__one_photon)
+
+    @property
+    def lmax(self) -> int:
+        return self.__lmax
+
+    def xargs(self, coeffs: Dict[str, float], etas: Dict[str, float]) -> ndarray:
+        """
+        Arguments arranged as XKeys
+        :param coeffs: Coefficient of each path, such as {'sp': 1, ...}
+        :param etas: Phase of each path, such as function etas_of
+        """
+        missing = set(self.__paths) - set(coeffs) | set(self.__paths) - set(etas)
+        if missing:
+            raise ValueError('Paths {} are missing!'.format(sorted(missing)))
+        return asarray([*(coeffs[p] for p in self.__paths), *(etas[p] for p in self.__paths)], dtype=float)
+
+    def __evaluate(self, xargs: Sequence, jacobian: bool) -> Tuple[ndarray, ...]:
+        if len(xargs) != len(self.XKeys):
+            raise ValueError('Got {} arguments but not {}!'.format(len(xargs), len(self.XKeys)))
+        npaths = len(self.__paths)
+        xargs = stack(broadcast_arrays(*(asarray(x, dtype=float) for x in xargs)))  # shape: (x,...)
+        coeff, eta = xargs[:npaths][self.__inx], xargs[npaths:][self.__inx]  # shape: (channel,...)
+        z = coeff * exp(1j * eta)
+        zc = z.conjugate()
+
+        # b_L(phi) = static_L + cos_L cos(phi) + sin_L sin(phi); quadratic forms of z
+        g = tensordot(self.__forms, zc, axes=1)  # shape: (3,L,channel,...)
+        gs, gc, hs = g
+        forms = (z * g).sum(2)  # shape: (3,L,...)
+        static, cos_, sin_ = forms[0].real, forms[1].real, -forms[2].imag
+
+        amp, shift = hypot(cos_, sin_), arctan2(sin_, cos_)
+        y = stack([v for big_l in range(self.__lmax + 1) for v in (
+            (static[big_l],) if big_l % 2 == 0 else (amp[big_l], shift[big_l])
+        )])[:, None]  # shape: (y,1,...)
+        if not jacobian:
+            return y,
+
+        # derivatives by the coefficient and the phase of each channel; shape: (L,2,channel,...)
+        phase = exp(1j * eta)
+        dstatic = stack([2 * (phase * gs).real, -2 * (z * gs).imag], axis=1)
+        dcos = stack([2 * (phase * gc).real, -2 * (z * gc).imag], axis=1)
+        dsin = stack([-2 * (phase * hs).imag, -2 * (z * hs).real], axis=1)
+        # sum up the channels of each path; shape: (L,x,...)
+        dstatic, dcos, dsin = (
+            moveaxis(tensordot(d, self.__onehot, axes=([2], [0])), -1, 2).reshape(d.shape[0], -1, *d.shape[3:])
+            for d in (dstatic, dcos, dsin)
+        )
+        jac = []
+        for big_l in range(self.__lmax + 1):
+            if big_l % 2 == 0:
+                jac.append(dstatic[big_l])
+                continue
+            c, s, a = cos_[big_l], sin_[big_l], amp[big_l]
+            with errstate(invalid='ignore', divide='ignore'):  # a is 0 in the omega-only PAD, whose odd orders vanish
+                jac.append((c * dcos[big_l] + s * dsin[big_l]) / a)
+                jac.append((c * dsin[big_l] - s * dcos[big_l]) / a ** 2)
+        return y, stack(jac)  # shape: (y,x,...)
+
+    def ymat(self, *xargs) -> ndarray:
+        """
+        Betas; shape: (y, 1, *broadcasted shape of the arguments)
+        """
+        y, = self.__evaluate(xargs, jacobian=False)
+        return y
+
+    def yjacmat(self, *xargs) -> ndarray:
+        """
+        Jacobian of the betas; shape: (y, x, *broadcasted shape of the arguments)
+        """
+        _, jac = self.__evaluate(xargs, jacobian=True)
+        return jac
+
+    def yfused(self, *xargs) -> Tuple[ndarray, ndarray]:
+        """
+        Betas and their jacobian at once; see methods ymat and yjacmat
+        """
+        return self.__evaluate(xargs, jacobian=True)
+
+    def betas(self, *xargs) -> dict:
+        """
+        Betas by name, such as {'b0': ..., 'b1_amp': ..., ...}
+        """
+        return {k.name.lower(): v for k, v in zip(self.YKeys, self.ymat(*xargs)[:, 0])}
@@ -0,0 +1,78 @@
+from typing import Dict, Iterable, Tuple
+
+from numpy import ndarray, array, stack, zeros, asarray
+
+
+__all__ = [
+    'PhaseBinnedAccumulator',
+]
+
+
+class PhaseBinnedAccumulator:
+    """
+    Running per-phase averages of run images weighted by their shot counts, taking one image at a time.
+    Only float64 sums, or Welford's running means and squared deviations if variance is True, are kept per phase,
+    so memory does not grow with the number of runs
+    """
+    def __init__(self, variance: bool = False):
+        self.__variance = variance
+        self.__counts: Dict[float, float] = {}
+        self.__sums: Dict[float, ndarray] = {}  # running sums, or running means if variance is True
+        self.__m2s: Dict[float, ndarray] = {}
+
+    def add(self, phase: float, n: float, img: ndarray) -> None:
+        """
+        Add the image of a run
+        :param phase: Optical phase of the run
+        :param n: Number of shots averaged in the image, which is its weight
+        :param img: Image of the run
+        """
+        img = asarray(img, dtype=float)
+        if phase not in self.__counts:
+            self.__counts[phase] = 0
+            self.__sums[phase] = zeros(img.shape)
+            if self.__variance:
+                self.__m2s[phase] = zeros(img.shape)
+        count = self.__counts[phase] = self.__counts[phase] + n
+        if not self.__variance:
+            self.__sums[phase] += n * img
+            return
+        # weighted Welford's update; D. H. D. West, Commun. ACM 22, 532 (1979)
+        mean, m2 = self.__sums[phase], self.__m2s[phase]
+        delta = img - mean
+        mean += n / count * delta
+        m2 += n * delta * (img - mean)
+
+    def update(self, records: Iterable[Tuple[float, float, ndarray]]) -> 'PhaseBinnedAccumulator':
+        """
+        Add the images of runs
+        :param records: Records (phase, n, img); see method add
+        :return: Self
+        """
+        for phase, n, img in records:
+            self.add(phase, n, img)
+        return self
+
+    @property
+    def phases(self) -> ndarray:
+        return array(sorted(self.__counts))  # shape: (phase,)
+
+    @property
+    def counts(self) -> ndarray:
+        return array([self.__counts[p] for p in sorted(self.__counts)])  # shape: (phase,)
+
+    def mean(self) -> ndarray:
+        """
+        Averaged images, sorted by phase; shape: (phase, H, W)
+        """
+        if self.__variance:
+            return stack([self.__sums[p] for p in sorted(self.__counts)])
+        return stack([self.__sums[p] / self.__counts[p] for p in sorted(self.__counts)])
+
+    def var(self) -> ndarray:
+        """
+        Weighted variances of the run images around the averages, sorted by phase; shape: (phase, H, W)
+        """
+        if not self.__variance:
+            raise ValueError('Variances are not accumulated! Make the accumulator with variance=True.')
+        return stack([self.__m2s[p] / self.__counts[p] for p in sorted(self.__counts)])
@@ -0,0 +1,84 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Sequence, Optional, Tuple
+
+from numpy import ndarray, asarray, arange, full, nan
+
+
+__all__ = [
+    'fitted',
+    'render_png',
+    'render_pngs',
+]
+
+
+def fitted(img: ndarray, size: Tuple[int, int]) -> ndarray:
+    """
+    Scale an image by nearest neighbours to fit in a frame, keeping its aspect ratio, like plt.axis('equal')
+    :param img: Image; shape: (H, W)
+    :param size: Width and height of the frame in pixels
+    :return: Image centred in the frame, NaN outside of it; shape: (height, width)
+    """
+    img = asarray(img, dtype=float)
+    width, height = size
+    if img.ndim != 2 or not img.size:
+        raise ValueError('Image of shape {} is not a 2D image!'.format(img.shape))
+    if width <= 0 or height <= 0:
+        raise ValueError('Size {} is not positive!'.format(size))
+    at = min(width / img.shape[1], height / img.shape[0])
+    h, w = max(1, round(img.shape[0] * at)), max(1, round(img.shape[1] * at))
+    top, left = (height - h) // 2, (width - w) // 2
+    ret = full((height, width), nan)
+    ret[top:top + h, left:left + w] = img[
+        (arange(h) * img.shape[0] // h)[:, None],
+        (arange(w) * img.shape[1] // w)[None, :],
+    ]
+    return ret
+
+
+def render_png(filename: str, img: ndarray, cmap: str = 'Greys', vmin: float = None, vmax: float = None,
+               size: Optional[Tuple[int, int]] = (800, 800)) -> None:
+    """
+    Write an image as a PNG with a colormap applied, without making a matplotlib figure.
+    Pixel [0, 0] is at the bottom left, same as plt.pcolormesh
+    :param filename: PNG file to write
+    :param img: Image; shape: (H, W)
+    :param cmap: Colormap name
+    :param vmin: Value mapped to the bottom of the colormap, like plt.clim
+    :param vmax: Value mapped to the top of the colormap, like plt.clim
+    :param size: Width and height of the PNG in pixels. The default is the size of the 8x8 inch figures at 100 dpi
+        which the scripts used to save; the image is fitted in it, see function fitted, on a white background.
+        If None, the PNG has one pixel per image bin
+    """
+    from matplotlib import colormaps
+    from matplotlib.image import imsave
+
+    img = asarray(img)
+    if size is not None:
+        img = fitted(img, size)
+    cm = colormaps[cmap]  # a copy
+    cm.set_bad('white')
+    imsave(filename, img, cmap=cm, vmin=vmin, vmax=vmax, origin='lower')
+
+
+def render_pngs(filenames: Sequence[str], imgs: Sequence[ndarray], workers: Optional[int] = None,
+                **kwargs) -> None:
+    """
+    Write images as PNGs across processes
+    :param filenames: PNG files to write
+    :param imgs: Images, one for each file
+    :param workers: Number of worker processes. Images are written in this process if it is 1
+    :param kwargs: Keyword arguments which pass to function render_png
+    """
+    if len(filenames) != len(imgs):
+        raise ValueError('Got {} filenames for {} images!'.format(len(filenames), len(imgs)))
+    if workers == 1:
+        for fn, img in zip(filenames, imgs):
+            render_png(fn, img, **kwargs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_render_png, filenames, imgs, repeat(kwargs)))
+
+
+def _render_png(filename: str, img: ndarray, kwargs: dict) -> None:
+    render_png(filename, img, **kwargs)
@@ -0,0 +1,73 @@
+"""
+Catalog of the runs of the beamtime, loaded once from "Data/Runs.xlsx": which dataset each run belongs to,
+its optical phase, and the ranges and photon energies of the datasets.
+Runs listed as dataset 'bad' are the ones to ignore.
+"""
+from functools import lru_cache
+from os.path import join, dirname, abspath
+from typing import NamedTuple, Optional, Tuple
+
+from numpy import ndarray, ones
+from pandas import DataFrame
+
+from .datasets import load_excel
+
+
+__all__ = [
+    'RUNS_XLSX',
+    'Selection',
+    'catalog',
+    'select',
+]
+
+
+RUNS_XLSX = abspath(join(dirname(__file__), '..', '..', 'Data', 'Runs.xlsx'))
+
+
+class Selection(NamedTuple):
+    runs: ndarray  # shape: (n,)
+    phases: ndarray  # shape: (n,); in machine unit
+    weights: ndarray  # shape: (n,)
+
+
+@lru_cache()
+def catalog(filename: str = RUNS_XLSX) -> Tuple[DataFrame, DataFrame]:
+    """
+    Runs and datasets of the beamtime
+    :param filename: Workbook with sheets 'Runs' and 'Datasets'
+    :return: Runs indexed by 'Run', and datasets indexed by 'Dataset'. Do not modify them; they are shared
+    """
+    runs = load_excel(filename, sheet_name='Runs').set_index('Run').sort_index()
+    datasets = load_excel(filename, sheet_name='Datasets').set_index('Dataset')
+    return runs, datasets
+
+
+def select(dataset: str, exclude_bad: bool = True, target: Optional[str] = None,
+           filename: str = RUNS_XLSX) -> Selection:
+    """
+    Runs of a dataset, such as select('good2')
+    :param dataset: Name of the dataset, such as 'good2' or 'wonly3'
+    :param exclude_bad: If False, the bad runs inside the run range of the dataset are selected as well;
+        their phases are NaN
+    :param target: If it is given, 'reduced' or 'reconstructed', the weights are the shot counts of the images
+        in padtools.images. Otherwise they are all 1
+    :param filename: Workbook of the catalog; see function catalog
+    :return: Run numbers, optical phases and weights, sorted by run number
+    """
+    runs, datasets = catalog(filename)
+    if dataset not in datasets.index:
+        raise ValueError('Dataset {} is unknown!'.format(dataset))
+    if exclude_bad:
+        selected = runs[runs['Dataset'] == dataset]
+    else:
+        fr, to = datasets.loc[dataset, ['First Run num', 'Last Run num']]
+        selected = runs.loc[fr:to]
+        selected = selected[selected['Dataset'].isin([dataset, 'bad'])]
+    run_nums = selected.index.values
+    if target is None:
+        weights = ones(run_nums.shape)
+    else:
+        from .images import get_counts
+
+        weights = get_counts(run_nums, target)
+    return Selection(runs=run_nums, phases=selected['Opt phase (mach unit)'].values, weights=weights)
@@ -1,15 +1,14 @@
 from enum import auto, IntEnum
-from os.path import isfile
-from functools import wraps
-from itertools import chain, repeat, islice
+from functools import lru_cache
 
-from cloudpickle import dump, load
+import sympy
 from sympy import (
-    Expr, symbols, Matrix, I, exp, Ynm, Abs, cos, sin, re, legendre,
-    cancel, expand_func, simplify, expand, solve, lambdify,
+    Expr, symbols, Matrix, I, exp, Ynm, Abs, expand, lambdify, srepr,
 )
 
-from .tools import expend_cos, amp_and_shift
+from . import tools
+from .cache import cached, cache_key
+from .tools import legendre_coeffs, amp_and_shift, lambdify_broadcasting, lambdify_fused
 
 
 __all__ = [
@@ -18,6 +17,9 @@ __all__ = [
     'YKeys',
     'ymat_lambdified',
     'yjacmat_lambdified',
+    'yfused_lambdified',
+    'ymat_vectorized',
+    'yjacmat_vectorized',
     'ymat_pretty',
 ]
 
@@ -46,55 +48,22 @@ pads = {
 
 # %% solve pad eq
 def solve_eq(pad: Expr) -> dict:
-    # expand left term
-    left = (
-        expand_func(pad)
-            .subs(sin(theta) ** 2, 1 - cos(theta) ** 2)
-    )
-    terms_lft = list(islice(chain(expend_cos(left, theta), repeat(0)), 5))
-
-    # expand right term
-    b0, b1, b2, b3, b4 = symbols(
-        'b_0 b_1 b_2 b_3 b_4',
-        real=True
-    )
-    right = (b0 +
-             b1 * legendre(1, cos(theta)) +
-             b2 * legendre(2, cos(theta)) +
-             b3 * legendre(3, cos(theta)) +
-             b4 * legendre(4, cos(theta)))
-    terms_rgt = list(expend_cos(right, theta))
-
-    # solve equations
-    b4_cmpx = simplify(cancel(solve(terms_lft[4] - terms_rgt[4], b4)[0]))
-    b4_real = simplify(re(expand(b4_cmpx)))
-    b3_cmpx = simplify(cancel(solve(terms_lft[3] - terms_rgt[3], b3)[0]))
-    b3_real = simplify(re(expand(b3_cmpx)))
-    b3_amp, b3_shift = amp_and_shift(b3_real, phi)
-    b2_cmpx = simplify(cancel(solve((terms_lft[2] - terms_rgt[2])
-                                    .subs(b4, b4_cmpx), b2)[0]))
-    b2_real = simplify(re(expand(b2_cmpx)))
-    b1_cmpx = simplify(cancel(solve((terms_lft[1] - terms_rgt[1])
-                                    .subs(b3, b3_cmpx), b1)[0]))
-    b1_real = simplify(re(expand(b1_cmpx)))
-    b1_amp, b1_shift = amp_and_shift(b1_real, phi)
-    b0_cmpx = simplify(cancel(solve((terms_lft[0] - terms_rgt[0])
-                                    .subs(b4, b4_cmpx)
-                                    .subs(b2, b2_cmpx), b0)[0]))
-    b0_real = simplify(re(expand(b0_cmpx)))
-    b1m3_real = simplify(cancel(b1_real - b3_real * 2 / 3))
-    b1m3_amp, b1m3_shift = amp_and_shift(b1m3_real, phi)
+    b0, b1, b2, b3, b4 = legendre_coeffs(pad, theta, 4)
+    b1_amp, b1_shift = amp_and_shift(b1, phi, simplified=False)
+    b3_amp, b3_shift = amp_and_shift(b3, phi, simplified=False)
+    b1m3 = expand(b1 - b3 * 2 / 3)
+    b1m3_amp, b1m3_shift = amp_and_shift(b1m3, phi, simplified=False)
     return {
-        'b0': b0_real,
-        'b1': b1_real,
+        'b0': b0,
+        'b1': b1,
         'b1_amp': b1_amp,
         'b1_shift': b1_shift,
-        'b2': b2_real,
-        'b3': b3_real,
+        'b2': b2,
+        'b3': b3,
         'b3_amp': b3_amp,
         'b3_shift': b3_shift,
-        'b4': b4_real,
-        'b1m3': b1m3_real,
+        'b4': b4,
+        'b1m3': b1m3,
         'b1m3_amp': b1m3_amp,
         'b1m3_shift': b1m3_shift,
     }
@@ -132,37 +101,53 @@ class AllKeys(IntEnum):  # length: 7
     B1M3_SHIFT = auto()
 
 
-if not isfile('solved_helium_eq.db'):
-    print("Solving the He PAD equations...")
-    solved = solve_eq(pads['summed'])
+xmat = Matrix((coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d))
 
-    print("Lambdifying solved b parameters...")
-    xmat = Matrix((coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d))
+
+def lambdify_solved(solved: dict) -> dict:
     ymat = Matrix([solved[k.name.lower()] for k in YKeys])
     allmat = Matrix([solved[k.name.lower()] for k in AllKeys])
-    ymat_lambdified = lambdify(xmat, ymat, 'numpy')
-    allmat_lambdified = lambdify(xmat, allmat, 'numpy')
     yjacmat = ymat.jacobian(xmat)  # shape: (7, 6)
-    yjacmat_lambdified = lambdify(xmat, yjacmat, 'numpy')
-
-    with open('solved_helium_eq.db', 'wb') as f:
-        print("Storing the answer...")
-        dump({
-            'solved': solved,
-            'ymat_lambdified': ymat_lambdified,
-            'allmat_lambdified': allmat_lambdified,
-            'yjacmat_lambdified': yjacmat_lambdified,
-        }, f)
-else:
-    with open('solved_helium_eq.db', 'rb') as f:
-        db = load(f)
-        solved = db['solved']
-        ymat_lambdified = db['ymat_lambdified']
-        allmat_lambdified = db['allmat_lambdified']
-        yjacmat_lambdified = db['yjacmat_lambdified']
-
-
-@wraps(ymat_lambdified)
+    return {
+        'ymat_lambdified': lambdify(xmat, ymat, 'numpy'),
+        'allmat_lambdified': lambdify(xmat, allmat, 'numpy'),
+        'yjacmat_lambdified': lambdify(xmat, yjacmat, 'numpy'),
+        'yfused_lambdified': lambdify_fused(xmat, ymat, yjacmat),
+        'ymat_vectorized': lambdify_broadcasting(xmat, ymat),
+        'yjacmat_vectorized': lambdify_broadcasting(xmat, yjacmat),
+    }
+
+
+def build() -> dict:
+    print("Solving the He PAD equations...")
+    solved = solve_eq(pads['summed'])
+
+    print("Lambdifying solved b parameters...")
+    return {'solved': solved, **lambdify_solved(solved)}
+
+
+@lru_cache(maxsize=None)
+def load() -> dict:
+    return cached('solved_helium_eq', cache_key(
+        sympy.__version__,
+        srepr(pads['summed']),
+        tools,
+        solve_eq,
+        lambdify_solved,
+        XKeys,
+        YKeys,
+        AllKeys,
+    ), build)
+
+
+def __getattr__(name: str):
+    # Solve or load the equations only when one of them is accessed for the first time
+    if name in {'solved', 'ymat_lambdified', 'allmat_lambdified', 'yjacmat_lambdified',
+                'yfused_lambdified', 'ymat_vectorized', 'yjacmat_vectorized'}:
+        return load()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 def ymat_pretty(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d):
-    ret = allmat_lambdified(coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d)
+    ret = load()['allmat_lambdified'](coeff_s, coeff_p, coeff_d, eta_s, eta_p, eta_d)
     return {k.name.lower(): v for k, v in zip(AllKeys, ret[:, 0])}
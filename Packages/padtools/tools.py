@@ -1,11 +1,21 @@
-from typing import Tuple
+from typing import Tuple, Callable, Sequence, List
 
-from sympy import Expr, Symbol, I, pi, cos, arg, sqrt, cancel, simplify
+import numpy
+from numpy import ndarray, broadcast_arrays, stack
+from sympy import (
+    Expr, Symbol, Dummy, Matrix, Poly, I, pi, cos, sin, arg, sqrt, re, legendre,
+    Mul, cancel, simplify, trigsimp, expand, expand_func, powsimp, factor_terms, lambdify, cse, numbered_symbols,
+)
+from sympy.printing.numpy import NumPyPrinter
 
 
 __all__ = [
     "expend_cos",
+    "legendre_coeffs",
     "amp_and_shift",
+    "lambdify_broadcasting",
+    "fused_pycode",
+    "lambdify_fused",
 ]
 
 
@@ -18,7 +28,114 @@ def expend_cos(expr: Expr, x: Symbol) -> Tuple[Expr, Expr]:
             return
 
 
-def amp_and_shift(expr: Expr, x: Symbol) -> Tuple[Expr, Expr]:
-    amp = simplify(cancel(sqrt(expr ** 2 + expr.diff(x) ** 2).subs(x, 0)))
+def legendre_coeffs(expr: Expr, x: Symbol, lmax: int) -> List[Expr]:
+    """
+    Expand a real expression as b_0 + b_1 P_1(cos x) + ... + b_lmax P_lmax(cos x). The expression is turned into
+    a polynomial of u = cos x once, and its coefficients, read off by Poly, are mapped to the b's by the inverse
+    of the constant matrix of Legendre coefficients, instead of solving the equations order by order
+    :param expr: Expression, such as a PAD, which is a polynomial of cos(x) and sin(x) ** 2
+    :param x: Polar angle
+    :param lmax: Largest order of the Legendre polynomials
+    :return: b_0, ..., b_lmax, not simplified. Exponentials of imaginary numbers are written as cosines
+    """
+    u = Dummy('u')
+    poly = expand(expand_func(expr)).subs(sin(x) ** 2, 1 - cos(x) ** 2).subs(cos(x), u)
+    if poly.has(x):
+        raise ValueError('Expression is not a polynomial of cos({0}) and sin({0}) ** 2!'.format(x))
+    coeffs = Poly(poly, u).all_coeffs()[::-1]  # coefficients of u ** 0, u ** 1, ...
+    if len(coeffs) > lmax + 1:
+        raise ValueError('Expression has order {} of cos({}), higher than lmax {}!'.format(len(coeffs) - 1, x, lmax))
+    coeffs += [0] * (lmax + 1 - len(coeffs))
+    # element [k, l] is the coefficient of u ** k in P_l(u)
+    mat = Matrix(lmax + 1, lmax + 1, lambda k, l: Poly(legendre(l, u), u).coeff_monomial(u ** k))
+    return [re(expand(powsimp(expand(b)).rewrite(cos))) for b in mat.inv() * Matrix(coeffs)]
+
+
+def amp_and_shift(expr: Expr, x: Symbol, simplified: bool = True) -> Tuple[Expr, Expr]:
+    """
+    Amplitude and shift of an expression a cos(x) + b sin(x) = amp cos(x - shift)
+    :param expr: Expression
+    :param x: Variable, such as phi
+    :param simplified: If False, the amplitude is not simplified, which takes the most of the time. Only common
+        factors are pulled out of the square root, and the remaining sums are simplified by trigsimp, such as
+        cos(x) ** 2 + sin(x) ** 2 to 1. Either gives the same values
+    :return: Amplitude and shift
+    """
+    if simplified:
+        amp = simplify(cancel(sqrt(expr ** 2 + expr.diff(x) ** 2).subs(x, 0)))
+    else:
+        factored = factor_terms(expand(expr.subs(x, 0)) ** 2 + expand(expr.diff(x).subs(x, 0)) ** 2)
+        amp = sqrt(Mul(*(trigsimp(f) if f.is_Add else f for f in Mul.make_args(factored))))
     shift = arg(expr.subs(x, 0) + I * expr.diff(x).subs(x, 0))
     return amp, shift
+
+
+def lambdify_broadcasting(args: Sequence[Symbol], mat: Matrix) -> Callable[..., ndarray]:
+    """
+    Lambdify a matrix elementwise so that it can be called with arrays
+    :param args: Symbols of the positional arguments
+    :param mat: Matrix to be lambdified
+    :return: Function returning an array of shape (*mat.shape, *broadcasted shape of the arguments).
+        Constant elements are broadcasted as well
+    """
+    lambdified = lambdify(args, list(mat), 'numpy')
+    shape = mat.shape
+
+    def broadcasting(*xargs) -> ndarray:
+        called = broadcast_arrays(*lambdified(*xargs), *xargs)[:len(mat)]
+        ret = stack(called).astype(float)
+        return ret.reshape(*shape, *ret.shape[1:])
+    return broadcasting
+
+
+def fused_pycode(name: str, args: Sequence[Symbol], mats: Sequence[Matrix], broadcasting: bool = False) -> str:
+    """
+    Generate the source of a NumPy function evaluating several matrices at once. Common subexpressions
+    over all the matrices are eliminated, so that they are computed only once per call
+    :param name: Function name
+    :param args: Symbols of the positional arguments
+    :param mats: Matrices to be evaluated
+    :param broadcasting: If True, the function can be called with arrays and every matrix is returned
+        with shape (*mat.shape, *broadcasted shape of the arguments)
+    :return: Source code of function `name` returning a tuple of arrays, one for each matrix,
+        or just an array if only one matrix is given
+    """
+    printer = NumPyPrinter({'fully_qualified_modules': True})
+    replacements, reduced = cse([e for m in mats for e in m], symbols=numbered_symbols('_x'))
+    printed_args = ", ".join(printer.doprint(a) for a in args)
+    lines = ["def {}({}):".format(name, printed_args)]
+    lines += ["    {} = {}".format(printer.doprint(k), printer.doprint(v)) for k, v in replacements]
+    if broadcasting:
+        lines += ["    _shape = numpy.broadcast({}).shape".format(printed_args)]
+    outputs = []
+    inx = 0
+    for m in mats:
+        entries = reduced[inx:inx + len(m)]
+        inx += len(m)
+        if broadcasting:
+            outputs.append(
+                "numpy.array([numpy.broadcast_to(_e, _shape) for _e in ({},)], dtype=float).reshape({} + _shape)"
+                .format(", ".join(printer.doprint(e) for e in entries), m.shape)
+            )
+        else:
+            outputs.append("numpy.array([{}])".format(", ".join(
+                "[{}]".format(", ".join(printer.doprint(e) for e in entries[i:i + m.cols]))
+                for i in range(0, len(m), m.cols)
+            )))
+    if len(outputs) == 1:
+        lines += ["    return {}".format(*outputs), ""]
+    else:
+        lines += ["    return (", *("        {},".format(o) for o in outputs), "    )", ""]
+    return "\n".join(lines)
+
+
+def lambdify_fused(args: Sequence[Symbol], *mats: Matrix) -> Callable[..., Tuple[ndarray, ...]]:
+    """
+    Lambdify several matrices into one function sharing common subexpressions
+    :param args: Symbols of the positional arguments
+    :param mats: Matrices to be lambdified
+    :return: Function returning a tuple of arrays, one for each matrix
+    """
+    namespace = {'numpy': numpy}
+    exec(fused_pycode('fused', args, mats), namespace)
+    return namespace['fused']
@@ -7,7 +7,8 @@ from scipy.optimize import least_squares, OptimizeResult
 from scipy.linalg import svd
 
 
-__all__ = ["fit", "load"]
+__all__ = ["fit", "fit_arrays", "fit_many", "Pivoted", "pivot", "pivot_yields", "fit_pivoted", "fit_yields", "load",
+           "to_records", "save_records", "load_records", "evaluate"]
 
 
 def model(
@@ -44,11 +45,53 @@ def formatted(res: OptimizeResult, param_names: typing.List[str]) -> dict:
     ]
 
 
+def missing_params() -> typing.List[dict]:
+    """
+    Parameters of a bin which cannot be fitted, in the format of function fit, with NaN values and errors
+    """
+    return [
+        {
+            "Name": "freq",
+            "Value": 2 * np.pi,
+            "Std err": 0,
+            "Vary": False,
+        },
+        *(
+            {
+                "Name": name,
+                "Value": np.nan,
+                "Std err": np.nan,
+                "Vary": True,
+            }
+            for name in ["shift", "amp", "offset", "ref_offset"]
+        ),
+    ]
+
+
 def fit(df: pd.DataFrame, ref: pd.DataFrame) -> typing.List[dict]:
     merged = df.merge(ref, on="Opt phase (mach unit)", suffixes=("", " (ref)"))
-    x = merged["Opt phase (mach unit)"].values
+    return fit_arrays(
+        merged["Opt phase (mach unit)"].values,
+        merged["Yield"].values,
+        merged["Yield (ref)"].values,
+    )
+
+
+def fit_arrays(
+        x: np.ndarray,
+        y0: np.ndarray,
+        y1: np.ndarray,
+        x0: typing.Optional[typing.Tuple[float, float, float, float]] = None) -> typing.List[dict]:
+    """
+    Same as function fit, taking arrays already aligned by optical phase, so that no DataFrame is merged
+    :param x: Optical phases in machine unit; shape: (m,)
+    :param y0: Yields at the phases; shape: (m,)
+    :param y1: Yields of the reference bin at the same phases; shape: (m,)
+    :param x0: Initial shift, amp, offset and ref_offset, within the bounds. If None, guessed from the yields
+    :return: Parameters, in the format of function fit
+    """
+    x, y0, y1 = np.asarray(x, dtype=float), np.asarray(y0, dtype=float), np.asarray(y1, dtype=float)
     freq = 2 * np.pi
-    y0, y1 = merged["Yield"].values, merged["Yield (ref)"].values
 
     def residual(params: tuple) -> np.ndarray:
         shift, amp, offset, ref_offset = params
@@ -56,16 +99,18 @@ def fit(df: pd.DataFrame, ref: pd.DataFrame) -> typing.List[dict]:
         fx1 = model(x, freq, shift - np.pi, amp, ref_offset)
         return np.append(y0 - fx0, y1 - fx1)
 
-    at = y0.argmax()
-    ph = freq * x % (2 * np.pi)
-    ret = least_squares(
-        residual,
-        x0=(
+    if x0 is None:
+        at = y0.argmax()
+        ph = freq * x % (2 * np.pi)
+        x0 = (
             ph[at],  # shift
             y0.std(),  # amp
             y0.mean(),  # offset
             y1.mean(),  # ref_offset
-        ),
+        )
+    ret = least_squares(
+        residual,
+        x0=x0,
         bounds=(
             (
                 -np.inf,  # shift
@@ -93,6 +138,160 @@ def fit(df: pd.DataFrame, ref: pd.DataFrame) -> typing.List[dict]:
     ]
 
 
+def fit_many(x: np.ndarray, y: np.ndarray, y_ref: np.ndarray) -> typing.List[typing.List[dict]]:
+    """
+    Same as function fit, for many bins at once. At the fixed frequency the model is linear in
+    amp * cos(shift), amp * sin(shift), offset and ref_offset, so every bin is solved in one batched linear
+    least-squares pass, and its errors are propagated to shift and amp. Bins whose linear solution has a negative
+    offset or ref_offset are fitted again by function fit_arrays, so the offsets are bounded as in function fit.
+    Bins with fewer than 3 phases paired with their reference, such as the bins without a mirrored partner, get NaN
+    parameters and errors. Shift is in [-pi, pi). The linear solution is the global minimum, so where function fit
+    stops in a local minimum the parameters differ, with a lower cost
+    :param x: Optical phases in machine unit; shape: (m,)
+    :param y: Yields at the phases, NaN where missing; shape: (n, m)
+    :param y_ref: Yields of the reference bins at the phases, NaN where missing; shape: (n, m)
+    :return: Parameters of each bin, in the format of function fit
+    """
+    freq = 2 * np.pi
+    x = np.asarray(x, dtype=float)
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    y_ref = np.atleast_2d(np.asarray(y_ref, dtype=float))
+    c, s = np.cos(freq * x), np.sin(freq * x)
+    zero, one = np.zeros_like(x), np.ones_like(x)
+    design = np.concatenate([  # shape: (2m, 4)
+        np.stack([c, s, one, zero], axis=-1),
+        np.stack([-c, -s, zero, one], axis=-1),  # shifted by pi
+    ])
+    # phases missing in either of a pair are dropped, same as the merge in function fit
+    mask = np.isfinite(y) & np.isfinite(y_ref)
+    w = np.concatenate([mask, mask], axis=-1).astype(float)  # shape: (n, 2m)
+    obs = np.nan_to_num(np.concatenate([y, y_ref], axis=-1))  # shape: (n, 2m)
+    dof = w.sum(-1) - 4
+
+    normal = np.einsum("ki,nk,kj->nij", design, w, design)  # shape: (n, 4, 4)
+    # only the well-posed bins are solved; the others would make the batch singular
+    posed = (dof > 0) & (np.linalg.matrix_rank(normal) == 4) if len(normal) else np.zeros(0, dtype=bool)
+    lin = np.full((len(y), 4), np.nan)
+    lincov = np.full((len(y), 4, 4), np.nan)
+    if posed.any():
+        lin[posed] = np.linalg.solve(
+            normal[posed], np.einsum("ki,nk->ni", design, (w * obs)[posed])[..., None],
+        )[..., 0]
+        ssr = (w[posed] * (obs[posed] - lin[posed] @ design.T) ** 2).sum(-1)
+        lincov[posed] = np.linalg.inv(normal[posed]) * (ssr / dof[posed])[:, None, None]
+
+    a, b, offset, ref_offset = lin.T
+    amp = np.hypot(a, b)
+    shift = np.arctan2(b, a)
+    grad = np.zeros(lin.shape + (4,))  # d(shift, amp, offset, ref_offset) / d(a, b, offset, ref_offset)
+    grad[:, 0, 0], grad[:, 0, 1] = -b / amp ** 2, a / amp ** 2
+    grad[:, 1, 0], grad[:, 1, 1] = a / amp, b / amp
+    grad[:, 2, 2] = grad[:, 3, 3] = 1
+    err = np.einsum("nij,njk,nik->ni", grad, lincov, grad) ** 0.5
+
+    keys = ["shift", "amp", "offset", "ref_offset"]
+    ret = [
+        [
+            {
+                "Name": "freq",
+                "Value": freq,
+                "Std err": 0,
+                "Vary": False,
+            },
+            *(
+                {
+                    "Name": name,
+                    "Value": value,
+                    "Std err": e,
+                    "Vary": True,
+                }
+                for name, value, e in zip(keys, values, errs)
+            ),
+        ]
+        for values, errs in zip(zip(shift, amp, offset, ref_offset), err)
+    ]
+    for i in np.flatnonzero(posed & ((offset < 0) | (ref_offset < 0))):
+        x0 = shift[i], amp[i], max(offset[i], 0), max(ref_offset[i], 0)
+        ret[i] = fit_arrays(x[mask[i]], y[i, mask[i]], y_ref[i, mask[i]], x0=x0)
+        ret[i][1]["Value"] = (ret[i][1]["Value"] + np.pi) % (2 * np.pi) - np.pi
+    return ret
+
+
+class Pivoted(typing.NamedTuple):
+    phases: np.ndarray  # shape: (m,); in machine unit
+    fr: np.ndarray  # shape: (n,); "Polar ang fr (deg)" of the bins
+    to: np.ndarray  # shape: (n,); "Polar ang to (deg)" of the bins
+    yields: np.ndarray  # shape: (m, n); NaN where missing
+
+
+def pivot(phases: np.ndarray, fr: np.ndarray, to: np.ndarray, yields: np.ndarray) -> Pivoted:
+    """
+    Pivot yield records to a (phase, bin) table. Yields of the same phase and bin are summed
+    :param phases: Optical phase of each record
+    :param fr: "Polar ang fr (deg)" of each record
+    :param to: "Polar ang to (deg)" of each record
+    :param yields: Yield of each record
+    :return: Table sorted by phase and by "Polar ang fr (deg)"
+    """
+    ux, ix = np.unique(np.asarray(phases, dtype=float), return_inverse=True)
+    ufr, ifr = np.unique(np.asarray(fr, dtype=float), return_inverse=True)
+    uto = np.empty(ufr.shape)
+    uto[ifr] = to
+    table = np.zeros((ux.size, ufr.size))
+    found = np.zeros(table.shape, dtype=bool)
+    np.add.at(table, (ix, ifr), yields)
+    found[ix, ifr] = True
+    table[~found] = np.nan
+    return Pivoted(phases=ux, fr=ufr, to=uto, yields=table)
+
+
+def pivot_yields(filename: str) -> Pivoted:
+    """
+    Pivot the "Data" of a yield file, such as "Data/Ne photoelectron yields - Measured - good1.json", in one
+    pass over its records
+    """
+    from padtools.jsonstream import iter_data
+
+    keys = "Opt phase (mach unit)", "Polar ang fr (deg)", "Polar ang to (deg)", "Yield"
+    records = np.array([[d[k] for k in keys] for d in iter_data(filename)], dtype=float).reshape(-1, len(keys))
+    return pivot(*records.T)
+
+
+def fit_pivoted(pivoted: Pivoted) -> typing.List[dict]:
+    """
+    Fit every polar angle bin of a pivoted yield table against its mirrored bin, whose "Polar ang fr (deg)"
+    is 180 - "Polar ang to (deg)" of the bin, as in "Grouped by" of "Data/Ne photoelectron yields - Measured - *.json"
+    :param pivoted: Table; see function pivot
+    :return: Model results of the bins, ordered by "Polar ang fr (deg)"
+    """
+    at = np.searchsorted(pivoted.fr, 180 - pivoted.to).clip(max=pivoted.fr.size - 1)
+    has_ref = pivoted.fr[at] == 180 - pivoted.to
+    # bins without a mirrored bin are not fitted
+    fitted = iter(fit_many(pivoted.phases, pivoted.yields[:, has_ref].T, pivoted.yields[:, at[has_ref]].T))
+    params = [next(fitted) if h else missing_params() for h in has_ref]
+    return [
+        {
+            "Model result": {
+                "Expr": "[Yield] = amp * cos(freq * [Opt phase (mach unit)] - shift) + offset",
+                "Params": p,
+            },
+            "Polar ang fr (deg)": fr,
+            "Polar ang to (deg)": to,
+        }
+        for fr, to, p in zip(pivoted.fr, pivoted.to, params)
+    ]
+
+
+def fit_yields(df: pd.DataFrame) -> typing.List[dict]:
+    """
+    Same as function fit_pivoted, taking a yield table
+    :param df: Columns "Opt phase (mach unit)", "Polar ang fr (deg)", "Polar ang to (deg)" and "Yield"
+    :return: Model results of the bins, ordered by "Polar ang fr (deg)"
+    """
+    keys = ["Opt phase (mach unit)", "Polar ang fr (deg)", "Polar ang to (deg)", "Yield"]
+    return fit_pivoted(pivot(*df[keys].values.T))
+
+
 def load(
         params: typing.List[str],
         ) -> typing.Callable[[np.ndarray], np.ndarray]:
@@ -102,3 +301,56 @@ def load(
         if not d["Name"].startswith("ref_")
     }
     return partial(model, **kwargs)
+
+
+def to_records(params: typing.List[typing.List[dict]], **columns: np.ndarray) -> np.ndarray:
+    """
+    Pack parameter sets into a structured array, one row per set, with fields such as "amp" and "amp_err"
+    :param params: Parameters in the format of function fit, all with the same names
+    :param columns: Additional fields, one value per set, such as fr=pivoted.fr
+    :return: Records; shape: (n,)
+    """
+    names = [d["Name"] for d in params[0]] if params else ["freq", "shift", "amp", "offset", "ref_offset"]
+    fields = [(k, float) for name in names for k in (name, "{}_err".format(name))]
+    columns = {k: np.asarray(v) for k, v in columns.items()}
+    ret = np.empty(len(params), dtype=[*((k, v.dtype) for k, v in columns.items()), *fields])
+    for k, v in columns.items():
+        ret[k] = v
+    for i, p in enumerate(params):
+        if [d["Name"] for d in p] != names:
+            raise ValueError("Parameter set {} has names {} but not {}!".format(i, [d["Name"] for d in p], names))
+    values = np.array([[(d["Value"], d["Std err"]) for d in p] for p in params], dtype=float)
+    values = values.reshape(len(params), len(names), 2)
+    for j, name in enumerate(names):
+        ret[name] = values[:, j, 0]
+        ret["{}_err".format(name)] = values[:, j, 1]
+    return ret
+
+
+def save_records(filename: str, records: np.ndarray) -> None:
+    """
+    Store records of function to_records as a Parquet file
+    """
+    pd.DataFrame.from_records(records).to_parquet(filename, index=False)
+
+
+def load_records(filename: str) -> np.ndarray:
+    """
+    Records stored by function save_records
+    """
+    return pd.read_parquet(filename).to_records(index=False).view(np.ndarray)
+
+
+def evaluate(records: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Models of all records at once, amp * cos(freq * x - shift) + offset, same as the models of function load
+    :param records: Records of function to_records; shape: (n,)
+    :param x: Optical phases in machine unit
+    :return: Yields; shape: (n, *x.shape)
+    """
+    x = np.asarray(x, dtype=float)
+    at = (slice(None),) + (None,) * x.ndim
+    return (
+        records["amp"][at] * np.cos(records["freq"][at] * x - records["shift"][at])
+        + records["offset"][at]
+    )
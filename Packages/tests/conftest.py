@@ -0,0 +1,15 @@
+import sys
+from os.path import dirname, abspath
+
+import pytest
+
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def padtools_cache(tmp_path_factory, monkeypatch):
+    """
+    Keep the solved equations of the tests apart from the user's cache
+    """
+    monkeypatch.setenv('PADTOOLS_CACHE', str(tmp_path_factory.getbasetemp() / 'padtools'))
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from padtools import analytic_helium, solve_helium_eq
+from padtools._generated import helium as generated
+
+
+X = np.random.default_rng(0).normal(size=(6, 20))  # arguments as analytic_helium.XKeys; 20 points
+
+
+@pytest.mark.parametrize("at", range(X.shape[1]))
+def test_matches_sympy(at):
+    x = X[:, at]
+    np.testing.assert_allclose(analytic_helium.ymat(*x), solve_helium_eq.ymat_lambdified(*x), rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(analytic_helium.yjacmat(*x), solve_helium_eq.yjacmat_lambdified(*x),
+                               rtol=1e-10, atol=1e-12)
+
+
+def test_broadcasts():
+    y, jac = analytic_helium.yfused(*X)
+    np.testing.assert_allclose(y, generated.ymat_vectorized(*X), rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(jac, generated.yjacmat_vectorized(*X), rtol=1e-10, atol=1e-12)
+    for at in range(X.shape[1]):
+        np.testing.assert_allclose(y[..., at], analytic_helium.ymat(*X[:, at]), rtol=1e-12, atol=1e-14)
+        np.testing.assert_allclose(jac[..., at], analytic_helium.yjacmat(*X[:, at]), rtol=1e-12, atol=1e-14)
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from padtools import bootstrap
+from padtools.bootstrap import bootstrap_fit, percentile_intervals
+from padtools.fit_pad import TargetHeliumPad
+
+
+X0 = np.array([0.8, 0.5, 0.6, -1.0, 2.0])  # varying x; eta_d is fixed at 0
+X0[:3] /= TargetHeliumPad.zmat(np.append(X0, 0))[0] ** 0.5  # so that w2w_b0 is 1
+BOUNDS = ([-10] * 3 + [-2 * np.pi] * 2, [10] * 3 + [2 * np.pi] * 2)
+
+
+@pytest.fixture(scope="module")
+def pad():
+    z = TargetHeliumPad.zmat(np.append(X0, 0))
+    err = np.full(8, 0.01)
+    return TargetHeliumPad(*z[1:7], *z[7:9], *err)
+
+
+def test_same_seed_same_fitted(pad):
+    serial = bootstrap_fit(pad, X0, BOUNDS, n_samples=16, workers=1, seed=1)
+    parallel = bootstrap_fit(pad, X0, BOUNDS, n_samples=16, workers=2, seed=1)
+    assert serial["success"].all()
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_refits_start_from_x0(pad, monkeypatch):
+    starts = []
+
+    def fit_from(pad, x0, bounds, kwargs):
+        starts.append(x0)
+        return {"x": x0, "cost": 0, "nfev": 0, "success": True, "message": ""}
+
+    monkeypatch.setattr(bootstrap, "fit_from", fit_from)
+    bootstrap_fit(pad, X0, BOUNDS, n_samples=4, workers=1)
+    assert len(starts) == 4
+    for x0 in starts:
+        np.testing.assert_array_equal(x0, X0)
+
+
+def test_percentile_intervals_of_successful_refits():
+    fitted = pd.DataFrame({
+        "coeff_s": [1.0, 2.0, 3.0, 100.0],
+        "eta_s": [0.1, 0.2, 0.3, -3.0],
+        "cost": [0.0, 0.0, 0.0, np.inf],
+        "nfev": [5, 5, 5, 0],
+        "success": [True, True, True, False],
+    })
+    intervals = percentile_intervals(fitted, q=(0, 50, 100))
+    assert list(intervals.index) == ["coeff_s", "eta_s"]
+    np.testing.assert_allclose(intervals.values, [[1.0, 2.0, 3.0], [0.1, 0.2, 0.3]])
+
+
+def test_no_refit_succeeded(pad):
+    with pytest.raises(ValueError):
+        bootstrap_fit(pad, X0, BOUNDS, n_samples=4, workers=1, max_nfev=1)
@@ -0,0 +1,36 @@
+from enum import IntEnum
+
+from padtools.cache import cache_key, cached
+
+
+def test_key_changes_with_enum_members():
+    before = cache_key("x", IntEnum("Keys", ["A", "B"], start=0))
+    assert cache_key("x", IntEnum("Keys", ["A", "B"], start=0)) == before
+    assert cache_key("x", IntEnum("Keys", ["B", "A"], start=0)) != before
+    assert cache_key("x", IntEnum("Keys", ["A", "B", "C"], start=0)) != before
+
+
+def test_key_hashes_source():
+    def f():
+        return 1
+
+    def g():
+        return 2
+
+    assert cache_key(f) != cache_key(g)
+    assert cache_key(f) == cache_key(f)
+
+
+def test_cached_builds_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("PADTOOLS_CACHE", str(tmp_path))
+    built = []
+
+    def build():
+        built.append(1)
+        return {"answer": 42}
+
+    key = cache_key("test")
+    assert cached("test", key, build) == {"answer": 42}
+    assert cached("test", key, build) == {"answer": 42}
+    assert len(built) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["test-{}.db".format(key)]
@@ -0,0 +1,50 @@
+from os.path import join, dirname
+
+import numpy as np
+import pandas as pd
+import pytest
+from yaml import safe_load
+
+from fit_helium import fit, fit_many, reference_at
+from fit_helium.fit import XKEYS, model_vectorized
+from fit_helium.solve import ymat_lambdified, jmat_lambdified
+
+
+DATA = join(dirname(__file__), "..", "..", "Data")
+
+
+@pytest.fixture(scope="module")
+def measured():
+    with open(join(DATA, "beta_helium_gauss3.yaml"), "r") as f:
+        return safe_load(f)
+
+
+def test_model_vectorized_matches_sympy():
+    photons = np.array([14.3, 15.9, 19.1])
+    xref = reference_at(photons)
+    x = np.random.default_rng(0).normal(size=(3, photons.size))
+    y, jac = model_vectorized(xref, *x)
+    for i in range(photons.size):
+        args = [v[i] for v in xref.values()] + list(x[:, i])
+        np.testing.assert_allclose(y[i], ymat_lambdified(*args)[:, 0], rtol=1e-12)
+        np.testing.assert_allclose(jac[i], jmat_lambdified(*args)[:, -3:], rtol=1e-12, atol=1e-14)
+
+
+def test_fit_many_matches_fit(measured):
+    fitted = fit_many(pd.DataFrame.from_dict(measured, orient="index"))
+    assert fitted["success"].all()
+    for k, m in measured.items():
+        expected = fit(**m)
+        got = fitted.loc[k]
+        np.testing.assert_allclose([got[x] for x in XKEYS], list(expected["opt"].values()), rtol=1e-5)
+        np.testing.assert_allclose([got["{}_err".format(x)] for x in XKEYS], list(expected["err"].values()),
+                                   rtol=1e-4)
+        np.testing.assert_allclose(got["cost"], expected["report"].cost, rtol=1e-6)
+
+
+def test_fit_many_success_is_per_energy(measured):
+    table = pd.DataFrame.from_dict(measured, orient="index")
+    fitted = fit_many(table)
+    assert (fitted["nfev"] == fitted["nfev"].iloc[0]).all()
+    stopped = fit_many(table, max_nfev=1)
+    assert not stopped["success"].any()
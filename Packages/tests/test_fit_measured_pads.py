@@ -0,0 +1,43 @@
+from os.path import join, dirname
+
+import numpy as np
+import pandas as pd
+import pytest
+from yaml import safe_load
+
+from fit_helium import fit
+from fit_measured_pads import run
+
+
+DATA = join(dirname(__file__), "..", "..", "Data")
+
+
+@pytest.fixture(scope="module")
+def measured():
+    with open(join(DATA, "beta_helium_gauss3.yaml"), "r") as f:
+        measured = safe_load(f)
+    return {**measured, "bad": {**measured["good1"], "photon": 40}}
+
+
+def test_one_bad_helium_dataset_fails_alone(measured):
+    fitted = run("helium", measured, pd.DataFrame(columns=["dataset", "hash"]), workers=1).set_index("dataset")
+    assert list(fitted.index) == list(measured)
+    assert not fitted.loc["bad", "success"]
+    assert "simulated range" in fitted.loc["bad", "message"]
+    for k, m in measured.items():
+        if k == "bad":
+            continue
+        got, expected = fitted.loc[k], fit(**m)
+        assert got["success"]
+        assert got["batch_size"] == len(measured) - 1
+        np.testing.assert_allclose([got["x_{}".format(x)] for x in expected["opt"]], list(expected["opt"].values()),
+                                   rtol=1e-5)
+
+
+def test_rerun_keeps_the_good_helium_datasets(measured, capsys):
+    previous = run("helium", measured, pd.DataFrame(columns=["dataset", "hash"]), workers=1)
+    capsys.readouterr()
+    again = run("helium", measured, previous, workers=1)
+    assert "{} datasets are up to date; fitting 1".format(len(measured) - 1) in capsys.readouterr().out
+    pd.testing.assert_frame_equal(again.drop(index=list(measured).index("bad")),
+                                  previous.drop(index=list(measured).index("bad")))
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from padtools.fit_pad import TargetHeliumPad, TargetNeonPad
+
+
+@pytest.mark.parametrize("target", [TargetHeliumPad, TargetNeonPad])
+def test_batch_matches_scalar(target):
+    x = np.random.default_rng(0).normal(size=(5, len(target.XKEYS)))
+    zmat = target.zmat_batch(x)
+    zjacmat = target.zjacmat_batch(x)
+    assert zmat.shape == (5, len(target.ZKEYS))
+    assert zjacmat.shape == (5, len(target.ZKEYS), len(target.XKEYS))
+    for xi, z, zjac in zip(x, zmat, zjacmat):
+        np.testing.assert_allclose(z, target.zmat(xi), rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(zjac, target.zjacmat(xi), rtol=1e-10, atol=1e-12)
+        fused_z, fused_zjac = target.zmat_and_zjacmat(xi)
+        np.testing.assert_allclose(fused_z, z, rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(fused_zjac, zjac, rtol=1e-10, atol=1e-12)
+
+
+def counting_target(calls: list) -> type:
+    def ymat(*xargs):
+        calls.append("ymat")
+        return TargetHeliumPad.YMAT(*xargs)
+
+    def yfused(*xargs):
+        calls.append("yfused")
+        return TargetHeliumPad.YFUSED(*xargs)
+
+    return type("CountingHeliumPad", (TargetHeliumPad,), {"YMAT": ymat, "YFUSED": yfused})
+
+
+def test_last_point_is_reused():
+    calls = []
+    x0 = TargetHeliumPad.zmat(np.array([1, 2, 3, 0.1, 0.2, 0]))
+    pad = counting_target(calls)(*x0[1:7], *x0[7:9])
+    x = np.array([1.1, 1.9, 3.2, 0.15, 0.25])
+
+    pad.zdiffmat(x)
+    assert calls == ["ymat", "ymat"]  # the two-color and the omega-only PADs
+    calls.clear()
+    pad.zdiffjacmat(x.copy())  # same point, other array
+    pad.zdiffmat(x)
+    pad.report(x)
+    assert calls == ["yfused", "yfused"]
+
+    calls.clear()
+    x[0] += 0.1
+    diff = pad.zdiffmat(x)
+    assert calls == ["ymat", "ymat"]
+    np.testing.assert_allclose(diff, TargetHeliumPad(*x0[1:7], *x0[7:9]).zdiffmat(x))
+
+
+def test_with_zintercept_forgets_last_point():
+    x0 = TargetHeliumPad.zmat(np.array([1, 2, 3, 0.1, 0.2, 0]))
+    pad = TargetHeliumPad(*x0[1:7], *x0[7:9])
+    x = np.array([1.1, 1.9, 3.2, 0.15, 0.25])
+    pad.zdiffmat(x)
+    z = pad.zintercept.copy()
+    z[1:] += 0.1
+    other = pad.with_zintercept(z)
+    np.testing.assert_allclose(other.zdiffmat(x), TargetHeliumPad(*z[1:7], *z[7:9]).zdiffmat(x))
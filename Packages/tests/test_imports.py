@@ -0,0 +1,26 @@
+from subprocess import run
+from sys import executable
+from os.path import dirname, abspath
+
+import pytest
+
+
+PACKAGES = dirname(dirname(abspath(__file__)))
+
+
+def imported_by(stmt: str) -> set:
+    code = "import sys; before = set(sys.modules); {}; print(*sorted(set(sys.modules) - before))".format(stmt)
+    called = run([executable, "-c", code], capture_output=True, check=True, text=True, cwd=PACKAGES)
+    return set(called.stdout.split())
+
+
+def test_import_padtools_imports_no_submodule():
+    imported = imported_by("import padtools")
+    assert not {m for m in imported if m.startswith("padtools.")}
+    assert "sympy" not in imported
+
+
+@pytest.mark.parametrize("name", ["TargetHeliumPad", "TargetNeonPad", "helium_betas", "neon_betas"])
+def test_targets_load_no_solved_equations(name):
+    imported = imported_by("from padtools import {}".format(name))
+    assert not imported & {"sympy", "cloudpickle", "padtools.solve_helium_eq", "padtools.solve_neon_eq"}
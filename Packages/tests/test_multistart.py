@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from padtools import multistart
+from padtools.fit_pad import TargetNeonPad
+from padtools.multistart import canonicalize, multistart_fit
+
+
+TRUTH = np.array([0.9, 0.6, 0.8, 0.5, 0.7, -2.5, 1.0, 2.0, -0.5])  # varying x; eta_fdp is fixed at 0
+TRUTH[:5] /= TargetNeonPad.zmat(np.append(TRUTH, 0))[0] ** 0.5  # so that w2w_b0 is 1
+BOUNDS = ([-10] * 5 + [-2 * np.pi] * 4, [10] * 5 + [2 * np.pi] * 4)
+
+
+def flipped(x: np.ndarray, paths: list) -> np.ndarray:
+    """
+    Equivalent solution of x whose coefficients of the paths (indices 0..4) are negative
+    """
+    x = x.copy()
+    for i in paths:
+        x[i] *= -1
+        if i < 4:
+            x[5 + i] += np.pi
+        else:  # the reference path; the other phases are shifted instead
+            x[5:] -= np.pi
+    return x
+
+
+@pytest.fixture(scope="module")
+def pad():
+    z = TargetNeonPad.zmat(np.append(TRUTH, 0))
+    return TargetNeonPad(*z[1:7], *z[7:9])
+
+
+@pytest.mark.parametrize("paths", [[0], [1, 3], [4], [0, 2, 4], [0, 1, 2, 3, 4]])
+def test_flipped_solutions_are_equivalent(pad, paths):
+    x = flipped(TRUTH, paths)
+    np.testing.assert_allclose(pad.zdiffmat(x), 0, atol=1e-9)
+    np.testing.assert_allclose(canonicalize(pad, x), canonicalize(pad, TRUTH), atol=1e-12)
+
+
+def test_phases_are_wrapped(pad):
+    x = canonicalize(pad, TRUTH + np.r_[np.zeros(5), 2 * np.pi * np.array([1, -1, 2, 0])])
+    np.testing.assert_allclose(x, TRUTH, atol=1e-12)
+    assert np.all((-np.pi <= x[5:]) & (x[5:] < np.pi))
+
+
+def test_equivalent_minima_are_merged(pad, monkeypatch):
+    paths = [[], [0], [1, 3], [4], [0, 2, 4], [2], [3, 4], [0, 1, 2, 3, 4]]
+    starts = np.array([flipped(TRUTH, p) for p in paths])
+    monkeypatch.setattr(multistart, "sample_starts", lambda *args, **kwargs: starts)
+    ranked = multistart_fit(pad, BOUNDS, n_starts=len(starts), workers=1)
+    assert len(ranked) == 1
+    assert ranked.loc[0, "hits"] == len(starts)
+    np.testing.assert_allclose(ranked.loc[0, [k.name.lower() for k in pad.XKEYS][:-1]].astype(float), TRUTH,
+                               atol=1e-6)
+
+
+def test_solutions_are_grouped_across_the_wrap(pad, monkeypatch):
+    near = TRUTH.copy()
+    near[[0, 5]] = 1.0005, np.pi - 1e-6
+    xs = iter([near, near + np.r_[-2e-7, 0, 0, 0, 0, 2e-6, 0, 0, 0], near + np.r_[[0] * 5, 0.1, 0, 0, 0]])
+    monkeypatch.setattr(multistart, "fit_from", lambda *args: {
+        "x": next(xs), "cost": 0, "nfev": 1, "success": True, "message": ""})
+    ranked = multistart_fit(pad, BOUNDS, n_starts=3, workers=1)
+    assert ranked["hits"].tolist() == [2, 1]
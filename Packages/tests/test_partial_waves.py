@@ -0,0 +1,103 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from json import load
+from multiprocessing import get_context
+from os.path import join, dirname
+
+import numpy as np
+import pytest
+
+from padtools._generated import neon
+from padtools.fit_pad import TargetNeonPad, partial_wave_target
+from padtools.partial_waves import Channel, PartialWaveModel, channels_of, etas_of
+
+
+DATA = join(dirname(__file__), "..", "..", "Data")
+
+
+@pytest.fixture(scope="module")
+def partial_waves():
+    with open(join(DATA, "Ne partial waves - TDCASSCF.json"), "r") as f:
+        return load(f)[0]["Partial waves"]
+
+
+@pytest.fixture(scope="module")
+def model(partial_waves):
+    return PartialWaveModel(channels_of(partial_waves))
+
+
+@pytest.fixture(scope="module")
+def pad(model, partial_waves):
+    target = partial_wave_target("TargetNeonPad", model, eta_ref="fdp")
+    z = target.zmat(model.xargs({p: 1 for p in model.paths}, etas_of(partial_waves)))
+    return target(*z[1:7], *z[7:9], xfixed={model.XKeys.ETA_FDP: 0, model.XKeys.COEFF_SP: 1})
+
+
+# channels of the waves of padtools.solve_neon_eq
+NEON_CHANNELS = [
+    Channel("sp", 0, 0, -3 ** 0.5 / 3),
+    Channel("psp", 1, 0, -1 / 3),
+    Channel("pdp", 1, 0, -2 / 15),
+    Channel("dp", 2, 0, 30 ** 0.5 / 15),
+    Channel("fdp", 3, 0, 14 ** 0.5 / 35),
+    *(ch for m in (-1, 1) for ch in (
+        Channel("pdp", 1, m, -1 / 10),
+        Channel("dp", 2, m, 10 ** 0.5 / 10),
+        Channel("fdp", 3, m, 2 * 21 ** 0.5 / 105),
+    )),
+]
+
+
+def zdiffmat(pad, x):
+    return pad.zdiffmat(x)
+
+
+def test_same_target_class(model):
+    assert partial_wave_target("TargetNeonPad", model, "fdp") is partial_wave_target("TargetNeonPad", model, "fdp")
+
+
+def test_pickle_model(model):
+    x = np.random.default_rng(0).normal(size=len(model.XKeys))
+    loaded = pickle.loads(pickle.dumps(model))
+    assert [k.name for k in loaded.XKeys] == [k.name for k in model.XKeys]
+    np.testing.assert_allclose(loaded.ymat(*x), model.ymat(*x))
+    assert pickle.loads(pickle.dumps(model.XKeys.ETA_SP)).name == "ETA_SP"
+
+
+def test_pickle_pad(pad):
+    x = np.random.default_rng(1).normal(size=len(pad.XKEYS) - len(pad.xfixed))
+    loaded = pickle.loads(pickle.dumps(pad))
+    assert type(loaded).__name__ == "TargetNeonPad"
+    assert all(k in loaded.XKEYS for k in loaded.xfixed)
+    np.testing.assert_allclose(loaded.zdiffmat(x), pad.zdiffmat(x))
+    np.testing.assert_allclose(loaded.zdiffjacmat(x), pad.zdiffjacmat(x))
+    assert type(pad.with_zintercept(pad.zintercept)) is type(pad)
+
+
+def test_pad_in_worker_process(pad):
+    x = np.random.default_rng(2).normal(size=(2, len(pad.XKEYS) - len(pad.xfixed)))
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        got = list(executor.map(zdiffmat, [pad, pad], x))
+    np.testing.assert_allclose(got, [pad.zdiffmat(v) for v in x])
+
+
+def test_matches_generated_neon():
+    model = PartialWaveModel(NEON_CHANNELS)
+    assert [k.name for k in model.XKeys] == [k.name for k in neon.XKeys]
+    assert [k.name for k in model.YKeys] == [k.name for k in neon.YKeys]
+    x = np.random.default_rng(3).normal(size=(len(neon.XKeys), 50))
+    y, jac = model.yfused(*x)
+    np.testing.assert_allclose(y, neon.ymat_vectorized(*x), rtol=1e-12, atol=1e-14)
+    np.testing.assert_allclose(jac, neon.yjacmat_vectorized(*x), rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(model.ymat(*x[:, 0]), neon.ymat(*x[:, 0]), rtol=1e-12, atol=1e-14)
+    np.testing.assert_allclose(model.yjacmat(*x[:, 0]), neon.yjacmat(*x[:, 0]), rtol=1e-10, atol=1e-12)
+
+
+def test_target_matches_neon_target():
+    target = partial_wave_target("TargetNeonPad", PartialWaveModel(NEON_CHANNELS), "fdp")
+    rng = np.random.default_rng(4)
+    z = TargetNeonPad.zmat(rng.normal(size=len(neon.XKeys)))
+    pad, expected = target(*z[1:7], *z[7:9]), TargetNeonPad(*z[1:7], *z[7:9])
+    x = rng.normal(size=len(neon.XKeys) - 1)
+    np.testing.assert_allclose(pad.zdiffmat(x), expected.zdiffmat(x), rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(pad.zdiffjacmat(x), expected.zdiffjacmat(x), rtol=1e-8, atol=1e-10)
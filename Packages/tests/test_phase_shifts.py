@@ -0,0 +1,86 @@
+from json import load
+from os.path import join, dirname
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from phase_shifts import model, fit_arrays, fit_many, pivot, fit_pivoted, fit_yields
+
+
+DATA = join(dirname(__file__), "..", "..", "Data")
+X = np.linspace(0, 1, 12, endpoint=False)
+
+
+def test_fit_many_recovers_exact_model():
+    y = 3 + 2 * np.cos(2 * np.pi * X - 1)
+    y_ref = 4 + 2 * np.cos(2 * np.pi * X - 1 + np.pi)
+    _, shift, amp, offset, ref_offset = fit_many(X, y, y_ref)[0]
+    np.testing.assert_allclose(
+        [shift["Value"], amp["Value"], offset["Value"], ref_offset["Value"]], [1, 2, 3, 4],
+    )
+
+
+def test_fit_many_ill_posed_bins_are_nan():
+    good = 3 + 2 * np.cos(2 * np.pi * X - 1)
+    few = np.where(X < 0.1, good, np.nan)  # only 2 phases
+    y = np.stack([good, few, good])
+    y_ref = np.stack([good[::-1], few, np.full(X.shape, np.nan)])  # the last bin has no reference
+    params = fit_many(X, y, y_ref)
+    assert all(np.isfinite(d["Value"]) and np.isfinite(d["Std err"]) for d in params[0])
+    for p in params[1:]:
+        assert all(np.isnan(d["Value"]) and np.isnan(d["Std err"]) for d in p[1:])
+
+
+def test_fit_many_bounds_offsets():
+    y = -1 + 2 * np.cos(2 * np.pi * X - 1)
+    y_ref = 4 + 2 * np.cos(2 * np.pi * X - 1 + np.pi)
+    _, shift, amp, offset, ref_offset = fit_many(X, y, y_ref)[0]
+    assert offset["Value"] >= 0 and ref_offset["Value"] >= 0
+    assert amp["Value"] >= 0 and -np.pi <= shift["Value"] < np.pi
+
+
+def cost(x, y0, y1, params):
+    _, shift, amp, offset, ref_offset = (d["Value"] for d in params)
+    return (
+        ((y0 - model(x, 2 * np.pi, shift, amp, offset)) ** 2).sum()
+        + ((y1 - model(x, 2 * np.pi, shift - np.pi, amp, ref_offset)) ** 2).sum()
+    )
+
+
+@pytest.mark.parametrize("dataset", ["good2", "good4"])
+def test_fit_pivoted_matches_fit(dataset):
+    with open(join(DATA, "Ne photoelectron yields - Measured - {}.json".format(dataset)), "r") as f:
+        df = pd.DataFrame(load(f)["Data"])
+    for r in fit_yields(df):
+        ref = df[df["Polar ang fr (deg)"] == 180 - r["Polar ang to (deg)"]]
+        merged = df[df["Polar ang fr (deg)"] == r["Polar ang fr (deg)"]].merge(
+            ref, on="Opt phase (mach unit)", suffixes=("", " (ref)"),
+        )
+        x, y0, y1 = (merged[k].values for k in ["Opt phase (mach unit)", "Yield", "Yield (ref)"])
+        expected = fit_arrays(x, y0, y1)
+        got = r["Model result"]["Params"]
+        if not np.isclose(cost(x, y0, y1, got), cost(x, y0, y1, expected), rtol=1e-9):
+            # function fit stopped in a local minimum
+            assert cost(x, y0, y1, got) < cost(x, y0, y1, expected)
+            continue
+        for d, e in zip(got, expected):
+            assert d["Name"] == e["Name"]
+            value = e["Value"] if d["Name"] != "shift" else (e["Value"] + np.pi) % (2 * np.pi) - np.pi
+            np.testing.assert_allclose(d["Value"], value, rtol=1e-6, atol=1e-6 * abs(e["Value"]) + 1e-9)
+            np.testing.assert_allclose(d["Std err"], e["Std err"], rtol=1e-4)
+
+
+def test_fit_pivoted_missing_mirror():
+    fr = np.array([0., 5., 10., 170., 175.])  # 165 deg, the mirror of 10 deg, is missing
+    phases, bins = (a.ravel() for a in np.meshgrid(X, fr, indexing="ij"))
+    yields = 3 + 2 * np.cos(2 * np.pi * phases - 1 - bins / 90 * np.pi)
+    keep = ~((bins == 5) & (phases > 0.5))  # 5 deg misses half of its phases
+    fitted = fit_pivoted(pivot(phases[keep], bins[keep], bins[keep] + 5, yields[keep]))
+    assert [r["Polar ang fr (deg)"] for r in fitted] == fr.tolist()
+    for r in fitted:
+        values = [d["Value"] for d in r["Model result"]["Params"][1:]]
+        if r["Polar ang fr (deg)"] == 10:
+            assert np.isnan(values).all()
+        else:
+            assert np.isfinite(values).all()
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from padtools.render import fitted, render_png, render_pngs
+
+
+def test_fitted_square():
+    img = np.arange(4.).reshape(2, 2)
+    got = fitted(img, (800, 800))
+    assert got.shape == (800, 800)
+    np.testing.assert_array_equal(got[:400, :400], 0)
+    np.testing.assert_array_equal(got[:400, 400:], 1)
+    np.testing.assert_array_equal(got[400:, :400], 2)
+    np.testing.assert_array_equal(got[400:, 400:], 3)
+
+
+def test_fitted_keeps_aspect_ratio():
+    got = fitted(np.ones((2, 4)), (800, 800))
+    assert got.shape == (800, 800)
+    assert np.isnan(got[:200]).all() and np.isnan(got[600:]).all()
+    assert (got[200:600] == 1).all()
+
+
+def test_fitted_rejects_bad_input():
+    with pytest.raises(ValueError):
+        fitted(np.ones(3), (800, 800))
+    with pytest.raises(ValueError):
+        fitted(np.ones((2, 2)), (0, 800))
+
+
+def test_render_png_size(tmp_path):
+    imread = pytest.importorskip("matplotlib.image").imread
+    img = np.random.default_rng(0).random((64, 48))
+    render_png(str(tmp_path / "default.png"), img, vmin=0, vmax=1)
+    render_png(str(tmp_path / "small.png"), img, vmin=0, vmax=1, size=(100, 50))
+    render_png(str(tmp_path / "raw.png"), img, vmin=0, vmax=1, size=None)
+    assert imread(str(tmp_path / "default.png")).shape[:2] == (800, 800)
+    assert imread(str(tmp_path / "small.png")).shape[:2] == (50, 100)
+    assert imread(str(tmp_path / "raw.png")).shape[:2] == (64, 48)
+
+
+def test_render_pngs(tmp_path):
+    imread = pytest.importorskip("matplotlib.image").imread
+    filenames = [str(tmp_path / "{}.png".format(i)) for i in range(3)]
+    render_pngs(filenames, np.zeros((3, 8, 8)), workers=2, vmin=0, vmax=1)
+    assert all(imread(fn).shape[:2] == (800, 800) for fn in filenames)
+    with pytest.raises(ValueError):
+        render_pngs(filenames, np.zeros((2, 8, 8)), workers=1)
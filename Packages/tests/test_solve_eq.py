@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from numpy.polynomial.legendre import leggauss, legval
+from sympy import expand_func, lambdify
+
+from padtools import solve_helium_eq, solve_neon_eq
+
+
+# AllKeys of the solutions by the former solver, which expanded the PADs in cos(theta) order by order
+BASELINE = {
+    "helium": [
+        ((0.8, 1.3, 0.6, 0.4, -1.1, 2.0),
+         [0.214063398458599, 0.340526276919131, 2.099859758324331, 0.304909460318026, 0.288477279820782, 3.1,
+          0.073666002231106, 0.286691025619332, 1.5]),
+        ((1.7, 0.2, 0.9, -2.5, 0.3, 1.2),
+         [0.297619743581844, 0.060816225272493, 3.086186726704468, -0.363340363753869, 0.066571679958642, 0.9,
+          0.165748505019988, 0.093725912221705, -2.8]),
+        ((0.5, 0.5, 1.5, 3.0, -0.7, -2.2),
+         [0.218838046751356, 0.225581334433377, -1.77328852096492, 0.420625697341381, 0.277381999827675, -1.5,
+          0.460412513944412, 0.068916111927724, -2.583185307179586]),
+    ],
+    "neon": [
+        ((0.8, -1.3, 0.6, 1.1, -0.5, 0.4, -1.1, 2.0, 0.3, -0.9),
+         [0.071141024641477, 0.017557229985956, 1.521338555206642, -0.001325542554261, 0.06976357303454,
+          -1.409921464471596, -0.009438837181551, 0.121870796564702, 1.70158815780351]),
+        ((-1.7, 0.2, 0.9, -0.4, 1.5, -2.5, 0.3, 1.2, 2.8, 0.1),
+         [0.089258617704762, 0.054654882146289, 0.113666122056748, -0.024020739596512, 0.062004973229238,
+          2.558134738746802, -0.001183473611673, 0.139399462998988, -0.329003500462637]),
+        ((0.5, 0.7, -1.5, 0.6, 0.9, 3.0, -0.7, -2.2, 1.9, -1.4),
+         [0.028470880728811, 0.043840676994118, 2.590932577934026, 0.014717777914395, 0.010139749424255,
+          0.319471143701599, -0.004285968628131, 0.054892119934766, 2.804354393041703]),
+    ],
+}
+MODULES = {"helium": solve_helium_eq, "neon": solve_neon_eq}
+CASES = [(name, x, y) for name, cases in BASELINE.items() for x, y in cases]
+
+
+@pytest.mark.parametrize("name, x, expected", CASES)
+def test_matches_baseline(name, x, expected):
+    solved = MODULES[name].ymat_pretty(*x)
+    np.testing.assert_allclose(list(solved.values()), expected, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("name, x, expected", CASES)
+def test_matches_quadrature(name, x, expected):
+    # betas projected numerically from the PAD at Gauss-Legendre nodes of cos(theta)
+    module = MODULES[name]
+    pad = lambdify([*module.xmat, module.theta, module.phi, module.varphi], expand_func(module.pads["summed"]),
+                   "numpy")
+    u, w = leggauss(8)
+    at = np.array([0, np.pi / 2])[:, None]
+    sampled = np.real(pad(*x, np.arccos(u), at, 0.3))  # shape: (phi, u)
+    betas = [(2 * n + 1) / 2 * (sampled * w * legval(u, np.eye(n + 1)[n])).sum(-1) for n in range(5)]
+
+    y = module.ymat_lambdified(*x)[:, 0]
+    keys = module.YKeys
+    for n in (0, 2, 4):
+        np.testing.assert_allclose(betas[n], y[keys["B{}".format(n)]], rtol=1e-10, atol=1e-14)
+    for n in (1, 3):
+        cos_, sin_ = betas[n]
+        np.testing.assert_allclose(np.hypot(cos_, sin_), abs(y[keys["B{}_AMP".format(n)]]), rtol=1e-10)
+        shift = np.arctan2(sin_, cos_) - y[keys["B{}_SHIFT".format(n)]]
+        if y[keys["B{}_AMP".format(n)]] < 0:
+            shift += np.pi
+        np.testing.assert_allclose((shift + np.pi) % (2 * np.pi) - np.pi, 0, atol=1e-10)